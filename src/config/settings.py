@@ -53,18 +53,20 @@ INSTALLED_APPS = [
     "spire",
     "corsheaders",
     "django.contrib.contenttypes",
+    "django.contrib.postgres",
     "django.contrib.staticfiles",
 ]
 
 MIDDLEWARE = [
-    "django.middleware.cache.UpdateCacheMiddleware",
+    "spire.middleware.GenerationUpdateCacheMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
-    "django.middleware.cache.FetchFromCacheMiddleware",
+    "spire.middleware.GenerationFetchFromCacheMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -119,6 +121,9 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "..", "static")
 
+# Per-term data snapshots, served by nginx from the static root
+SNAPSHOT_ROOT = os.path.join(STATIC_ROOT, "snapshots")
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
@@ -129,7 +134,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 CORS_ALLOW_ALL_ORIGINS = True
 
 REST_FRAMEWORK = {
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "spire.pagination.EstimatedPageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_AUTHENTICATION_CLASSES": [],
     "DEFAULT_PERMISSION_CLASSES": [],
@@ -137,6 +142,21 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_CLASSES": ["spire.throttles.BlindRateThrottle"],
 }
 
+# The most objects a single ?ids= request may fetch
+MULTI_GET_MAX_IDS = 100
+
+# The most sections a schedule may be checked for conflicts with at once
+SCHEDULE_MAX_SECTIONS = 500
+
+# The most courses, and schedules of them, that may be generated at once, and
+# how long the search may take
+SCHEDULE_GENERATE_MAX_COURSES = 10
+SCHEDULE_GENERATE_MAX_RESULTS = 100
+SCHEDULE_GENERATE_SECONDS = float(os.environ.get("SCHEDULE_GENERATE_SECONDS", 1))
+
+# The time zone meeting times are in, for calendars
+CALENDAR_TIME_ZONE = "America/New_York"
+
 # spire.scraper
 
 SCRAPER = {
@@ -216,17 +236,49 @@ LOGGING = {
 
 MINUTE = 60
 HOUR = MINUTE * 60
+DAY = HOUR * 24
 
+# Cached responses are keyed by the data generation, which the scraper bumps
+# whenever it writes, so they only need to expire to free up space.
 CACHE_MIDDLEWARE_ALIAS = "default"
 CACHE_MIDDLEWARE_KEY_PREFIX = "spireapi"
 CACHE_MIDDLEWARE_SECONDS = (
-    MINUTE if DEBUG else int(os.environ.get("CACHE_MIDDLEWARE_SECONDS", 3 * HOUR))
+    MINUTE if DEBUG else int(os.environ.get("CACHE_MIDDLEWARE_SECONDS", 7 * DAY))
 )
 
+# How long clients may keep a response before asking again
+CACHE_CLIENT_SECONDS = int(os.environ.get("CACHE_CLIENT_SECONDS", MINUTE))
+
+# How long a worker trusts its last read of the data generation
+DATA_GENERATION_POLL_SECONDS = int(os.environ.get("DATA_GENERATION_POLL_SECONDS", 5))
+
+# Change events older than this are compacted to one per object, which is also
+# the furthest back /changes/ may be asked for. Mirrors that fall further
+# behind need to start over.
+CHANGE_EVENT_RETENTION_DAYS = int(os.environ.get("CHANGE_EVENT_RETENTION_DAYS", 30))
+
+# The longest a scrape transaction may run. Rows are stamped when written but
+# only seen once committed, so /changes/ stops this far short of now to not
+# skip over rows of transactions still open.
+CHANGES_SETTLE_SECONDS = int(os.environ.get("CHANGES_SETTLE_SECONDS", MINUTE))
+
+REDIS_URL = os.environ.get("REDIS_URL", "redis://127.0.0.1:6379")
+
+# Availability changes are fanned out through a Redis stream, as the scraper
+# publishes from its own process. Events are disabled when None.
+AVAILABILITY_STREAM_URL = os.environ.get("AVAILABILITY_STREAM_URL")
+
+# Rate limits are shared between workers through Redis, or kept per process
+# when None
+THROTTLE_REDIS_URL = None
+
 if not DEBUG:
     CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.redis.RedisCache",
-            "LOCATION": os.environ.get("REDIS_URL", "redis://127.0.0.1:6379"),
+            "LOCATION": REDIS_URL,
         }
     }
+
+    AVAILABILITY_STREAM_URL = REDIS_URL
+    THROTTLE_REDIS_URL = REDIS_URL
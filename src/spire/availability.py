@@ -0,0 +1,108 @@
+import json
+import logging
+from functools import cache
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+
+from spire.models import SectionAvailability
+
+log = logging.getLogger(__name__)
+
+# Seats of combined sections are shared, so their combined capacity is
+# included alongside.
+AVAILABILITY_FIELDS = [
+    ("section", "section_id"),
+    ("status", "section__details__status"),
+    ("capacity", "capacity"),
+    ("enrollment_total", "enrollment_total"),
+    ("available_seats", "available_seats"),
+    ("wait_list_capacity", "wait_list_capacity"),
+    ("wait_list_total", "wait_list_total"),
+    ("combined_capacity", "combined_capacity_id"),
+    ("combined_capacity_capacity", "combined_capacity__capacity"),
+    (
+        "combined_capacity_wait_list_capacity",
+        "combined_capacity__wait_list_capacity",
+    ),
+]
+
+AVAILABILITY_FIELD_NAMES = [name for name, _ in AVAILABILITY_FIELDS]
+
+STREAM_KEY = "spireapi.availability"
+STREAM_MAX_LENGTH = 10_000
+
+
+def get_availability_rows(
+    queryset: QuerySet[SectionAvailability], *extra: str
+) -> QuerySet:
+    return queryset.values_list(*extra, *(lookup for _, lookup in AVAILABILITY_FIELDS))
+
+
+def get_availability(section_id: int) -> Optional[dict[str, Any]]:
+    row = get_availability_rows(
+        SectionAvailability.objects.filter(section_id=section_id),
+        "section__offering__term_id",
+    ).first()
+
+    if row is None:
+        return None
+
+    term, *values = row
+    return {"term": term, **dict(zip(AVAILABILITY_FIELD_NAMES, values))}
+
+
+@cache
+def _redis() -> Redis:
+    return Redis.from_url(settings.AVAILABILITY_STREAM_URL)
+
+
+def publish_availability(event: dict[str, Any]):
+    # The scraper runs apart from the web workers, so without Redis there is
+    # no one to hand events to
+    if settings.AVAILABILITY_STREAM_URL is None:
+        return
+
+    try:
+        _redis().xadd(
+            STREAM_KEY,
+            {"data": json.dumps(event)},
+            maxlen=STREAM_MAX_LENGTH,
+            approximate=True,
+        )
+    except RedisError:
+        # Listeners missing an event is better than the scrape failing
+        log.exception(
+            "Failed to publish availability for section %s.", event["section"]
+        )
+
+
+class AvailabilityStream:
+    def __init__(self) -> None:
+        self.last_id = "0-0"
+        self.redis = AsyncRedis.from_url(settings.AVAILABILITY_STREAM_URL)
+
+    async def latest_id(self) -> str:
+        latest = await self.redis.xrevrange(STREAM_KEY, count=1)
+        return latest[0][0].decode() if latest else "0-0"
+
+    async def read(self, timeout: float) -> list[tuple[str, dict[str, Any]]]:
+        response = await self.redis.xread(
+            {STREAM_KEY: self.last_id}, block=int(timeout * 1000), count=100
+        )
+        events = [
+            (id.decode(), json.loads(fields[b"data"]))
+            for _, entries in response
+            for id, fields in entries
+        ]
+
+        if events:
+            self.last_id = events[-1][0]
+
+        return events
+
+    async def close(self):
+        await self.redis.aclose()
@@ -0,0 +1,344 @@
+import re
+from calendar import monthrange
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from spire.generation import get_data_generation
+from spire.models import Section, SectionMeetingInformation, TermEvent
+from spire.schedules import DAYS
+
+CALENDAR_PRODUCT_ID = "-//spire-api.melanson.dev//Section Calendar//EN"
+CALENDAR_UID_DOMAIN = "spire-api.melanson.dev"
+CALENDAR_CACHE_PREFIX = "spireapi.calendar"
+
+# How the academic calendar words days without classes, recesses, and days
+# following another day's schedule
+HOLIDAY_REGEXP = r"holiday|no classes"
+RECESS_START_REGEXP = r"recess begins"
+RECESS_END_REGEXP = r"classes resume"
+SUBSTITUTION_REGEXP = (
+    r"(?P<day>Monday|Tuesday|Wednesday|Thursday|Friday) (class )?schedule"
+)
+
+ICAL_DAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
+class TermCalendar:
+    def __init__(self, events: Iterable[TermEvent]) -> None:
+        self.excluded: set[date] = set()
+        # Dates on which the classes of another weekday meet instead
+        self.substitutions: dict[date, int] = {}
+
+        recess_start: Optional[date] = None
+
+        for event in sorted(events, key=lambda e: e.date):
+            description = event.description
+
+            if re.search(HOLIDAY_REGEXP, description, re.I):
+                self.excluded.add(event.date)
+            elif m := re.search(SUBSTITUTION_REGEXP, description, re.I):
+                self.substitutions[event.date] = DAYS.index(m.group("day").title())
+            elif re.search(RECESS_START_REGEXP, description, re.I):
+                recess_start = event.date
+            elif recess_start and re.search(RECESS_END_REGEXP, description, re.I):
+                # Recesses begin after that day's classes
+                day = recess_start + timedelta(days=1)
+                while day < event.date:
+                    self.excluded.add(day)
+                    day += timedelta(days=1)
+
+                recess_start = None
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    # Lines are limited to 75 octets, continued on lines starting with a space
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+
+    parts = []
+    while encoded:
+        size = 75 if not parts else 74
+        # Don't split a multibyte character
+        while size < len(encoded) and (encoded[size] & 0xC0) == 0x80:
+            size -= 1
+
+        parts.append(encoded[:size].decode())
+        encoded = encoded[size:]
+
+    return "\r\n ".join(parts)
+
+
+def _lines(*lines: str) -> str:
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+def _local(d: date, t: time) -> str:
+    return datetime.combine(d, t).strftime("%Y%m%dT%H%M%S")
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _offset(value: timedelta) -> str:
+    minutes = int(value.total_seconds()) // 60
+    return f"{'-' if minutes < 0 else '+'}{abs(minutes) // 60:02}{abs(minutes) % 60:02}"
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+@lru_cache
+def _vtimezone(name: str, year: int) -> str:
+    # Clients only know the zone by what's described here, so its changes of
+    # offset in the given year are written out as yearly rules, like "the second
+    # Sunday in March", which hold for the years around it.
+    zone = ZoneInfo(name)
+    instant = datetime(year, 1, 1, tzinfo=timezone.utc)
+    before = instant.astimezone(zone)
+
+    components = []
+    for _ in range(366 * 24):
+        instant += timedelta(hours=1)
+        after = instant.astimezone(zone)
+
+        if after.utcoffset() != before.utcoffset():
+            # Changes are given in the wall clock time of the offset they leave
+            wall = instant.astimezone(timezone(before.utcoffset())).replace(tzinfo=None)
+            n = (
+                -1
+                if wall.day + 7 > monthrange(wall.year, wall.month)[1]
+                else (wall.day + 6) // 7
+            )
+            first = datetime.combine(
+                _nth_weekday(1970, wall.month, wall.weekday(), n), wall.time()
+            )
+
+            kind = "DAYLIGHT" if after.dst() else "STANDARD"
+            components += [
+                f"BEGIN:{kind}",
+                f"TZOFFSETFROM:{_offset(before.utcoffset())}",
+                f"TZOFFSETTO:{_offset(after.utcoffset())}",
+                f"TZNAME:{after.tzname()}",
+                f"DTSTART:{first:%Y%m%dT%H%M%S}",
+                f"RRULE:FREQ=YEARLY;BYMONTH={wall.month};BYDAY={n}{ICAL_DAYS[wall.weekday()]}",
+                f"END:{kind}",
+            ]
+
+        before = after
+
+    if not components:
+        components = [
+            "BEGIN:STANDARD",
+            f"TZOFFSETFROM:{_offset(before.utcoffset())}",
+            f"TZOFFSETTO:{_offset(before.utcoffset())}",
+            f"TZNAME:{before.tzname()}",
+            "DTSTART:19700101T000000",
+            "END:STANDARD",
+        ]
+
+    return _lines("BEGIN:VTIMEZONE", f"TZID:{name}", *components, "END:VTIMEZONE")
+
+
+def _merge_ranges(ranges: Iterable[tuple[date, date]]) -> list[tuple[date, date]]:
+    merged: list[tuple[date, date]] = []
+
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _render_range(
+    uid: str,
+    details: list[str],
+    schedule,
+    start: date,
+    end: date,
+    term_calendar: TermCalendar,
+) -> str:
+    weekdays = {DAYS.index(day) for day in schedule.days}
+    dates = [
+        start + timedelta(days=i)
+        for i in range((end - start).days + 1)
+        if (start + timedelta(days=i)).weekday() in weekdays
+    ]
+    if not dates:
+        return ""
+
+    tz = settings.CALENDAR_TIME_ZONE
+    until = datetime.combine(end, time.max, tzinfo=ZoneInfo(tz))
+
+    excluded = [
+        d
+        for d in dates
+        if d in term_calendar.excluded or d in term_calendar.substitutions
+    ]
+    substituted = [
+        d
+        for d, weekday in term_calendar.substitutions.items()
+        if start <= d <= end and weekday in weekdays and d not in term_calendar.excluded
+    ]
+
+    events = _lines(
+        "BEGIN:VEVENT",
+        f"UID:{uid}@{CALENDAR_UID_DOMAIN}",
+        *details,
+        f"DTSTART;TZID={tz}:{_local(dates[0], schedule.start_time)}",
+        f"DTEND;TZID={tz}:{_local(dates[0], schedule.end_time)}",
+        f"RRULE:FREQ=WEEKLY;BYDAY={','.join(ICAL_DAYS[d] for d in sorted(weekdays))};UNTIL={_utc(until)}",
+        *(
+            [
+                f"EXDATE;TZID={tz}:{','.join(_local(d, schedule.start_time) for d in excluded)}"
+            ]
+            if excluded
+            else []
+        ),
+        "END:VEVENT",
+    )
+
+    # Many clients ignore RDATE, so make-up days are events of their own
+    for d in substituted:
+        events += _lines(
+            "BEGIN:VEVENT",
+            f"UID:{uid}-{d:%Y%m%d}@{CALENDAR_UID_DOMAIN}",
+            *details,
+            f"DTSTART;TZID={tz}:{_local(d, schedule.start_time)}",
+            f"DTEND;TZID={tz}:{_local(d, schedule.end_time)}",
+            "END:VEVENT",
+        )
+
+    return events
+
+
+def _render_meeting(
+    section: Section,
+    index: int,
+    meeting: SectionMeetingInformation,
+    term_calendar: TermCalendar,
+) -> str:
+    schedule = getattr(meeting, "schedule", None)
+    if schedule is None:
+        return ""
+
+    # A meeting may only run for some weeks of the term, or for a few separate
+    # stretches of it, each of which repeats on its own
+    ranges = [(d.start, d.end) for d in meeting.meeting_dates.all()] or [
+        (section.offering.term.start_date, section.offering.term.end_date)
+    ]
+    if any(start is None or end is None for start, end in ranges):
+        return ""
+
+    uid = f"section-{section.id}-{index}"
+    details = [
+        f"DTSTAMP:{_utc(section._updated_at)}",
+        f"SUMMARY:{_escape(f'{section.offering.course_id} {section.spire_id}')}",
+        f"LOCATION:{_escape(meeting.room_raw)}",
+        f"DESCRIPTION:{_escape(', '.join(i.name for i in meeting.instructors.all()))}",
+    ]
+
+    return "".join(
+        _render_range(
+            uid if n == 0 else f"{uid}-{start:%Y%m%d}",
+            details,
+            schedule,
+            start,
+            end,
+            term_calendar,
+        )
+        for n, (start, end) in enumerate(_merge_ranges(ranges))
+    )
+
+
+def render_section_events(sections: Iterable[Section]) -> dict[int, str]:
+    term_calendars: dict[str, TermCalendar] = {}
+    events = {}
+
+    for section in sections:
+        term = section.offering.term
+        if term.id not in term_calendars:
+            term_calendars[term.id] = TermCalendar(term.events.all())
+
+        events[section.id] = "".join(
+            _render_meeting(section, i, meeting, term_calendars[term.id])
+            for i, meeting in enumerate(section.meeting_information.all())
+        )
+
+    return events
+
+
+def get_section_events(section_ids: list[int]) -> dict[int, str]:
+    # Rendered events are cached per section until the next scrape, so popular
+    # sections are only rendered once however they're combined.
+    generation = get_data_generation()
+    keys = {id: f"{CALENDAR_CACHE_PREFIX}.{generation}.{id}" for id in section_ids}
+
+    cached = cache.get_many(keys.values())
+    events = {id: cached[key] for id, key in keys.items() if key in cached}
+
+    missing = [id for id in section_ids if id not in events]
+    if missing:
+        rendered = render_section_events(
+            Section.objects.filter(id__in=missing)
+            .select_related("offering__term")
+            .prefetch_related(
+                "offering__term__events",
+                Prefetch(
+                    "meeting_information",
+                    queryset=SectionMeetingInformation.objects.select_related(
+                        "schedule"
+                    )
+                    .prefetch_related("meeting_dates", "instructors")
+                    .order_by("id"),
+                ),
+            )
+        )
+
+        cache.set_many(
+            {keys[id]: value for id, value in rendered.items()},
+            settings.CACHE_MIDDLEWARE_SECONDS,
+        )
+        events.update(rendered)
+
+    return events
+
+
+def render_calendar(events: Iterable[str], name: str) -> str:
+    return (
+        _lines(
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{CALENDAR_PRODUCT_ID}",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{_escape(name)}",
+            f"X-WR-TIMEZONE:{settings.CALENDAR_TIME_ZONE}",
+        )
+        + _vtimezone(settings.CALENDAR_TIME_ZONE, date.today().year)
+        + "".join(events)
+        + _lines("END:VCALENDAR")
+    )
@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from django.core import signing
+from django.db.models import QuerySet
+
+from spire.documents import get_section_documents
+from spire.models import ChangeEvent, Course, CourseOffering, Section
+from spire.query_plans import COURSE_OFFERING_QUERY_PLAN, COURSE_QUERY_PLAN
+from spire.serializers.course import CourseOfferingSerializer, CourseSerializer
+
+CHANGES_PAGE_SIZE = 100
+
+TOKEN_SALT = "spire.changes"
+
+
+def get_deleted_objects(queryset: QuerySet) -> list[tuple[str, Any]]:
+    # Deleting an offering cascades to its sections, which need to be recorded
+    # too for mirrors to drop them.
+    deleted = []
+
+    if queryset.model is CourseOffering:
+        deleted += [
+            ("section", id)
+            for id in Section.objects.filter(offering__in=queryset).values_list(
+                "id", flat=True
+            )
+        ]
+
+    kind = next(k for k, m in CHANGE_KIND_MODELS.items() if m is queryset.model)
+    deleted += [(kind, id) for id in queryset.values_list("pk", flat=True)]
+
+    return deleted
+
+
+# Changes are listed kind by kind, each in id order, followed by deletions,
+# which are read from the change events the scraper records
+CHANGE_KINDS = [
+    (
+        "course",
+        lambda: COURSE_QUERY_PLAN.apply(Course.objects.all()),
+        lambda objects, request: CourseSerializer(
+            objects, many=True, context={"request": request}
+        ).data,
+    ),
+    (
+        "offering",
+        lambda: COURSE_OFFERING_QUERY_PLAN.apply(CourseOffering.objects.all()),
+        lambda objects, request: CourseOfferingSerializer(
+            objects, many=True, context={"request": request}
+        ).data,
+    ),
+    (
+        "section",
+        lambda: Section.objects.only("id"),
+        lambda objects, request: get_section_documents(
+            [s.id for s in objects], request
+        ),
+    ),
+]
+
+CHANGE_KIND_MODELS = {
+    "course": Course,
+    "offering": CourseOffering,
+    "section": Section,
+}
+
+
+def encode_token(since: datetime, until: datetime, phase: int, after: Any) -> str:
+    return signing.dumps(
+        [since.isoformat(), until.isoformat(), phase, after], salt=TOKEN_SALT
+    )
+
+
+def decode_token(token: str) -> Optional[tuple[datetime, datetime, int, Any]]:
+    try:
+        since, until, phase, after = signing.loads(token, salt=TOKEN_SALT)
+    except (signing.BadSignature, ValueError):
+        return None
+
+    return datetime.fromisoformat(since), datetime.fromisoformat(until), phase, after
+
+
+def get_changes(
+    request, since: datetime, until: datetime, phase: int = 0, after: Any = None
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    results = []
+
+    while phase <= len(CHANGE_KINDS) and len(results) < CHANGES_PAGE_SIZE:
+        limit = CHANGES_PAGE_SIZE - len(results)
+
+        if phase < len(CHANGE_KINDS):
+            kind, get_queryset, render = CHANGE_KINDS[phase]
+
+            queryset = get_queryset().filter(
+                _updated_at__gt=since, _updated_at__lte=until
+            )
+            if after is not None:
+                queryset = queryset.filter(pk__gt=after)
+
+            objects = list(queryset.order_by("pk")[:limit])
+            results += [
+                {"kind": kind, "id": obj.pk, "deleted": False, "data": data}
+                for obj, data in zip(objects, render(objects, request))
+            ]
+            last = objects[-1].pk if objects else None
+        else:
+            queryset = ChangeEvent.objects.filter(
+                action=ChangeEvent.DELETED, created_at__gt=since, created_at__lte=until
+            )
+            if after is not None:
+                queryset = queryset.filter(id__gt=after)
+
+            objects = list(queryset.order_by("id")[:limit])
+            results += [
+                {
+                    "kind": e.kind,
+                    "id": CHANGE_KIND_MODELS[e.kind]._meta.pk.to_python(e.object_id),
+                    "deleted": True,
+                }
+                for e in objects
+            ]
+            last = objects[-1].id if objects else None
+
+        if len(objects) == limit:
+            return results, encode_token(since, until, phase, last)
+
+        phase += 1
+        after = None
+
+    return results, None
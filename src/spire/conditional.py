@@ -0,0 +1,95 @@
+from hashlib import md5
+from typing import Callable, Iterable, Optional
+
+from django.db.models import QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from spire.generation import get_data_generation
+
+
+def get_validators(objects: Iterable) -> tuple[str, Optional[float]]:
+    # Nested relations don't have their own timestamps, so the data generation
+    # is part of the ETag to catch changes that never touch _updated_at.
+    ctx = md5(str(get_data_generation()).encode(), usedforsecurity=False)
+    last_modified = None
+
+    for obj in objects:
+        ctx.update(f"{obj.pk}@{obj._updated_at.isoformat()};".encode())
+
+        if last_modified is None or last_modified < obj._updated_at:
+            last_modified = obj._updated_at
+
+    return (
+        "W/" + quote_etag(ctx.hexdigest()),
+        last_modified.timestamp() if last_modified else None,
+    )
+
+
+def conditional_response(request, objects: Iterable, render: Callable):
+    etag, last_modified = get_validators(objects)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = render()
+
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+
+    return response
+
+
+# Validators are read off a bare queryset, so a 304 skips the query plan. The
+# full objects are only loaded when there's a response to render.
+def get_validator_queryset(queryset: QuerySet) -> QuerySet:
+    return (
+        queryset.select_related(None).prefetch_related(None).only("pk", "_updated_at")
+    )
+
+
+def get_full_objects(queryset: QuerySet, objects: list) -> list:
+    found = queryset.in_bulk([obj.pk for obj in objects])
+    return [found[obj.pk] for obj in objects if obj.pk in found]
+
+
+class ConditionalMixin:
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(get_validator_queryset(queryset))
+        if page is not None:
+            return conditional_response(
+                request,
+                page,
+                lambda: self.get_paginated_response(
+                    self.get_serializer(
+                        get_full_objects(queryset, page), many=True
+                    ).data
+                ),
+            )
+
+        objects = list(get_validator_queryset(queryset))
+        return conditional_response(
+            request,
+            objects,
+            lambda: Response(
+                self.get_serializer(get_full_objects(queryset, objects), many=True).data
+            ),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(
+            get_validator_queryset(self.filter_queryset(self.get_queryset())),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        self.check_object_permissions(request, instance)
+
+        return conditional_response(
+            request,
+            [instance],
+            lambda: Response(self.get_serializer(self.get_object()).data),
+        )
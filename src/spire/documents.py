@@ -0,0 +1,173 @@
+import logging
+from functools import cache
+from typing import Any, Iterable, Iterator
+
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from spire.models import Section, SectionAvailability, SectionDocument
+from spire.query_plans import SECTION_QUERY_PLAN
+from spire.serializers.section import SectionSerializer
+from spire.serializers.sparse import SparseFieldset, get_nested_paths
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+
+def render_section_document(section: Section) -> dict[str, Any]:
+    # Without a request, hyperlinks are rendered relative to the site root
+    return SectionSerializer(section, context={"request": None}).data
+
+
+def build_section_documents(queryset: QuerySet[Section]) -> int:
+    now = timezone.now()
+    built = 0
+
+    batch: list[SectionDocument] = []
+    queryset = SECTION_QUERY_PLAN.apply(queryset.order_by("id"))
+
+    for section in queryset.iterator(chunk_size=BATCH_SIZE):
+        batch.append(
+            SectionDocument(
+                section=section,
+                document=render_section_document(section),
+                _updated_at=now,
+            )
+        )
+
+        if len(batch) == BATCH_SIZE:
+            built += _push_section_documents(batch)
+            batch = []
+
+    if batch:
+        built += _push_section_documents(batch)
+
+    log.debug("Built %s section documents.", built)
+    return built
+
+
+def _push_section_documents(batch: list[SectionDocument]) -> int:
+    return len(
+        SectionDocument.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["section"],
+            update_fields=["document", "_updated_at"],
+        )
+    )
+
+
+def build_pushed_section_documents(section: Section) -> int:
+    # Rebuilt as a section is pushed, in the same transaction, so a document is
+    # never older than the rows it describes. Sections sharing its combined
+    # capacity embed its availability, so they're rebuilt along with it.
+    combined_capacity = SectionAvailability.objects.filter(
+        section=section, combined_capacity__isnull=False
+    ).values("combined_capacity")
+
+    return build_section_documents(
+        Section.objects.filter(
+            Q(id=section.id) | Q(availability__combined_capacity__in=combined_capacity)
+        ).distinct()
+    )
+
+
+def build_subject_section_documents(term, subject) -> int:
+    subject_sections = Q(offering__term=term, offering__subject=subject)
+
+    # Combined sections embed each other's availability, and may be listed under
+    # another subject, so they are rebuilt alongside.
+    combined_capacities = SectionAvailability.objects.filter(
+        section__offering__term=term,
+        section__offering__subject=subject,
+        combined_capacity__isnull=False,
+    ).values("combined_capacity")
+
+    return build_section_documents(
+        Section.objects.filter(
+            subject_sections
+            | Q(availability__combined_capacity__in=combined_capacities)
+        ).distinct()
+    )
+
+
+def _absolutize_urls(value: Any, request) -> Any:
+    # Without a request, such as in snapshots, URLs stay relative
+    if request is None:
+        return value
+
+    if isinstance(value, dict):
+        return {
+            k: (
+                request.build_absolute_uri(v)
+                if k == "url" and isinstance(v, str)
+                else _absolutize_urls(v, request)
+            )
+            for k, v in value.items()
+        }
+
+    if isinstance(value, list):
+        return [_absolutize_urls(x, request) for x in value]
+
+    return value
+
+
+@cache
+def _section_nested_paths() -> set[str]:
+    return get_nested_paths(SectionSerializer())
+
+
+def get_section_documents(section_ids: Iterable[int], request) -> list[dict[str, Any]]:
+    section_ids = list(section_ids)
+    sparse = SparseFieldset.from_request(request)
+
+    documents = dict(
+        SectionDocument.objects.filter(section_id__in=section_ids).values_list(
+            "section_id", "document"
+        )
+    )
+
+    missing_ids = [id for id in section_ids if id not in documents]
+    if missing_ids:
+        log.debug("Serializing %s sections without documents.", len(missing_ids))
+
+        for section in SECTION_QUERY_PLAN.apply(
+            Section.objects.filter(id__in=missing_ids)
+        ):
+            documents[section.id] = render_section_document(section)
+
+    if sparse is not None:
+        nested_paths = _section_nested_paths()
+        documents = {
+            id: sparse.prune(document, nested_paths)
+            for id, document in documents.items()
+        }
+
+    return [
+        _absolutize_urls(documents[id], request)
+        for id in section_ids
+        if id in documents
+    ]
+
+
+def iter_section_documents(
+    queryset: QuerySet[Section], request
+) -> Iterator[dict[str, Any]]:
+    # Ids are read through a server-side cursor and resolved a batch at a time,
+    # so memory stays flat however many sections there are.
+    batch = []
+
+    for id in (
+        queryset.order_by("id")
+        .values_list("id", flat=True)
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        batch.append(id)
+
+        if len(batch) == BATCH_SIZE:
+            yield from get_section_documents(batch, request)
+            batch = []
+
+    if batch:
+        yield from get_section_documents(batch, request)
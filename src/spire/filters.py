@@ -0,0 +1,149 @@
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Upper
+from django_filters import (
+    BooleanFilter,
+    CharFilter,
+    ChoiceFilter,
+    FilterSet,
+    MultipleChoiceFilter,
+    NumberFilter,
+    TimeFilter,
+)
+from django_filters.constants import EMPTY_VALUES
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from spire.models import Section, SectionMeetingInformation
+from spire.schedules import DAYS
+from spire.search import search
+
+SECTION_STATUSES = ("Open", "Closed", "Wait List")
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+
+        return search(queryset, text)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "A full-text search, ranked by relevance.",
+                "schema": {"type": "string"},
+            },
+        ]
+
+
+class TrigramSearchFilter(BaseFilterBackend):
+    # Both substring and fuzzy matches compare against UPPER(field), the
+    # expression covered by the trigram index.
+    search_param = api_settings.SEARCH_PARAM
+    fuzzy_param = "fuzzy"
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+
+        field = view.trigram_search_field
+        if request.query_params.get(self.fuzzy_param, "").lower() not in ("1", "true"):
+            return queryset.filter(**{f"{field}__icontains": text})
+
+        return (
+            queryset.alias(search_field=Upper(field))
+            .filter(search_field__trigram_word_similar=text.upper())
+            .annotate(similarity=TrigramWordSimilarity(text.upper(), "search_field"))
+            .order_by("-similarity", "pk")
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "A case-insensitive substring search.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.fuzzy_param,
+                "required": False,
+                "in": "query",
+                "description": "Match the search by trigram similarity instead, ranked by similarity.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+
+class SectionFilterSet(FilterSet):
+    term = CharFilter(field_name="offering__term")
+    subject = CharFilter(field_name="offering__subject")
+    course = CharFilter(field_name="offering__course")
+    status = MultipleChoiceFilter(
+        field_name="details__status", choices=[(s, s) for s in SECTION_STATUSES]
+    )
+    class_component = CharFilter(
+        field_name="details__class_components__contains", method="filter_contains"
+    )
+    gened = CharFilter(field_name="details__gened__contains", method="filter_contains")
+    open = BooleanFilter(method="filter_open")
+
+    # Meeting filters all have to match the same meeting, so they're gathered
+    # into one subquery by filter_queryset, which also keeps sections with
+    # several matching meetings from being repeated.
+    instructor = NumberFilter(field_name="instructors", method="filter_meeting")
+    building = NumberFilter(field_name="room__building", method="filter_meeting")
+    day = ChoiceFilter(
+        field_name="schedule__days__contains",
+        choices=[(d, d) for d in DAYS],
+        method="filter_meeting",
+    )
+    starts_after = TimeFilter(
+        field_name="schedule__start_time__gte", method="filter_meeting"
+    )
+    ends_before = TimeFilter(
+        field_name="schedule__end_time__lte", method="filter_meeting"
+    )
+
+    class Meta:
+        model = Section
+        fields = []
+
+    def filter_contains(self, queryset, name, value):
+        return queryset.filter(**{name: [value]})
+
+    def filter_open(self, queryset, name, value):
+        if value:
+            return queryset.filter(availability__available_seats__gt=0)
+
+        return queryset.filter(availability__available_seats=0)
+
+    def filter_meeting(self, queryset, name, value):
+        return queryset
+
+    def filter_queryset(self, queryset):
+        conditions = {
+            f.field_name: [value] if f.field_name.endswith("__contains") else value
+            for name, f in self.filters.items()
+            if f.method == "filter_meeting"
+            and (value := self.form.cleaned_data.get(name)) not in EMPTY_VALUES
+        }
+        if conditions:
+            queryset = queryset.filter(
+                Exists(
+                    SectionMeetingInformation.objects.filter(
+                        section=OuterRef("pk"), **conditions
+                    )
+                )
+            )
+
+        return super().filter_queryset(queryset)
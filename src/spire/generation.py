@@ -0,0 +1,56 @@
+import logging
+from time import monotonic
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from spire.models import DataGeneration
+
+log = logging.getLogger(__name__)
+
+# A single row counts every write the scraper makes visible to the API
+GENERATION_ID = 1
+
+_current = (0, float("-inf"))
+
+
+def get_data_generation() -> int:
+    global _current
+
+    value, fetched_at = _current
+    if monotonic() - fetched_at < settings.DATA_GENERATION_POLL_SECONDS:
+        return value
+
+    value = (
+        DataGeneration.objects.filter(id=GENERATION_ID)
+        .values_list("value", flat=True)
+        .first()
+    ) or 0
+    _current = (value, monotonic())
+
+    return value
+
+
+def get_pending_data_generation() -> int:
+    # The generation the scraper's writes so far will be visible in, read fresh
+    # as it's the one bumping it
+    value = (
+        DataGeneration.objects.filter(id=GENERATION_ID)
+        .values_list("value", flat=True)
+        .first()
+    ) or 0
+
+    return value + 1
+
+
+def bump_data_generation() -> int:
+    DataGeneration.objects.get_or_create(id=GENERATION_ID)
+    DataGeneration.objects.filter(id=GENERATION_ID).update(
+        value=F("value") + 1, updated_at=timezone.now()
+    )
+
+    value = DataGeneration.objects.get(id=GENERATION_ID).value
+    log.info("Bumped data generation to %s.", value)
+
+    return value
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Any
+
+from django.utils import timezone
+
+from spire.models import Section, SectionAvailability, SectionAvailabilityHistory
+
+HISTORY_FIELDS = ["capacity", "enrollment_total", "available_seats", "wait_list_total"]
+
+HISTORY_DEFAULT_POINTS = 200
+HISTORY_MAX_POINTS = 2000
+
+
+def record_availability_history(section: Section, availability: SectionAvailability):
+    last = (
+        SectionAvailabilityHistory.objects.filter(section=section)
+        .order_by("-recorded_at")
+        .values_list(*HISTORY_FIELDS)
+        .first()
+    )
+
+    current = tuple(getattr(availability, f) for f in HISTORY_FIELDS)
+    if last == current:
+        return
+
+    SectionAvailabilityHistory.objects.create(
+        section=section,
+        term_id=section.offering.term_id,
+        recorded_at=timezone.now(),
+        **dict(zip(HISTORY_FIELDS, current)),
+    )
+
+
+def downsample(rows: list[tuple[datetime, Any]], points: int) -> list[tuple]:
+    # Each row holds until the next, so a bucket is represented by the last row
+    # in it, the value the section had when the bucket ended.
+    if len(rows) <= points:
+        return rows
+
+    start = rows[0][0].timestamp()
+    span = rows[-1][0].timestamp() - start
+    if span == 0:
+        return rows[-1:]
+
+    buckets: dict[int, tuple] = {}
+    for row in rows[1:]:
+        bucket = min(
+            int((row[0].timestamp() - start) / span * (points - 1)), points - 2
+        )
+        buckets[bucket] = row
+
+    return [rows[0], *buckets.values()]
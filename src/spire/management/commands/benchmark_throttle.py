@@ -0,0 +1,57 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.request import Request
+from rest_framework.throttling import SimpleRateThrottle
+
+from spire.throttles import BlindRateThrottle
+
+
+# The throttle BlindRateThrottle replaced, which keeps a list of request times
+# per client in the cache
+class HistoryRateThrottle(SimpleRateThrottle):
+    rate = BlindRateThrottle.rate
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": "benchmark",
+            "ident": self.get_ident(request),
+        }
+
+
+class Command(BaseCommand):
+    help = "Times the rate throttle against the history throttle it replaced."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=10_000, help="How many requests to time."
+        )
+        parser.add_argument(
+            "--clients",
+            type=int,
+            default=100,
+            help="How many addresses the requests come from.",
+        )
+
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        requests = [
+            Request(factory.get("/", REMOTE_ADDR=f"10.0.{i // 256 % 256}.{i % 256}"))
+            for i in range(options["clients"])
+        ]
+
+        for throttle_class in (HistoryRateThrottle, BlindRateThrottle):
+            allowed = 0
+
+            start = perf_counter()
+            for i in range(options["requests"]):
+                allowed += throttle_class().allow_request(
+                    requests[i % len(requests)], None
+                )
+            elapsed = perf_counter() - start
+
+            self.stdout.write(
+                f"{throttle_class.__name__}: {options['requests'] / elapsed:.0f} requests/s, "
+                f"{elapsed / options['requests'] * 1e6:.0f}µs each, {allowed} allowed."
+            )
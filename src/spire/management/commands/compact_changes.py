@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from spire.outbox import compact_change_events
+
+
+class Command(BaseCommand):
+    help = "Compacts change events past the retention period, one per object."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.CHANGE_EVENT_RETENTION_DAYS,
+            help="How many days of change events to keep in full.",
+        )
+
+    def handle(self, *args, **options):
+        compacted, deleted = compact_change_events(timedelta(days=options["days"]))
+        self.stdout.write(
+            f"Compacted the change events of {compacted} objects, deleting {deleted}."
+        )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from spire.documents import build_section_documents
+from spire.models import Section
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the pre-rendered section documents."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--term", type=str, nargs=2, help="A specific term of sections to build."
+        )
+
+    def handle(self, *args, **options):
+        queryset = Section.objects.all()
+
+        if options["term"]:
+            season, year = options["term"]
+            queryset = queryset.filter(offering__term_id=f"{season} {year}")
+
+        built = build_section_documents(queryset)
+        self.stdout.write(f"Built {built} section documents.")
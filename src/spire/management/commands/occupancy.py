@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from spire.models import Term
+from spire.occupancy import rebuild_term_occupancy
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the room occupancy of every term."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--term", type=str, nargs=2, help="A specific term of rooms to build."
+        )
+
+    def handle(self, *args, **options):
+        if options["term"]:
+            season, year = options["term"]
+            term_ids = [f"{season} {year}"]
+        else:
+            term_ids = Term.objects.values_list("id", flat=True)
+
+        built = sum(rebuild_term_occupancy(term_id) for term_id in term_ids)
+        self.stdout.write(f"Built the occupancy of {built} rooms.")
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from spire.models import Term
+from spire.snapshots import is_snapshot_stale, write_snapshots
+
+
+class Command(BaseCommand):
+    help = "Writes compressed NDJSON snapshots of each term into the static root."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--term", type=str, nargs=2, help="A specific term to snapshot."
+        )
+
+        parser.add_argument(
+            "--if-stale",
+            action="store_true",
+            help="Only write snapshots if the data has changed since the last run.",
+        )
+
+    def handle(self, *args, **options):
+        if options["if_stale"] and not is_snapshot_stale():
+            self.stdout.write("Snapshots are up to date.")
+            return
+
+        terms = None
+        if options["term"]:
+            season, year = options["term"]
+            terms = [Term.objects.get(id=f"{season} {year}")]
+
+        manifest = write_snapshots(terms)
+        self.stdout.write(
+            f"Snapshots of {len(manifest['terms'])} terms are at generation {manifest['generation']}."
+        )
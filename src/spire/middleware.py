@@ -0,0 +1,63 @@
+from copy import copy
+from time import time
+
+from django.conf import settings
+from django.middleware.cache import FetchFromCacheMiddleware, UpdateCacheMiddleware
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+
+from spire.generation import get_data_generation
+
+
+def _with_generation_prefix(middleware, request):
+    # Cache entries are keyed by the data generation read when the request
+    # arrived, so a scrape invalidates every cached response at once.
+    scoped = copy(middleware)
+    scoped.key_prefix = f"{middleware.key_prefix}.{request._cache_generation}"
+
+    return scoped
+
+
+def _patch_client_cache_headers(response):
+    # Clients can't observe the data generation, so they only get to keep a
+    # response for a short while, regardless of how long it's cached here.
+    max_age = settings.CACHE_CLIENT_SECONDS
+
+    response.headers["Expires"] = http_date(time() + max_age)
+    patch_cache_control(response, max_age=max_age)
+
+    return response
+
+
+class GenerationUpdateCacheMiddleware(UpdateCacheMiddleware):
+    def process_response(self, request, response):
+        if not hasattr(request, "_cache_generation"):
+            return response
+
+        # Responses are rendered by now, and pickling a DRF response's data
+        # would name every hyperlinked object in it, costing a query each
+        data = vars(response).pop("data", None)
+
+        scoped = _with_generation_prefix(self, request)
+        response = UpdateCacheMiddleware.process_response(scoped, request, response)
+
+        if data is not None:
+            response.data = data
+
+        if response.has_header("Expires"):
+            _patch_client_cache_headers(response)
+
+        return response
+
+
+class GenerationFetchFromCacheMiddleware(FetchFromCacheMiddleware):
+    def process_request(self, request):
+        request._cache_generation = get_data_generation()
+
+        scoped = _with_generation_prefix(self, request)
+        response = FetchFromCacheMiddleware.process_request(scoped, request)
+
+        if response is not None:
+            _patch_client_cache_headers(response)
+
+        return response
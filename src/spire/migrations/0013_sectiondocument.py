@@ -0,0 +1,34 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0012_alter_term_ordinal_alter_termevent_unique_together"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SectionDocument",
+            fields=[
+                (
+                    "section",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="document",
+                        serialize=False,
+                        to="spire.section",
+                    ),
+                ),
+                ("document", models.JSONField()),
+                ("_updated_at", models.DateTimeField()),
+            ],
+            options={
+                "ordering": ["section_id"],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0013_sectiondocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataGeneration",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("value", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def populate_search_vectors(apps, schema_editor):
+    Course = apps.get_model("spire", "Course")
+    Section = apps.get_model("spire", "Section")
+    SectionDetail = apps.get_model("spire", "SectionDetail")
+
+    Course.objects.update(
+        search_vector=SearchVector("id", weight="A", config="simple")
+        + SearchVector("title", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english")
+    )
+
+    Section.objects.update(
+        search_vector=SearchVector(
+            Subquery(
+                SectionDetail.objects.filter(section=OuterRef("pk")).values("topic")[:1]
+            ),
+            weight="A",
+            config="english",
+        )
+        + SearchVector("description", weight="B", config="english")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0014_datageneration"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(null=True),
+        ),
+        migrations.AddField(
+            model_name="section",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="spire_cours_search__927342_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="section",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="spire_secti_search__d8f451_gin"
+            ),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
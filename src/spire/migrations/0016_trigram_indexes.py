@@ -0,0 +1,44 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:23
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0015_search_vectors"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="building",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="building_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="buildingroom",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("alt"), name="gin_trgm_ops"
+                ),
+                name="building_room_alt_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="instructor",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="instructor_name_trgm",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:24
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0016_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sectionavailability",
+            index=models.Index(
+                condition=models.Q(("available_seats__gt", 0)),
+                fields=["section"],
+                name="section_availability_open",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sectiondetail",
+            index=models.Index(fields=["status"], name="spire_secti_status_484304_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="sectiondetail",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["class_components"],
+                name="section_detail_components_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sectiondetail",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["gened"],
+                name="section_detail_gened_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sectionmeetingschedule",
+            index=models.Index(
+                fields=["start_time", "end_time"], name="spire_secti_start_t_19f17b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sectionmeetingschedule",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["days"],
+                name="section_schedule_days_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:41
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0017_section_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="courseoffering",
+            name="_updated_at",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="course",
+            name="_updated_at",
+            field=models.DateTimeField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="section",
+            name="_updated_at",
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
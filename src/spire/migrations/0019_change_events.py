@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0018_change_tracking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("kind", models.CharField(max_length=16)),
+                ("object_id", models.CharField(max_length=64)),
+                ("action", models.CharField(max_length=8)),
+                ("changes", models.JSONField()),
+                ("created_at", models.DateTimeField(db_index=True)),
+                ("generation", models.PositiveBigIntegerField()),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "object_id"], name="spire_chang_kind_1fe994_idx"
+                    )
+                ],
+            },
+        ),
+    ]
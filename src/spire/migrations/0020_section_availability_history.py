@@ -0,0 +1,79 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def seed_history(apps, schema_editor):
+    SectionAvailability = apps.get_model("spire", "SectionAvailability")
+    SectionAvailabilityHistory = apps.get_model("spire", "SectionAvailabilityHistory")
+
+    batch = []
+    for a in SectionAvailability.objects.select_related("section__offering").iterator(
+        chunk_size=2000
+    ):
+        batch.append(
+            SectionAvailabilityHistory(
+                section_id=a.section_id,
+                term_id=a.section.offering.term_id,
+                recorded_at=a.section._updated_at,
+                capacity=a.capacity,
+                enrollment_total=a.enrollment_total,
+                available_seats=a.available_seats,
+                wait_list_total=a.wait_list_total,
+            )
+        )
+
+        if len(batch) == 2000:
+            SectionAvailabilityHistory.objects.bulk_create(batch)
+            batch = []
+
+    SectionAvailabilityHistory.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0019_change_events"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SectionAvailabilityHistory",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("recorded_at", models.DateTimeField()),
+                ("capacity", models.PositiveSmallIntegerField()),
+                ("enrollment_total", models.PositiveSmallIntegerField()),
+                ("available_seats", models.PositiveSmallIntegerField()),
+                ("wait_list_total", models.PositiveSmallIntegerField()),
+                (
+                    "section",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="availability_history",
+                        to="spire.section",
+                    ),
+                ),
+                (
+                    "term",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="spire.term",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["section", "recorded_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["section", "recorded_at"],
+                        name="spire_secti_section_3da0cb_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(seed_history, migrations.RunPython.noop),
+    ]
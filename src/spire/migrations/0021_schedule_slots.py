@@ -0,0 +1,49 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:05
+
+from django.db import migrations, models
+
+# As in spire.schedules when this was written, which may change after it
+DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+SLOTS_PER_DAY = 288
+
+
+def get_schedule_slots(days, start_time, end_time) -> bytes:
+    start = (start_time.hour * 60 + start_time.minute) // 5
+    end = -(-(end_time.hour * 60 + end_time.minute) // 5)
+
+    day_slots = ((1 << max(end - start, 0)) - 1) << start
+
+    slots = 0
+    for day in days:
+        slots |= day_slots << (DAYS.index(day) * SLOTS_PER_DAY)
+
+    return slots.to_bytes(252, "little")
+
+
+def compute_slots(apps, schema_editor):
+    SectionMeetingSchedule = apps.get_model("spire", "SectionMeetingSchedule")
+
+    schedules = list(SectionMeetingSchedule.objects.all())
+    for schedule in schedules:
+        schedule.slots = get_schedule_slots(
+            schedule.days, schedule.start_time, schedule.end_time
+        )
+
+    SectionMeetingSchedule.objects.bulk_update(schedules, ["slots"], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0020_section_availability_history"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sectionmeetingschedule",
+            name="slots",
+            field=models.BinaryField(default=b"", max_length=252),
+            preserve_default=False,
+        ),
+        migrations.RunPython(compute_slots, migrations.RunPython.noop),
+    ]
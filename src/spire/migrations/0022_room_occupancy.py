@@ -0,0 +1,78 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+# As in spire.schedules when this was written
+SLOTS_BYTES = 252
+
+
+def build_occupancy(apps, schema_editor):
+    RoomOccupancy = apps.get_model("spire", "RoomOccupancy")
+    SectionMeetingSchedule = apps.get_model("spire", "SectionMeetingSchedule")
+
+    occupancy = {}
+    for room, term, slots in SectionMeetingSchedule.objects.filter(
+        meeting_information__room__isnull=False
+    ).values_list(
+        "meeting_information__room_id",
+        "meeting_information__section__offering__term_id",
+        "slots",
+    ):
+        occupancy[room, term] = occupancy.get((room, term), 0) | int.from_bytes(
+            slots, "little"
+        )
+
+    now = timezone.now()
+    RoomOccupancy.objects.bulk_create(
+        [
+            RoomOccupancy(
+                room_id=room,
+                term_id=term,
+                slots=slots.to_bytes(SLOTS_BYTES, "little"),
+                _updated_at=now,
+            )
+            for (room, term), slots in occupancy.items()
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0021_schedule_slots"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RoomOccupancy",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("slots", models.BinaryField(max_length=252)),
+                ("_updated_at", models.DateTimeField()),
+                (
+                    "room",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="occupancy",
+                        to="spire.buildingroom",
+                    ),
+                ),
+                (
+                    "term",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="spire.term",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["term", "room"],
+                "unique_together": {("term", "room")},
+            },
+        ),
+        migrations.RunPython(build_occupancy, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_term_ordinals(apps, schema_editor):
+    CourseOffering = apps.get_model("spire", "CourseOffering")
+    Term = apps.get_model("spire", "Term")
+
+    CourseOffering.objects.update(
+        term_ordinal=Subquery(
+            Term.objects.filter(id=OuterRef("term_id")).values("ordinal")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0022_room_occupancy"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="buildingroom",
+            options={"ordering": ["building_id", "number"]},
+        ),
+        migrations.AlterModelOptions(
+            name="coursedetail",
+            options={"ordering": ["course_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="courseenrollmentinformation",
+            options={"ordering": ["course_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="courseoffering",
+            options={"ordering": ["-term_ordinal", "course_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="roomoccupancy",
+            options={"ordering": ["term_id", "room_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="section",
+            options={"ordering": ["offering_id", "spire_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectionavailability",
+            options={"ordering": ["section_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectionavailabilityhistory",
+            options={"ordering": ["section_id", "recorded_at"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectioncombinedavailability",
+            options={"ordering": ["individual_availability_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectiondetail",
+            options={"ordering": ["section_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectionmeetinginformation",
+            options={"ordering": ["section_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectionmeetingschedule",
+            options={"ordering": ["meeting_information_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectionrestriction",
+            options={"ordering": ["section_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="subjectsectioncoverage",
+            options={"ordering": ["term_coverage_id", "subject_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="termevent",
+            options={"ordering": ["term_id", "date"]},
+        ),
+        migrations.AddField(
+            model_name="courseoffering",
+            name="term_ordinal",
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_term_ordinals, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="courseoffering",
+            index=models.Index(
+                fields=["-term_ordinal", "course"], name="course_offering_order"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="termevent",
+            index=models.Index(
+                fields=["term", "date"], name="spire_terme_term_id_f41c5a_idx"
+            ),
+        ),
+    ]
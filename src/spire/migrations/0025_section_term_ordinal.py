@@ -0,0 +1,55 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:55
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_term_ordinals(apps, schema_editor):
+    CourseOffering = apps.get_model("spire", "CourseOffering")
+    Section = apps.get_model("spire", "Section")
+
+    Section.objects.update(
+        term_ordinal=Subquery(
+            CourseOffering.objects.filter(id=OuterRef("offering_id")).values(
+                "term_ordinal"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0023_local_orderings"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="section",
+            options={"ordering": ["-term_ordinal", "offering_id", "spire_id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sectionmeetingschedule",
+            options={"ordering": ["meeting_information_id", "start_time"]},
+        ),
+        migrations.AddField(
+            model_name="section",
+            name="term_ordinal",
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_term_ordinals, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="section",
+            index=models.Index(
+                fields=["-term_ordinal", "offering", "spire_id"], name="section_order"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sectionmeetingschedule",
+            index=models.Index(
+                fields=["meeting_information", "start_time"],
+                name="spire_secti_meeting_086141_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:20
+
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def update_course_search_vectors(apps, schema_editor):
+    Course = apps.get_model("spire", "Course")
+
+    Course.objects.update(
+        search_vector=SearchVector("id", weight="A", config="english")
+        + SearchVector("title", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("spire", "0025_section_term_ordinal"),
+    ]
+
+    operations = [
+        migrations.RunPython(update_course_search_vectors, migrations.RunPython.noop),
+    ]
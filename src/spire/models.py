@@ -1,8 +1,12 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator
 from django.db.models import (
     CASCADE,
     SET_NULL,
     AutoField,
+    BigAutoField,
+    BinaryField,
     BooleanField,
     CharField,
     DateField,
@@ -10,14 +14,19 @@ from django.db.models import (
     EmailField,
     FloatField,
     ForeignKey,
+    Index,
     IntegerField,
     JSONField,
     ManyToManyField,
     Model,
     OneToOneField,
+    PositiveBigIntegerField,
+    PositiveSmallIntegerField,
+    Q,
     TimeField,
 )
 from django.db.models.fields import PositiveIntegerField
+from django.db.models.functions import Upper
 
 from spire.patterns import (
     COURSE_ID_NUM_REGEXP,
@@ -79,6 +88,11 @@ class Building(Model):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="building_name_trgm"
+            )
+        ]
 
 
 class BuildingRoom(Model):
@@ -91,8 +105,14 @@ class BuildingRoom(Model):
         return f"BuildingRoom[{self.id}](building={self.building}, number={self.number}, alt={self.alt})"
 
     class Meta:
-        ordering = ["building", "number"]
+        ordering = ["building_id", "number"]
         unique_together = [["building", "number"]]
+        indexes = [
+            GinIndex(
+                OpClass(Upper("alt"), name="gin_trgm_ops"),
+                name="building_room_alt_trgm",
+            )
+        ]
 
 
 class Term(Model):
@@ -120,8 +140,9 @@ class TermEvent(Model):
         return f"TermEvent[None](term={self.term}, date={self.date})"
 
     class Meta:
-        ordering = ["term", "date"]
+        ordering = ["term_id", "date"]
         unique_together = [["term", "description", "date"]]
+        indexes = [Index(fields=["term", "date"])]
 
 
 class AcademicGroup(Model):
@@ -160,7 +181,8 @@ class Course(Model):
     number = CharField(max_length=2**4, validators=[_course_id_number_validator])
     title = CharField(max_length=2**8, validators=[_course_title_validator])
     description = CharField(max_length=2**12, null=True)
-    _updated_at = DateTimeField()
+    search_vector = SearchVectorField(null=True)
+    _updated_at = DateTimeField(db_index=True)
 
     def __str__(self) -> str:
         return f"Course[{self.id}](subject={self.subject}, title='{self.title}')"
@@ -168,6 +190,7 @@ class Course(Model):
     class Meta:
         unique_together = [["subject", "number"]]
         ordering = ["id"]
+        indexes = [GinIndex(fields=["search_vector"])]
 
 
 class CourseUnits(Model):
@@ -195,7 +218,7 @@ class CourseDetail(Model):
         return f"CourseDetail[{self.course}]"
 
     class Meta:
-        ordering = ["course"]
+        ordering = ["course_id"]
 
 
 class CourseEnrollmentInformation(Model):
@@ -213,7 +236,7 @@ class CourseEnrollmentInformation(Model):
         return f"CourseEnrollmentInformation[{self.course.id}]"
 
     class Meta:
-        ordering = ["course"]
+        ordering = ["course_id"]
 
 
 class CourseOffering(Model):
@@ -222,13 +245,19 @@ class CourseOffering(Model):
     course = ForeignKey(Course, on_delete=CASCADE, related_name="offerings")
     alternative_title = CharField(max_length=2**8, null=True)
     term = ForeignKey(Term, on_delete=CASCADE, related_name="+")
+    # Copied from the term, so offerings sort newest first without a join
+    term_ordinal = PositiveIntegerField()
+    _updated_at = DateTimeField(db_index=True)
 
     def __str__(self):
         return f"CourseOffering[{self.id}](term={self.term}, subject={self.subject.id}, course={self.course.id})"
 
     class Meta:
-        ordering = ["term", "course"]
+        ordering = ["-term_ordinal", "course_id"]
         unique_together = [["course", "term"]]
+        indexes = [
+            Index(fields=["-term_ordinal", "course"], name="course_offering_order")
+        ]
 
 
 class Instructor(Model):
@@ -241,6 +270,11 @@ class Instructor(Model):
 
     class Meta:
         ordering = ["name", "email"]
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="instructor_name_trgm"
+            )
+        ]
 
 
 class Section(Model):
@@ -249,14 +283,38 @@ class Section(Model):
     offering = ForeignKey(CourseOffering, on_delete=CASCADE, related_name="sections")
     description = CharField(max_length=2**12, null=True)
     overview = CharField(max_length=2**16, null=True)
-    _updated_at = DateTimeField()
+    search_vector = SearchVectorField(null=True)
+    # Copied from the offering's term, to list the newest term first without
+    # joining through to it
+    term_ordinal = PositiveIntegerField()
+    _updated_at = DateTimeField(db_index=True)
 
     def __str__(self):
         return f"Section[{self.spire_id}](offering={self.offering})"
 
     class Meta:
-        ordering = ["offering", "spire_id"]
+        ordering = ["-term_ordinal", "offering_id", "spire_id"]
         unique_together = [["offering", "spire_id"]]
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            Index(
+                fields=["-term_ordinal", "offering", "spire_id"], name="section_order"
+            ),
+        ]
+
+
+class SectionDocument(Model):
+    section = OneToOneField(
+        Section, on_delete=CASCADE, primary_key=True, related_name="document"
+    )
+    document = JSONField()
+    _updated_at = DateTimeField()
+
+    def __str__(self) -> str:
+        return f"SectionDocument[{self.section_id}]"
+
+    class Meta:
+        ordering = ["section_id"]
 
 
 class SectionDetail(Model):
@@ -278,7 +336,20 @@ class SectionDetail(Model):
         return f"SectionDetail[{self.section.id}]"
 
     class Meta:
-        ordering = ["section"]
+        ordering = ["section_id"]
+        indexes = [
+            Index(fields=["status"]),
+            GinIndex(
+                fields=["class_components"],
+                name="section_detail_components_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+            GinIndex(
+                fields=["gened"],
+                name="section_detail_gened_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ]
 
 
 class SectionCombinedCapacity(Model):
@@ -316,7 +387,40 @@ class SectionAvailability(Model):
         return f"SectionAvailability[{self.section.id}]"
 
     class Meta:
-        ordering = ["section"]
+        ordering = ["section_id"]
+        indexes = [
+            Index(
+                fields=["section"],
+                name="section_availability_open",
+                condition=Q(available_seats__gt=0),
+            )
+        ]
+
+
+class SectionAvailabilityHistory(Model):
+    # A row is only added when the numbers change, and holds until the next row
+    # for the section, so each one stands for a run of identical scrapes.
+    id = BigAutoField(primary_key=True)
+    # Covered by the index below
+    section = ForeignKey(
+        Section,
+        on_delete=CASCADE,
+        related_name="availability_history",
+        db_index=False,
+    )
+    term = ForeignKey(Term, on_delete=CASCADE, related_name="+")
+    recorded_at = DateTimeField()
+    capacity = PositiveSmallIntegerField()
+    enrollment_total = PositiveSmallIntegerField()
+    available_seats = PositiveSmallIntegerField()
+    wait_list_total = PositiveSmallIntegerField()
+
+    def __str__(self) -> str:
+        return f"SectionAvailabilityHistory[{self.section_id}](recorded_at={self.recorded_at})"
+
+    class Meta:
+        ordering = ["section_id", "recorded_at"]
+        indexes = [Index(fields=["section", "recorded_at"])]
 
 
 class SectionCombinedAvailability(Model):
@@ -338,7 +442,7 @@ class SectionCombinedAvailability(Model):
         return f"SectionCombinedAvailability[{self.individual_availability.section.id}]"
 
     class Meta:
-        ordering = ["individual_availability"]
+        ordering = ["individual_availability_id"]
 
 
 class SectionRestriction(Model):
@@ -353,7 +457,7 @@ class SectionRestriction(Model):
         return f"SectionRestriction[{self.section.id}]"
 
     class Meta:
-        ordering = ["section"]
+        ordering = ["section_id"]
 
 
 class SectionMeetingInformation(Model):
@@ -367,7 +471,7 @@ class SectionMeetingInformation(Model):
         return f"SectionMeetingInformation[{self.id}]"
 
     class Meta:
-        ordering = ["section"]
+        ordering = ["section_id"]
 
 
 class SectionMeetingDates(Model):
@@ -391,12 +495,39 @@ class SectionMeetingSchedule(Model):
     days = JSONField()
     start_time = TimeField()
     end_time = TimeField()
+    # A bitmap of the week's five minute slots, see spire.schedules
+    slots = BinaryField(max_length=252)
 
     def __str__(self) -> str:
         return f"SectionMeetingSchedule[{self.meeting_information.id}](days={self.days}, start_time={self.start_time}, end_time={self.end_time})"
 
     class Meta:
-        ordering = ["meeting_information", "start_time"]
+        ordering = ["meeting_information_id", "start_time"]
+        indexes = [
+            Index(fields=["meeting_information", "start_time"]),
+            Index(fields=["start_time", "end_time"]),
+            GinIndex(
+                fields=["days"],
+                name="section_schedule_days_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ]
+
+
+class RoomOccupancy(Model):
+    # The slots of every meeting in a room during a term, OR'd together
+    id = AutoField(primary_key=True)
+    room = ForeignKey(BuildingRoom, on_delete=CASCADE, related_name="occupancy")
+    term = ForeignKey(Term, on_delete=CASCADE, related_name="+")
+    slots = BinaryField(max_length=252)
+    _updated_at = DateTimeField()
+
+    def __str__(self) -> str:
+        return f"RoomOccupancy[{self.room_id}](term={self.term_id})"
+
+    class Meta:
+        ordering = ["term_id", "room_id"]
+        unique_together = [["term", "room"]]
 
 
 class SectionCoverage(Model):
@@ -422,5 +553,37 @@ class SubjectSectionCoverage(Model):
     end_time = DateTimeField(null=True)
 
     class Meta:
-        ordering = ["term_coverage", "subject"]
+        ordering = ["term_coverage_id", "subject_id"]
         unique_together = ["term_coverage", "subject"]
+
+
+class DataGeneration(Model):
+    id = AutoField(primary_key=True)
+    value = PositiveBigIntegerField(default=0)
+    updated_at = DateTimeField(null=True)
+
+    def __str__(self) -> str:
+        return f"DataGeneration[{self.id}](value={self.value})"
+
+
+class ChangeEvent(Model):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+    id = BigAutoField(primary_key=True)
+    kind = CharField(max_length=2**4)
+    object_id = CharField(max_length=2**6)
+    action = CharField(max_length=2**3)
+    changes = JSONField()
+    created_at = DateTimeField(db_index=True)
+    # The data generation the event becomes visible in, as the scraper bumps it
+    # once done writing
+    generation = PositiveBigIntegerField()
+
+    def __str__(self) -> str:
+        return f"ChangeEvent[{self.id}](kind={self.kind}, object_id={self.object_id}, action={self.action})"
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [Index(fields=["kind", "object_id"])]
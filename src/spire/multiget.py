@@ -0,0 +1,64 @@
+from typing import Callable, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from spire.conditional import (
+    conditional_response,
+    get_full_objects,
+    get_validator_queryset,
+)
+
+IDS_QUERY_PARAM = "ids"
+
+
+def get_requested_ids(
+    request,
+    cast: Callable = str,
+    param: str = IDS_QUERY_PARAM,
+    max_ids: Optional[int] = None,
+) -> Optional[list]:
+    max_ids = max_ids or settings.MULTI_GET_MAX_IDS
+
+    value = request.GET.get(param)
+    if value is None:
+        return None
+
+    try:
+        ids = list(
+            dict.fromkeys(cast(id.strip()) for id in value.split(",") if id.strip())
+        )
+    except ValueError:
+        raise ValidationError({param: "Invalid id."})
+
+    if not ids:
+        raise ValidationError({param: "At least one id is required."})
+
+    if len(ids) > max_ids:
+        raise ValidationError(
+            {param: f"At most {max_ids} ids may be requested at once."}
+        )
+
+    return ids
+
+
+class MultiGetMixin:
+    # ?ids= returns the listed objects in the requested order, unpaginated,
+    # skipping any that do not exist.
+    def list(self, request, *args, **kwargs):
+        ids = get_requested_ids(request)
+        if ids is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.get_queryset()
+        found = get_validator_queryset(queryset).in_bulk(ids)
+        objects = [found[id] for id in ids if id in found]
+
+        return conditional_response(
+            request,
+            objects,
+            lambda: Response(
+                self.get_serializer(get_full_objects(queryset, objects), many=True).data
+            ),
+        )
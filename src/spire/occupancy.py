@@ -0,0 +1,98 @@
+import logging
+from typing import Iterable
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from spire.generation import get_data_generation
+from spire.models import (
+    RoomOccupancy,
+    Section,
+    SectionMeetingInformation,
+    SectionMeetingSchedule,
+)
+from spire.schedules import SLOTS_BYTES
+
+log = logging.getLogger(__name__)
+
+
+def get_section_rooms(sections: QuerySet[Section]) -> set[tuple[int, str]]:
+    # The rooms, and terms, whose occupancy changes along with the sections
+    return set(
+        SectionMeetingInformation.objects.filter(
+            section__in=sections, room__isnull=False
+        ).values_list("room_id", "section__offering__term_id")
+    )
+
+
+def rebuild_room_occupancy(rooms: Iterable[tuple[int, str]]) -> int:
+    occupancy = {key: 0 for key in rooms}
+    if not occupancy:
+        return 0
+
+    for room, term, slots in SectionMeetingSchedule.objects.filter(
+        meeting_information__room_id__in={room for room, _ in occupancy},
+        meeting_information__section__offering__term_id__in={
+            term for _, term in occupancy
+        },
+    ).values_list(
+        "meeting_information__room_id",
+        "meeting_information__section__offering__term_id",
+        "slots",
+    ):
+        if (room, term) in occupancy:
+            occupancy[room, term] |= int.from_bytes(slots, "little")
+
+    now = timezone.now()
+    built = RoomOccupancy.objects.bulk_create(
+        [
+            RoomOccupancy(
+                room_id=room,
+                term_id=term,
+                slots=slots.to_bytes(SLOTS_BYTES, "little"),
+                _updated_at=now,
+            )
+            for (room, term), slots in occupancy.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["term", "room"],
+        update_fields=["slots", "_updated_at"],
+    )
+
+    log.debug("Rebuilt the occupancy of %s rooms.", len(built))
+    return len(built)
+
+
+def rebuild_term_occupancy(term_id: str) -> int:
+    # Rooms that have since lost all of their meetings are cleared as well
+    return rebuild_room_occupancy(
+        get_section_rooms(Section.objects.filter(offering__term_id=term_id))
+        | set(
+            RoomOccupancy.objects.filter(term_id=term_id).values_list(
+                "room_id", "term_id"
+            )
+        )
+    )
+
+
+# Each worker keeps the latest occupancy of the terms it was asked about, and
+# reloads it once the data generation moves on.
+_occupancy: dict[str, tuple[int, dict[int, int]]] = {}
+
+
+def get_term_occupancy(term_id: str) -> dict[int, int]:
+    generation = get_data_generation()
+
+    cached = _occupancy.get(term_id)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    rooms = {
+        room: int.from_bytes(slots, "little")
+        for room, slots in RoomOccupancy.objects.filter(term_id=term_id).values_list(
+            "room_id", "slots"
+        )
+    }
+    _occupancy[term_id] = (generation, rooms)
+
+    return rooms
@@ -0,0 +1,150 @@
+import logging
+from datetime import timedelta
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models import Count, QuerySet
+from django.utils import timezone
+
+from spire.availability import get_availability
+from spire.generation import get_pending_data_generation
+from spire.models import ChangeEvent, SectionMeetingInformation
+
+log = logging.getLogger(__name__)
+
+
+def get_section_state(section_id: int) -> Optional[dict[str, Any]]:
+    # The fields worth telling apart between scrapes, flattened so they can be
+    # compared one by one.
+    state = get_availability(section_id)
+    if state is None:
+        return None
+
+    meetings = (
+        SectionMeetingInformation.objects.filter(section_id=section_id)
+        .select_related("schedule")
+        .prefetch_related("instructors")
+    )
+
+    state["instructors"] = sorted(
+        {i.name for m in meetings for i in m.instructors.all()}
+    )
+    state["rooms"] = sorted({m.room_raw for m in meetings})
+    state["times"] = sorted(
+        f"{' '.join(m.schedule.days)} {m.schedule.start_time}-{m.schedule.end_time}"
+        for m in meetings
+        if hasattr(m, "schedule")
+    )
+
+    return state
+
+
+def diff_states(
+    previous: Optional[dict[str, Any]], current: Optional[dict[str, Any]]
+) -> dict[str, list]:
+    previous = previous or {}
+    current = current or {}
+
+    return {
+        k: [previous.get(k), current.get(k)]
+        for k in previous.keys() | current.keys()
+        if previous.get(k) != current.get(k)
+    }
+
+
+def record_change(
+    kind: str,
+    object_id: Any,
+    previous: Optional[dict[str, Any]],
+    current: Optional[dict[str, Any]],
+) -> Optional[ChangeEvent]:
+    changes = diff_states(previous, current)
+    if not changes:
+        return None
+
+    if previous is None:
+        action = ChangeEvent.CREATED
+    elif current is None:
+        action = ChangeEvent.DELETED
+    else:
+        action = ChangeEvent.UPDATED
+
+    return ChangeEvent.objects.create(
+        kind=kind,
+        object_id=str(object_id),
+        action=action,
+        changes=changes,
+        created_at=timezone.now(),
+        generation=get_pending_data_generation(),
+    )
+
+
+def record_deletions(deleted: list[tuple[str, Any]]):
+    now = timezone.now()
+    generation = get_pending_data_generation()
+
+    ChangeEvent.objects.bulk_create(
+        ChangeEvent(
+            kind=kind,
+            object_id=str(id),
+            action=ChangeEvent.DELETED,
+            changes={},
+            created_at=now,
+            generation=generation,
+        )
+        for kind, id in deleted
+    )
+
+
+def _compact_events(events: list[ChangeEvent]) -> Optional[ChangeEvent]:
+    # Folds a run of events for one object into its last, keeping the first old
+    # value and the last new value of each field.
+    first, last = events[0], events[-1]
+
+    changes: dict[str, list] = {}
+    for event in events:
+        for field, (old, new) in event.changes.items():
+            changes[field] = [changes[field][0] if field in changes else old, new]
+
+    last.changes = {k: v for k, v in changes.items() if v[0] != v[1]}
+    if first.action == ChangeEvent.CREATED and last.action != ChangeEvent.DELETED:
+        last.action = ChangeEvent.CREATED
+
+    if not last.changes and last.action == ChangeEvent.UPDATED:
+        return None
+
+    return last
+
+
+def compact_change_events(older_than: timedelta) -> tuple[int, int]:
+    cutoff = timezone.now() - older_than
+    compacted = 0
+    deleted = 0
+
+    old_events: QuerySet[ChangeEvent] = ChangeEvent.objects.filter(
+        created_at__lt=cutoff
+    )
+
+    for key in (
+        old_events.values("kind", "object_id")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .iterator()
+    ):
+        with transaction.atomic():
+            events = list(
+                old_events.filter(
+                    kind=key["kind"], object_id=key["object_id"]
+                ).order_by("id")
+            )
+
+            kept = _compact_events(events)
+            if kept is not None:
+                kept.save(update_fields=["changes", "action"])
+
+            dropped = [e.id for e in events if kept is None or e.id != kept.id]
+            deleted += ChangeEvent.objects.filter(id__in=dropped).delete()[0]
+            compacted += 1
+
+    log.info("Compacted %s objects, deleting %s change events.", compacted, deleted)
+    return compacted, deleted
@@ -0,0 +1,192 @@
+from hashlib import md5
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    PageNumberPagination,
+)
+from rest_framework.response import Response
+
+from spire.generation import get_data_generation
+
+# Tables smaller than this are counted exactly, as it's cheap and the estimate
+# can be far off for them
+ESTIMATE_MIN_ROWS = 10_000
+
+COUNT_CACHE_PREFIX = "spireapi.count"
+
+
+def _estimate_count(queryset: QuerySet) -> Optional[int]:
+    # The planner's row estimate only describes the table as a whole
+    query = queryset.query
+    if (
+        query.where
+        or query.distinct
+        or query.group_by
+        or query.combinator
+        or query.is_sliced
+    ):
+        return None
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    if row is None or row[0] < ESTIMATE_MIN_ROWS:
+        return None
+
+    return int(row[0])
+
+
+def get_count(queryset) -> int:
+    # Large unfiltered tables are estimated, and anything else counted, once per
+    # data generation, so paging doesn't count the whole result every time.
+    if not isinstance(queryset, QuerySet):
+        return len(queryset)
+
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+
+    digest = md5(f"{sql}{params}".encode(), usedforsecurity=False).hexdigest()
+    key = f"{COUNT_CACHE_PREFIX}.{get_data_generation()}.{digest}"
+
+    count = cache.get(key)
+    if count is None:
+        count = _estimate_count(queryset)
+        if count is None:
+            count = queryset.count()
+
+        cache.set(key, count, settings.CACHE_MIDDLEWARE_SECONDS)
+
+    return count
+
+
+class EstimatedPage(Page):
+    def __init__(self, object_list, number, paginator, more: bool) -> None:
+        super().__init__(object_list, number, paginator)
+        self.more = more
+
+    def has_next(self) -> bool:
+        return self.more
+
+
+class EstimatedCountPaginator(Paginator):
+    # The count may be an estimate, so it's only reported. Whether there is a
+    # next page is found by fetching a row past the end of this one, and pages
+    # past the estimate are served as long as they have rows.
+    @cached_property
+    def count(self) -> int:
+        return get_count(self.object_list)
+
+    def validate_number(self, number) -> int:
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+
+        return number
+
+    def page(self, number) -> EstimatedPage:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+
+        return EstimatedPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page
+        )
+
+
+class EstimatedPageNumberPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
+
+
+class KeysetPagination(CursorPagination):
+    ordering = "id"
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Counting runs over the whole filtered set, so it is only done on request
+        self.count = (
+            get_count(queryset)
+            if request.query_params.get(self.count_query_param, "").lower()
+            in ("1", "true")
+            else None
+        )
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        body = {"next": self.get_next_link(), "previous": self.get_previous_link()}
+        if self.count is not None:
+            body["count"] = self.count
+
+        body["results"] = data
+
+        return Response(body)
+
+
+# Paginates by page number, unless the request carries a cursor parameter, in
+# which case pages are walked by keyset. An empty cursor starts from the top.
+class HybridPagination(BasePagination):
+    def __init__(self) -> None:
+        self.page_number = EstimatedPageNumberPagination()
+        self.keyset = KeysetPagination()
+        self.paginator = self.page_number
+
+    @property
+    def display_page_controls(self):
+        return self.paginator.display_page_controls
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.keyset.cursor_query_param in request.query_params:
+            self.paginator = self.keyset
+
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number.get_paginated_response_schema(schema)
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    def get_schema_fields(self, view):
+        return self.page_number.get_schema_fields(view) + self.keyset.get_schema_fields(
+            view
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *self.page_number.get_schema_operation_parameters(view),
+            *self.keyset.get_schema_operation_parameters(view),
+            {
+                "name": self.keyset.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Include a total count when paginating by cursor.",
+                "schema": {"type": "boolean"},
+            },
+        ]
@@ -0,0 +1,140 @@
+from typing import Optional
+
+from django.db.models import Prefetch, QuerySet
+
+from spire.models import (
+    Course,
+    CourseOffering,
+    Section,
+    SectionAvailability,
+    SectionMeetingInformation,
+)
+from spire.serializers.sparse import SparseFieldset
+
+
+class QueryPlan:
+    def __init__(
+        self,
+        select_related: Optional[dict[str, list[str]]] = None,
+        prefetch_related: Optional[dict[str, list[Prefetch]]] = None,
+    ) -> None:
+        # Both are keyed by the serializer field that walks the relations
+        self.select_related = select_related or {}
+        self.prefetch_related = prefetch_related or {}
+
+    def apply(
+        self, queryset: QuerySet, sparse: Optional[SparseFieldset] = None
+    ) -> QuerySet:
+        for field, lookups in self.select_related.items():
+            if sparse is None or sparse.includes(field):
+                queryset = queryset.select_related(*lookups)
+
+        for field, prefetches in self.prefetch_related.items():
+            if sparse is None or sparse.includes(field):
+                queryset = queryset.prefetch_related(*prefetches)
+
+        return queryset
+
+
+class QueryPlanMixin:
+    query_plan: QueryPlan
+
+    def get_queryset(self):
+        return self.query_plan.apply(
+            super().get_queryset(), SparseFieldset.from_request(self.request)
+        )
+
+
+BUILDING_QUERY_PLAN = QueryPlan(
+    prefetch_related={"rooms": ["rooms"]},
+)
+
+BUILDING_ROOM_QUERY_PLAN = QueryPlan(
+    select_related={"building": ["building"]},
+)
+
+TERM_QUERY_PLAN = QueryPlan(
+    prefetch_related={"events": ["events"]},
+)
+
+ACADEMIC_GROUP_QUERY_PLAN = QueryPlan(
+    prefetch_related={"subjects": ["subjects"]},
+)
+
+SUBJECT_QUERY_PLAN = QueryPlan(
+    prefetch_related={
+        "groups": ["groups"],
+        "courses": [
+            Prefetch(
+                "courses",
+                queryset=Course.objects.only("id", "title", "subject_id"),
+            )
+        ],
+    },
+)
+
+COURSE_QUERY_PLAN = QueryPlan(
+    select_related={
+        "subject": ["subject"],
+        "details": ["details__units"],
+        "enrollment_information": ["enrollment_information"],
+    },
+    prefetch_related={
+        "offerings": [
+            Prefetch(
+                "offerings",
+                queryset=CourseOffering.objects.select_related("term"),
+            )
+        ],
+    },
+)
+
+COURSE_OFFERING_QUERY_PLAN = QueryPlan(
+    select_related={
+        "subject": ["subject"],
+        "course": ["course"],
+        "term": ["term"],
+    },
+    prefetch_related={
+        "sections": [
+            Prefetch(
+                "sections",
+                queryset=Section.objects.only("id", "spire_id", "offering_id"),
+            )
+        ],
+    },
+)
+
+SECTION_COVERAGE_QUERY_PLAN = QueryPlan(
+    select_related={"term": ["term"]},
+)
+
+SECTION_QUERY_PLAN = QueryPlan(
+    select_related={
+        "offering": ["offering__course", "offering__term"],
+        "details": ["details__units"],
+        "availability": ["availability"],
+        "availability.combined_capacity": ["availability__combined_capacity"],
+        "restrictions": ["restrictions"],
+    },
+    prefetch_related={
+        "availability.combined_capacity": [
+            Prefetch(
+                "availability__combined_capacity__individual_availabilities",
+                queryset=SectionAvailability.objects.select_related("section").order_by(
+                    "section_id"
+                ),
+            )
+        ],
+        "meeting_information": [
+            Prefetch(
+                "meeting_information",
+                queryset=SectionMeetingInformation.objects.select_related(
+                    "schedule", "room__building"
+                )
+                .prefetch_related("instructors")
+                .order_by("id"),
+            )
+        ],
+    },
+)
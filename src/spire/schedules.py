@@ -0,0 +1,236 @@
+import re
+from datetime import date, time
+from itertools import combinations
+from time import monotonic
+from typing import Any, Iterable
+
+from spire.models import Section, SectionMeetingDates, SectionMeetingSchedule
+
+DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+SLOTS_BYTES = len(DAYS) * SLOTS_PER_DAY // 8
+
+DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+
+
+def _minutes(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+
+def get_schedule_slots(days: Iterable[str], start_time: time, end_time: time) -> bytes:
+    # Bit n is the nth five minutes of the week from Monday midnight. A meeting
+    # takes up every slot it overlaps, so back to back meetings don't clash.
+    start = _minutes(start_time) // SLOT_MINUTES
+    end = -(-_minutes(end_time) // SLOT_MINUTES)
+
+    day_slots = ((1 << max(end - start, 0)) - 1) << start
+
+    slots = 0
+    for day in days:
+        slots |= day_slots << (DAYS.index(day) * SLOTS_PER_DAY)
+
+    return slots.to_bytes(SLOTS_BYTES, "little")
+
+
+def _slot_time(slot: int) -> time:
+    if slot >= SLOTS_PER_DAY:
+        return time.max.replace(microsecond=0)
+
+    return time(*divmod(slot * SLOT_MINUTES, 60))
+
+
+def get_slot_ranges(slots: int) -> list[dict[str, Any]]:
+    ranges = []
+
+    for i, day in enumerate(DAYS):
+        day_slots = (slots >> (i * SLOTS_PER_DAY)) & DAY_MASK
+        if not day_slots:
+            continue
+
+        # Reversed, so the nth character is the nth slot of the day
+        for run in re.finditer("1+", f"{day_slots:0{SLOTS_PER_DAY}b}"[::-1]):
+            ranges.append(
+                {
+                    "day": day,
+                    "start_time": _slot_time(run.start()),
+                    "end_time": _slot_time(run.end()),
+                }
+            )
+
+    return ranges
+
+
+def get_section_slots(section_ids: Iterable[int]) -> dict[int, tuple[str, int]]:
+    # The slots of every meeting of a section, along with its term
+    sections: dict[int, tuple[str, int]] = {}
+
+    for id, term, slots in SectionMeetingSchedule.objects.filter(
+        meeting_information__section_id__in=section_ids
+    ).values_list(
+        "meeting_information__section_id",
+        "meeting_information__section__offering__term_id",
+        "slots",
+    ):
+        _, previous = sections.get(id, (term, 0))
+        sections[id] = (term, previous | int.from_bytes(slots, "little"))
+
+    return sections
+
+
+Meeting = tuple[int, list[tuple[date, date]]]
+
+
+def get_section_meetings(
+    section_ids: Iterable[int],
+) -> dict[int, tuple[str, list[Meeting]]]:
+    # The slots of each meeting of a section, with the dates it runs between,
+    # along with its term. Meetings without dates run the whole term.
+    schedules = SectionMeetingSchedule.objects.filter(
+        meeting_information__section_id__in=section_ids
+    )
+
+    dates: dict[int, list[tuple[date, date]]] = {}
+    for id, start, end in SectionMeetingDates.objects.filter(
+        meeting_information__in=schedules.values("meeting_information_id")
+    ).values_list("meeting_information_id", "start", "end"):
+        dates.setdefault(id, []).append((start, end))
+
+    sections: dict[int, tuple[str, list[Meeting]]] = {}
+    for section_id, term, id, slots in schedules.values_list(
+        "meeting_information__section_id",
+        "meeting_information__section__offering__term_id",
+        "meeting_information_id",
+        "slots",
+    ):
+        sections.setdefault(section_id, (term, []))[1].append(
+            (int.from_bytes(slots, "little"), dates.get(id, []))
+        )
+
+    return sections
+
+
+def _dates_overlap(a: list[tuple[date, date]], b: list[tuple[date, date]]) -> bool:
+    if not a or not b:
+        return True
+
+    return any(
+        a_start <= b_end and b_start <= a_end
+        for a_start, a_end in a
+        for b_start, b_end in b
+    )
+
+
+def find_conflicts(
+    section_ids: list[int], sections: dict[int, tuple[str, list[Meeting]]]
+) -> list[tuple[int, int, int]]:
+    # Pairs of sections meeting at the same time on the same dates, in the order
+    # they were asked for, along with the slots they share.
+    scheduled = [id for id in section_ids if id in sections]
+    conflicts = []
+
+    for a, b in combinations(scheduled, 2):
+        a_term, a_meetings = sections[a]
+        b_term, b_meetings = sections[b]
+        if a_term != b_term:
+            continue
+
+        shared = 0
+        for a_slots, a_dates in a_meetings:
+            for b_slots, b_dates in b_meetings:
+                if a_slots & b_slots and _dates_overlap(a_dates, b_dates):
+                    shared |= a_slots & b_slots
+
+        if shared:
+            conflicts.append((a, b, shared))
+
+    return conflicts
+
+
+def get_component(spire_id: str) -> str:
+    # Section ids look like 01AA-DIS(12345)
+    return spire_id.split("-", 1)[1].split("(", 1)[0]
+
+
+def get_schedule_groups(
+    term: str, course_ids: list[str], open_only: bool = False
+) -> list[tuple[str, str, list[tuple[int, int]]]]:
+    # One group per component of each course, as a schedule takes one section
+    # of each, listed in the order the courses were asked for.
+    queryset = Section.objects.filter(
+        offering__term_id=term, offering__course_id__in=course_ids
+    )
+    if open_only:
+        queryset = queryset.filter(details__status="Open")
+
+    sections = list(
+        queryset.order_by("spire_id").values_list(
+            "id", "offering__course_id", "spire_id"
+        )
+    )
+    slots = get_section_slots([id for id, _, _ in sections])
+
+    groups: dict[tuple[str, str], list[tuple[int, int]]] = {}
+    for id, course, spire_id in sections:
+        _, section_slots = slots.get(id, (term, 0))
+        groups.setdefault((course, get_component(spire_id)), []).append(
+            (id, section_slots)
+        )
+
+    return [
+        (course, component, groups[course, component])
+        for course in course_ids
+        for c, component in sorted(groups)
+        if c == course
+    ]
+
+
+def generate_schedules(
+    groups: list[list[tuple[int, int]]], limit: int, deadline: float
+) -> tuple[list[list[int]], bool]:
+    # Backtracks through the groups, most constrained first, and gives up on a
+    # partial schedule as soon as any remaining group has nothing left that
+    # fits. Returns the schedules found, with sections in the order of the
+    # groups, and whether they are all there are, which is not the case if one
+    # more was found past the limit or the deadline cut the search short.
+    if not groups or not all(groups):
+        return [], True
+
+    order = sorted(range(len(groups)), key=lambda i: len(groups[i]))
+    ordered = [groups[i] for i in order]
+
+    schedules: list[list[int]] = []
+    chosen = [0] * len(groups)
+
+    def search(depth: int, used: int) -> bool:
+        if depth == len(ordered):
+            if len(schedules) == limit:
+                return False
+
+            schedule = [0] * len(groups)
+            for i, id in zip(order, chosen):
+                schedule[i] = id
+            schedules.append(schedule)
+            return True
+
+        if monotonic() > deadline:
+            return False
+
+        for id, slots in ordered[depth]:
+            if slots & used:
+                continue
+
+            taken = used | slots
+            if not all(
+                any(not s & taken for _, s in group) for group in ordered[depth + 1 :]
+            ):
+                continue
+
+            chosen[depth] = id
+            if not search(depth + 1, taken):
+                return False
+
+        return True
+
+    return schedules, search(0, 0)
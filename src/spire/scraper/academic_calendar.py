@@ -6,6 +6,7 @@ from datetime import date
 from bs4 import Tag
 from django.db import transaction
 
+from spire.generation import bump_data_generation
 from spire.models import Term, TermEvent
 from spire.scraper.shared import SEASON_LIST, get_or_create_term
 from spire.scraper.web import fetch_soup, get_tag_text
@@ -109,4 +110,6 @@ def scrape_academic_schedule():
             pushed_list = TermEvent.objects.bulk_create(event_list)
             log.info("Pushed %s new events.", len(pushed_list))
 
+    bump_data_generation()
+
     log.info("Scraped academic schedule.")
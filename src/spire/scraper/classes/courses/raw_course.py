@@ -16,6 +16,7 @@ from spire.scraper.classes.normalizers import (
     STRIP_STR,
 )
 from spire.scraper.classes.shared import RawField, RawObject, clean_id
+from spire.search import update_course_search_vector
 
 log = logging.getLogger(__name__)
 
@@ -91,6 +92,7 @@ class RawCourse(RawObject):
 
     def push(self):
         course, created = super().push()
+        update_course_search_vector(course)
 
         if hasattr(self, "_raw_group"):
             self.subject.groups.add(self._raw_group.push())
@@ -4,7 +4,10 @@ from typing import Optional
 from django.db import transaction
 from django.utils import timezone
 
+from spire.documents import build_pushed_section_documents
 from spire.models import Section, SectionMeetingInformation
+from spire.occupancy import get_section_rooms, rebuild_room_occupancy
+from spire.outbox import get_section_state, record_change
 from spire.patterns import SECTION_ID_REGEXP
 from spire.scraper.classes.normalizers import (
     DESCRIPTION_NOT_AVAILABLE_TO_NONE,
@@ -21,6 +24,7 @@ from spire.scraper.classes.sections.raw_section_meeting_information import (
 from spire.scraper.classes.sections.raw_section_restriction import RawSectionRestriction
 from spire.scraper.classes.shared import RawField, RawObject
 from spire.scraper.shared import assert_match
+from spire.search import update_section_search_vector
 
 log = logging.getLogger(__name__)
 
@@ -85,6 +89,13 @@ class RawSection(RawObject):
 
     def push(self, offering):
         with transaction.atomic():
+            existing_id = (
+                Section.objects.filter(spire_id=self.spire_id, offering=offering)
+                .values_list("id", flat=True)
+                .first()
+            )
+            previous = get_section_state(existing_id) if existing_id else None
+
             section, _ = Section.objects.update_or_create(
                 spire_id=self.spire_id,
                 offering=offering,
@@ -92,15 +103,20 @@ class RawSection(RawObject):
                     "spire_id": self.spire_id,
                     "description": self.description,
                     "overview": self.overview,
+                    "term_ordinal": offering.term_ordinal,
                     "_updated_at": timezone.now(),
                 },
             )
 
             self.details.push(section=section)
+            update_section_search_vector(section)
             if hasattr(self, "restrictions"):
                 self.restrictions.push(section=section)
             self.availability.push(section=section)
 
+            sections = Section.objects.filter(id=section.id)
+            rooms = get_section_rooms(sections)
+
             dropped, _ = SectionMeetingInformation.objects.filter(
                 section_id=section.id
             ).delete()
@@ -114,4 +130,12 @@ class RawSection(RawObject):
             for r_mi in self.meeting_information:
                 r_mi.push(section=section)
 
+            rebuild_room_occupancy(rooms | get_section_rooms(sections))
+
+            record_change(
+                "section", section.id, previous, get_section_state(section.id)
+            )
+
+            build_pushed_section_documents(section)
+
         return section
@@ -2,6 +2,10 @@ import logging
 import re
 from typing import Any
 
+from django.db import transaction
+
+from spire.availability import get_availability, publish_availability
+from spire.history import record_availability_history
 from spire.models import Section, SectionAvailability, SectionCombinedCapacity
 from spire.scraper.classes.shared import RawDictionary, RawField, RawObject
 from spire.scraper.shared import assert_match
@@ -133,6 +137,8 @@ class RawSectionAvailability(RawDictionary):
             )
 
     def push(self, section: Section):
+        previous = get_availability(section.id)
+
         availability, created = super().push(section=section)
 
         if self._is_combined:
@@ -141,4 +147,10 @@ class RawSectionAvailability(RawDictionary):
             )
             availability.save()
 
+        record_availability_history(section, availability)
+
+        current = get_availability(section.id)
+        if current != previous:
+            transaction.on_commit(lambda: publish_availability(current))
+
         return availability, created
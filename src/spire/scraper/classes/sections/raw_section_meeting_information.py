@@ -10,6 +10,7 @@ from spire.models import (
     SectionMeetingInformation,
     SectionMeetingSchedule,
 )
+from spire.schedules import get_schedule_slots
 from spire.scraper.classes.buildings.raw_building import get_raw_building_room
 from spire.scraper.classes.shared import RawField, RawObject
 from spire.scraper.shared import assert_match
@@ -133,6 +134,16 @@ class RawSectionMeetingSchedule(RawObject):
             ],
         )
 
+    # The slots are derived when pushed, so their bitmap stays out of the logs
+    def push(self, **kwargs):
+        return super().push(
+            {
+                **self.get_model_defaults(),
+                "slots": get_schedule_slots(self.days, self.start_time, self.end_time),
+            },
+            **kwargs,
+        )
+
 
 class RawSectionMeetingInformation(RawObject):
     def __init__(self, spire_id: str, table: dict[str, Any]) -> None:
@@ -3,11 +3,15 @@ from datetime import datetime
 from typing import NamedTuple
 
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
 
+from spire.changes import get_deleted_objects
+from spire.documents import build_subject_section_documents
+from spire.generation import bump_data_generation
 from spire.models import (
     Course,
     CourseOffering,
@@ -17,6 +21,8 @@ from spire.models import (
     SubjectSectionCoverage,
     Term,
 )
+from spire.occupancy import get_section_rooms, rebuild_room_occupancy
+from spire.outbox import record_deletions
 from spire.scraper.classes import RawCourse, RawInstructor, RawSection, RawSubject
 from spire.scraper.classes.normalizers import REPLACE_DOUBLE_SPACE
 from spire.scraper.shared import assert_match, get_or_create_term, scrape_spire_tables
@@ -24,6 +30,7 @@ from spire.scraper.spire_driver import SpireDriver
 from spire.scraper.stats import Stats
 from spire.scraper.timer import Timer
 from spire.scraper.versioned_cache import VersionedCache
+from spire.search import update_course_search_vector
 
 log = logging.getLogger(__name__)
 
@@ -310,6 +317,9 @@ def _scrape_course_offering(context: ScrapeContext, term, subject, span_id):
         },
     )
 
+    if created:
+        update_course_search_vector(course)
+
     log.info(
         "Found sections for %s %s during %s...",
         "new" if created else "existing",
@@ -323,6 +333,8 @@ def _scrape_course_offering(context: ScrapeContext, term, subject, span_id):
         defaults={
             "subject": subject,
             "alternative_title": course_title if course_title != course.title else None,
+            "term_ordinal": term.ordinal,
+            "_updated_at": timezone.now(),
         },
     )
 
@@ -344,11 +356,26 @@ def _scrape_section_link_ids(driver: SpireDriver, section_table_id: str) -> list
 
 
 def _drop_unfound(model, filter, exclude, log_message):
-    dropped, _ = model.objects.filter(**filter).exclude(**exclude).delete()
+    queryset = model.objects.filter(**filter).exclude(**exclude)
+
+    with transaction.atomic():
+        deleted = get_deleted_objects(queryset)
+        record_deletions(deleted)
+
+        rooms = get_section_rooms(
+            queryset
+            if model is Section
+            else Section.objects.filter(offering__in=queryset)
+        )
+
+        dropped, _ = queryset.delete()
+        rebuild_room_occupancy(rooms)
 
     if dropped > 0:
         log.info(log_message, dropped)
 
+    return dropped
+
 
 def _scrape_search_results(
     context: ScrapeContext,
@@ -389,12 +416,13 @@ def _scrape_search_results(
 
             scraped_spire_ids_for_course.add(section.spire_id)
 
-        _drop_unfound(
+        dropped = _drop_unfound(
             Section,
             {"offering__term": term, "offering__course": course},
             {"spire_id__in": scraped_spire_ids_for_course},
             f"Dropped %d {course.id} sections during {term.id} that are no longer listed.",
         )
+        context.stats.increment(f"{subject.id}_rows_dropped", dropped)
 
         log.info(
             "Covered %d %s sections during %s.",
@@ -403,12 +431,13 @@ def _scrape_search_results(
             term.id,
         )
 
-    _drop_unfound(
+    dropped = _drop_unfound(
         CourseOffering,
         {"subject": subject, "term": term},
         {"course__id__in": scraped_course_ids},
         f"Dropped %d {subject.id} course offerings during {term.id} that are no longer listed.",
     )
+    context.stats.increment(f"{subject.id}_rows_dropped", dropped)
 
 
 def _initialize_query(driver: SpireDriver, term_id: str, subject_id: str):
@@ -538,6 +567,12 @@ def _search_query(context: ScrapeContext, term, subject):
     driver.click("CLASS_SRCH_WRK2_SSR_PB_NEW_SEARCH")
 
 
+def _count_subject_changes(context: ScrapeContext, subject):
+    return context.stats.get(f"{subject.id}_sections_scraped") + context.stats.get(
+        f"{subject.id}_rows_dropped"
+    )
+
+
 def _scrape_term(
     context: ScrapeContext,
     term,
@@ -584,8 +619,23 @@ def _scrape_term(
             defaults={"completed": False, "start_time": timezone.now()},
         )
 
-        # Execute search
-        _search_query(context, term, subject)
+        changes_before = _count_subject_changes(context, subject)
+
+        # Execute search. Sections pushed before a failure are committed, so
+        # they're published all the same.
+        try:
+            _search_query(context, term, subject)
+        finally:
+            documents_built = build_subject_section_documents(term, subject)
+            log.info(
+                "Built %d %s section documents during %s.",
+                documents_built,
+                subject,
+                term.id,
+            )
+
+            if _count_subject_changes(context, subject) != changes_before:
+                bump_data_generation()
 
         if subject_coverage.end_time is None:
             subject_coverage.end_time = timezone.now()
@@ -0,0 +1,38 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import OuterRef, QuerySet, Subquery
+
+from spire.models import Course, Section, SectionDetail
+
+SEARCH_CONFIG = "english"
+
+# Course ids are stemmed like everything else, as queries are, so subjects
+# that stem differently, such as HISTORY, are still found by their id
+COURSE_SEARCH_VECTOR = (
+    SearchVector("id", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("title", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+)
+
+SECTION_SEARCH_VECTOR = SearchVector(
+    Subquery(SectionDetail.objects.filter(section=OuterRef("pk")).values("topic")[:1]),
+    weight="A",
+    config=SEARCH_CONFIG,
+) + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+
+
+def update_course_search_vector(course: Course):
+    Course.objects.filter(id=course.id).update(search_vector=COURSE_SEARCH_VECTOR)
+
+
+def update_section_search_vector(section: Section):
+    Section.objects.filter(id=section.id).update(search_vector=SECTION_SEARCH_VECTOR)
+
+
+def search(queryset: QuerySet, text: str) -> QuerySet:
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank("search_vector", query))
+        .order_by("-rank", "pk")
+    )
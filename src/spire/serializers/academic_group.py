@@ -2,9 +2,10 @@ from rest_framework.serializers import HyperlinkedModelSerializer
 
 from spire.models import AcademicGroup
 from spire.serializers.fields import SubjectFieldSerializer
+from spire.serializers.sparse import SparseFieldsMixin
 
 
-class AcademicGroupSerializer(HyperlinkedModelSerializer):
+class AcademicGroupSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     subjects = SubjectFieldSerializer(many=True)
 
     class Meta:
@@ -2,6 +2,7 @@ from rest_framework.serializers import HyperlinkedModelSerializer
 
 from spire.models import Building, BuildingRoom
 from spire.serializers.fields import BaseFieldSerializer, BuildingFieldSerializer
+from spire.serializers.sparse import SparseFieldsMixin
 
 
 class BRFSNoBuilding(BaseFieldSerializer):
@@ -10,7 +11,7 @@ class BRFSNoBuilding(BaseFieldSerializer):
         fields = ["id", "url", "number", "alt"]
 
 
-class BuildingSerializer(HyperlinkedModelSerializer):
+class BuildingSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     rooms = BRFSNoBuilding(many=True)
 
     class Meta:
@@ -18,7 +19,7 @@ class BuildingSerializer(HyperlinkedModelSerializer):
         fields = ["url", "id", "name", "address", "rooms"]
 
 
-class BuildingRoomSerializer(HyperlinkedModelSerializer):
+class BuildingRoomSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     building = BuildingFieldSerializer()
 
     class Meta:
@@ -20,9 +20,10 @@ from spire.serializers.fields import (
     TermFieldSerializer,
 )
 from spire.serializers.instructor import InstructorSerializer
+from spire.serializers.sparse import SparseFieldsMixin
 
 
-class CourseDetailSerializer(ModelSerializer):
+class CourseDetailSerializer(SparseFieldsMixin, ModelSerializer):
     units = CourseUnitsFieldSerializer()
 
     class Meta:
@@ -30,13 +31,13 @@ class CourseDetailSerializer(ModelSerializer):
         exclude = ["course"]
 
 
-class CourseEnrollmentInformationSerializer(ModelSerializer):
+class CourseEnrollmentInformationSerializer(SparseFieldsMixin, ModelSerializer):
     class Meta:
         model = CourseEnrollmentInformation
         exclude = ["course"]
 
 
-class CourseOfferingSerializer(HyperlinkedModelSerializer):
+class CourseOfferingSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     course = CourseFieldSerializer()
     sections = SectionFieldSerializer(many=True)
     subject = SubjectFieldSerializer()
@@ -55,7 +56,7 @@ class CourseOfferingSerializer(HyperlinkedModelSerializer):
         ]
 
 
-class CourseSerializer(HyperlinkedModelSerializer):
+class CourseSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     subject = SubjectFieldSerializer()
     details = CourseDetailSerializer()
     enrollment_information = CourseEnrollmentInformationSerializer()
@@ -82,7 +83,7 @@ class DummyObject:
         self.pk = pk
 
 
-class CourseInstructorsSerializer(Serializer):
+class CourseInstructorsSerializer(SparseFieldsMixin, Serializer):
     offering = CourseOfferingFieldSerializer()
     instructors = InstructorSerializer(many=True)
 
@@ -13,9 +13,10 @@ from spire.models import (
     Term,
     TermEvent,
 )
+from spire.serializers.sparse import SparseFieldsMixin
 
 
-class BaseFieldSerializer(HyperlinkedModelSerializer):
+class BaseFieldSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     def __init__(self, instance=None, data=..., **kwargs):
         super().__init__(instance, data, read_only=True, **kwargs)
 
@@ -1,9 +1,10 @@
 from rest_framework.serializers import HyperlinkedModelSerializer
 
 from spire.models import Instructor
+from spire.serializers.sparse import SparseFieldsMixin
 
 
-class InstructorSerializer(HyperlinkedModelSerializer):
+class InstructorSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     class Meta:
         model = Instructor
         fields = ["url", "name"]
@@ -0,0 +1,22 @@
+from rest_framework.serializers import FloatField
+
+from spire.models import Course, Section
+from spire.serializers.fields import BaseFieldSerializer
+from spire.serializers.section import SectionCourseOfferingFieldSerializer
+
+
+class CourseSearchResultSerializer(BaseFieldSerializer):
+    rank = FloatField()
+
+    class Meta:
+        model = Course
+        fields = ["id", "url", "title", "rank"]
+
+
+class SectionSearchResultSerializer(BaseFieldSerializer):
+    offering = SectionCourseOfferingFieldSerializer()
+    rank = FloatField()
+
+    class Meta:
+        model = Section
+        fields = ["id", "url", "spire_id", "offering", "rank"]
@@ -21,6 +21,7 @@ from spire.serializers.fields import (
     TermFieldSerializer,
 )
 from spire.serializers.instructor import InstructorSerializer
+from spire.serializers.sparse import SparseFieldsMixin
 
 
 class SectionCourseOfferingFieldSerializer(BaseFieldSerializer):
@@ -32,7 +33,7 @@ class SectionCourseOfferingFieldSerializer(BaseFieldSerializer):
         fields = ["url", "term", "course"]
 
 
-class SectionDetailSerializer(ModelSerializer):
+class SectionDetailSerializer(SparseFieldsMixin, ModelSerializer):
     units = CourseUnitsFieldSerializer()
 
     class Meta:
@@ -40,13 +41,13 @@ class SectionDetailSerializer(ModelSerializer):
         exclude = ["section"]
 
 
-class SectionMeetingScheduleSerializer(ModelSerializer):
+class SectionMeetingScheduleSerializer(SparseFieldsMixin, ModelSerializer):
     class Meta:
         model = SectionMeetingSchedule
         fields = ["days", "start_time", "end_time"]
 
 
-class SectionMeetingInformationSerializer(ModelSerializer):
+class SectionMeetingInformationSerializer(SparseFieldsMixin, ModelSerializer):
     schedule = SectionMeetingScheduleSerializer()
     instructors = InstructorSerializer(many=True)
     room = BuildingRoomFieldSerializer()
@@ -56,7 +57,7 @@ class SectionMeetingInformationSerializer(ModelSerializer):
         exclude = ["section", "id"]
 
 
-class SectionAvailabilityFieldSerializer(ModelSerializer):
+class SectionAvailabilityFieldSerializer(SparseFieldsMixin, ModelSerializer):
     section = SectionFieldSerializer()
 
     class Meta:
@@ -64,7 +65,7 @@ class SectionAvailabilityFieldSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class SectionCombinedCapacitySerializer(ModelSerializer):
+class SectionCombinedCapacitySerializer(SparseFieldsMixin, ModelSerializer):
     section = SectionFieldSerializer()
     individual_availabilities = SectionAvailabilityFieldSerializer(many=True)
 
@@ -73,7 +74,7 @@ class SectionCombinedCapacitySerializer(ModelSerializer):
         exclude = ["id"]
 
 
-class SectionAvailabilitySerializer(ModelSerializer):
+class SectionAvailabilitySerializer(SparseFieldsMixin, ModelSerializer):
     combined_capacity = SectionCombinedCapacitySerializer()
 
     class Meta:
@@ -81,13 +82,13 @@ class SectionAvailabilitySerializer(ModelSerializer):
         exclude = ["section"]
 
 
-class SectionRestrictionSerializer(ModelSerializer):
+class SectionRestrictionSerializer(SparseFieldsMixin, ModelSerializer):
     class Meta:
         model = SectionRestriction
         exclude = ["section"]
 
 
-class SectionCoverageSerializer(HyperlinkedModelSerializer):
+class SectionCoverageSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     term = TermFieldSerializer()
 
     class Meta:
@@ -95,7 +96,7 @@ class SectionCoverageSerializer(HyperlinkedModelSerializer):
         fields = ["term", "completed"]
 
 
-class SectionSerializer(HyperlinkedModelSerializer):
+class SectionSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     offering = SectionCourseOfferingFieldSerializer()
     details = SectionDetailSerializer()
     availability = SectionAvailabilitySerializer()
@@ -0,0 +1,171 @@
+from typing import Any, Iterable, Optional
+
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+EXPAND_QUERY_PARAM = "expand"
+
+# The fields that identify a nested object that isn't expanded
+REFERENCE_FIELDS = ["id", "url"]
+
+
+def _parse_paths(value: Optional[str]) -> Optional[set[str]]:
+    if value is None:
+        return None
+
+    return {path.strip() for path in value.split(",") if path.strip()}
+
+
+def _is_within(path: str, paths: Iterable[str]) -> bool:
+    # Whether the path, or one of its ancestors, is listed
+    return any(path == p or path.startswith(p + ".") for p in paths)
+
+
+def _leads_to(path: str, paths: Iterable[str]) -> bool:
+    # Whether the path must be kept to reach a listed descendant
+    return any(p.startswith(path + ".") for p in paths)
+
+
+def _parent(path: str) -> str:
+    return path.rpartition(".")[0]
+
+
+class SparseFieldset:
+    # ?fields= keeps only the listed fields, ?omit= drops the listed fields, and
+    # ?expand= renders only the listed nested objects in full. Other nested
+    # objects are cut down to a reference, or if they have nothing to refer to
+    # them by, left as they are. Nested fields are named with dotted paths, e.g.
+    # availability.capacity.
+
+    def __init__(
+        self,
+        fields: Optional[set[str]] = None,
+        omit: Optional[set[str]] = None,
+        expand: Optional[set[str]] = None,
+    ) -> None:
+        self.fields = fields
+        self.omit = omit or set()
+        self.expand = expand
+
+    @classmethod
+    def from_request(cls, request) -> Optional["SparseFieldset"]:
+        if request is None:
+            return None
+
+        if not hasattr(request, "_sparse_fieldset"):
+            params = request.query_params
+            if any(
+                p in params
+                for p in (FIELDS_QUERY_PARAM, OMIT_QUERY_PARAM, EXPAND_QUERY_PARAM)
+            ):
+                request._sparse_fieldset = cls(
+                    fields=_parse_paths(params.get(FIELDS_QUERY_PARAM)),
+                    omit=_parse_paths(params.get(OMIT_QUERY_PARAM)),
+                    expand=_parse_paths(params.get(EXPAND_QUERY_PARAM)),
+                )
+            else:
+                request._sparse_fieldset = None
+
+        return request._sparse_fieldset
+
+    def includes(self, path: str) -> bool:
+        if _is_within(path, self.omit):
+            return False
+
+        if self.fields is not None and not (
+            _is_within(path, self.fields) or _leads_to(path, self.fields)
+        ):
+            return False
+
+        return True
+
+    def _expands(self, path: str) -> bool:
+        # Explicitly selected nested objects count as expanded
+        expanded = self.expand | (self.fields or set())
+        return _is_within(path, expanded) or _leads_to(path, expanded)
+
+    def references(self, path: str) -> bool:
+        # Whether a nested object is cut down to a reference. Below an object
+        # that isn't expanded, and couldn't be referenced, everything is left as
+        # it is.
+        if self.expand is None or self._expands(path):
+            return False
+
+        parent = _parent(path)
+        return not parent or self._expands(parent)
+
+    def _reference(self, data: dict) -> Optional[dict]:
+        reference = {k: data[k] for k in REFERENCE_FIELDS if k in data}
+        return reference or None
+
+    def prune(self, data: Any, nested_paths: set[str], path: str = "") -> Any:
+        if isinstance(data, list):
+            return [self.prune(x, nested_paths, path) for x in data]
+
+        if not isinstance(data, dict):
+            return data
+
+        if path and self.references(path):
+            reference = self._reference(data)
+            if reference is not None:
+                return reference
+
+        pruned = {}
+        for k, v in data.items():
+            field_path = f"{path}.{k}" if path else k
+
+            if self.includes(field_path):
+                pruned[k] = (
+                    self.prune(v, nested_paths, field_path)
+                    if field_path in nested_paths
+                    else v
+                )
+
+        return pruned
+
+
+def get_nested_paths(serializer: BaseSerializer, path: str = "") -> set[str]:
+    paths = set()
+
+    for name, field in serializer.fields.items():
+        if isinstance(field, ListSerializer):
+            field = field.child
+
+        if isinstance(field, BaseSerializer):
+            field_path = f"{path}.{name}" if path else name
+            paths.add(field_path)
+            paths |= get_nested_paths(field, field_path)
+
+    return paths
+
+
+class SparseFieldsMixin:
+    def get_fields(self):
+        fields = super().get_fields()
+
+        sparse = SparseFieldset.from_request(self.context.get("request"))
+        if sparse is None:
+            return fields
+
+        names = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                names.append(node.field_name)
+            node = node.parent
+
+        path = ".".join(reversed(names))
+
+        if path and sparse.references(path):
+            references = {
+                name: fields[name] for name in REFERENCE_FIELDS if name in fields
+            }
+            if references:
+                return references
+
+        return {
+            name: field
+            for name, field in fields.items()
+            if sparse.includes(f"{path}.{name}" if path else name)
+        }
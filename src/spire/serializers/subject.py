@@ -2,9 +2,10 @@ from rest_framework.serializers import HyperlinkedModelSerializer
 
 from spire.models import Subject
 from spire.serializers.fields import AcademicGroupFieldSerializer, CourseFieldSerializer
+from spire.serializers.sparse import SparseFieldsMixin
 
 
-class SubjectSerializer(HyperlinkedModelSerializer):
+class SubjectSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     groups = AcademicGroupFieldSerializer(many=True)
     courses = CourseFieldSerializer(many=True)
 
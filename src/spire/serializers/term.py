@@ -2,9 +2,10 @@ from rest_framework.serializers import HyperlinkedModelSerializer
 
 from spire.models import Term, TermEvent
 from spire.serializers.fields import TermEventFieldSerializer, TermFieldSerializer
+from spire.serializers.sparse import SparseFieldsMixin
 
 
-class TermSerializer(HyperlinkedModelSerializer):
+class TermSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     events = TermEventFieldSerializer(many=True)
 
     class Meta:
@@ -21,7 +22,7 @@ class TermSerializer(HyperlinkedModelSerializer):
         ]
 
 
-class TermEventSerializer(HyperlinkedModelSerializer):
+class TermEventSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     term = TermFieldSerializer()
 
     class Meta:
@@ -0,0 +1,228 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import brotli
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.text import slugify
+from rest_framework.utils.encoders import JSONEncoder
+
+from spire.documents import BATCH_SIZE, iter_section_documents
+from spire.generation import get_data_generation
+from spire.models import Course, CourseOffering, Section, SectionDocument, Term
+from spire.query_plans import COURSE_OFFERING_QUERY_PLAN, COURSE_QUERY_PLAN
+from spire.serializers.course import CourseOfferingSerializer, CourseSerializer
+
+log = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+_encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _serialize(serializer_class, queryset) -> Iterator[dict[str, Any]]:
+    for obj in queryset.iterator(chunk_size=BATCH_SIZE):
+        yield serializer_class(obj, context={"request": None}).data
+
+
+def _term_datasets(term: Term) -> dict[str, Callable[[], Iterator[dict[str, Any]]]]:
+    return {
+        "courses": lambda: _serialize(
+            CourseSerializer,
+            COURSE_QUERY_PLAN.apply(Course.objects.filter(offerings__term=term)),
+        ),
+        "offerings": lambda: _serialize(
+            CourseOfferingSerializer,
+            COURSE_OFFERING_QUERY_PLAN.apply(CourseOffering.objects.filter(term=term)),
+        ),
+        "sections": lambda: iter_section_documents(
+            Section.objects.filter(offering__term=term), None
+        ),
+        "events": lambda: term.events.values("date", "description").iterator(),
+    }
+
+
+def _write_dataset(
+    directory: str, name: str, rows: Iterator[dict[str, Any]]
+) -> dict[str, Any]:
+    # Files are named by the hash of their contents, so they never change once
+    # written and can be cached indefinitely.
+    gzip_path = os.path.join(directory, f".{name}.ndjson.gz.tmp")
+    brotli_path = os.path.join(directory, f".{name}.ndjson.br.tmp")
+
+    digest = hashlib.sha256()
+    count = 0
+    size = 0
+
+    compressor = brotli.Compressor()
+
+    with open(gzip_path, "wb") as gzip_file, gzip.GzipFile(
+        fileobj=gzip_file, mode="wb", mtime=0
+    ) as gzip_stream, open(brotli_path, "wb") as brotli_file:
+        for row in rows:
+            line = (_encoder.encode(row) + "\n").encode()
+            digest.update(line)
+            gzip_stream.write(line)
+            brotli_file.write(compressor.process(line))
+
+            count += 1
+            size += len(line)
+
+        brotli_file.write(compressor.finish())
+
+    sha256 = digest.hexdigest()
+    files = {}
+
+    for encoding, path, extension in (
+        ("gzip", gzip_path, "gz"),
+        ("br", brotli_path, "br"),
+    ):
+        file_name = f"{name}.{sha256[:16]}.ndjson.{extension}"
+        os.replace(path, os.path.join(directory, file_name))
+        files[encoding] = {
+            "path": f"{os.path.basename(directory)}/{file_name}",
+            "size": os.path.getsize(os.path.join(directory, file_name)),
+        }
+
+    return {"sha256": sha256, "rows": count, "size": size, "files": files}
+
+
+def _read_manifest(root: str) -> Optional[dict[str, Any]]:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _manifest_paths(manifest: Optional[dict[str, Any]]) -> set[str]:
+    if manifest is None:
+        return set()
+
+    return {
+        file["path"]
+        for datasets in manifest["terms"].values()
+        for dataset in datasets.values()
+        for file in dataset["files"].values()
+    }
+
+
+def get_term_marker(term: Term) -> str:
+    # Changes to a term's rows move one of these, and deletions its counts, so
+    # a term whose marker is unchanged has nothing new to snapshot.
+    state = [
+        Section.objects.filter(offering__term=term).aggregate(
+            Count("id"), Max("_updated_at")
+        ),
+        SectionDocument.objects.filter(section__offering__term=term).aggregate(
+            Max("_updated_at")
+        ),
+        CourseOffering.objects.filter(term=term).aggregate(
+            Count("id"), Max("_updated_at")
+        ),
+        Course.objects.filter(offerings__term=term).aggregate(Max("_updated_at")),
+        list(term.events.values_list("date", "description")),
+    ]
+
+    return hashlib.md5(repr(state).encode(), usedforsecurity=False).hexdigest()
+
+
+def _stale_terms(
+    terms: Iterable[Term], previous: Optional[dict[str, Any]]
+) -> dict[Term, str]:
+    markers = previous.get("markers", {}) if previous else {}
+
+    return {
+        term: marker
+        for term in terms
+        if (marker := get_term_marker(term)) != markers.get(term.id)
+    }
+
+
+def is_snapshot_stale() -> bool:
+    manifest = _read_manifest(settings.SNAPSHOT_ROOT)
+    if manifest is None:
+        return True
+
+    if manifest["generation"] == get_data_generation():
+        return False
+
+    terms = list(Term.objects.all())
+    return {term.id for term in terms} != set(manifest["terms"]) or bool(
+        _stale_terms(terms, manifest)
+    )
+
+
+def write_snapshots(terms: Optional[list[Term]] = None) -> dict[str, Any]:
+    # Without a list of terms, every term is snapshotted, but only those whose
+    # rows changed since the last manifest are written again.
+    root = settings.SNAPSHOT_ROOT
+    os.makedirs(root, exist_ok=True)
+
+    generation = get_data_generation()
+    previous = _read_manifest(root)
+
+    manifest = {
+        # A partial snapshot leaves the other terms as old as they were
+        "generation": (
+            generation if not terms else previous and previous["generation"]
+        ),
+        "generated_at": timezone.now().isoformat(),
+        "terms": {},
+        "markers": {},
+    }
+
+    if terms:
+        # Snapshotting a few terms keeps the others from the last manifest
+        if previous:
+            manifest["terms"].update(previous["terms"])
+            manifest["markers"].update(previous.get("markers", {}))
+
+        stale = {term: get_term_marker(term) for term in terms}
+    else:
+        all_terms = list(Term.objects.all())
+        stale = _stale_terms(all_terms, previous)
+
+        # Terms no longer in the database drop out of the manifest
+        for term in all_terms:
+            if term not in stale:
+                manifest["terms"][term.id] = previous["terms"][term.id]
+                manifest["markers"][term.id] = previous["markers"][term.id]
+
+        log.info(
+            "Snapshots of %s of %s terms are up to date.",
+            len(all_terms) - len(stale),
+            len(all_terms),
+        )
+
+    for term, marker in stale.items():
+        directory = os.path.join(root, slugify(term.id))
+        os.makedirs(directory, exist_ok=True)
+
+        manifest["terms"][term.id] = {
+            name: _write_dataset(directory, name, rows())
+            for name, rows in _term_datasets(term).items()
+        }
+        manifest["markers"][term.id] = marker
+        log.info("Wrote snapshots for %s.", term.id)
+
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    # Files from the previous manifest are kept, as clients may still be
+    # reading them.
+    keep = _manifest_paths(manifest) | _manifest_paths(previous)
+    for directory, _, file_names in os.walk(root):
+        for file_name in file_names:
+            path = os.path.relpath(os.path.join(directory, file_name), root)
+            if ".ndjson." in file_name and path not in keep:
+                os.remove(os.path.join(directory, file_name))
+
+    return manifest
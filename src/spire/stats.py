@@ -0,0 +1,165 @@
+from hashlib import md5
+from typing import Any, Optional
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from spire.generation import get_data_generation
+from spire.models import SectionAvailability
+
+STATS_PERCENTILES = [10, 25, 50, 75, 90]
+
+STATS_CACHE_PREFIX = "spireapi.stats"
+
+# Terms without sections are cached as None, which cache.get can't tell apart
+# from a miss
+_MISSING = object()
+
+
+def _load_columns(term_id: str) -> Optional[dict[str, np.ndarray]]:
+    rows = list(
+        SectionAvailability.objects.filter(
+            section__offering__term_id=term_id
+        ).values_list(
+            "section__offering__subject_id",
+            "section__offering__course_id",
+            "capacity",
+            "enrollment_total",
+            "wait_list_total",
+        )
+    )
+
+    if not rows:
+        return None
+
+    subjects, courses, capacity, enrollment, wait_list = zip(*rows)
+
+    return {
+        "subject": np.array(subjects),
+        "course": np.array(courses),
+        "capacity": np.array(capacity, dtype=np.int64),
+        "enrollment": np.array(enrollment, dtype=np.int64),
+        "wait_list": np.array(wait_list, dtype=np.int64),
+    }
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    # Sections without seats have no meaningful rate, and come out as NaN
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def _grouped_percentiles(
+    inverse: np.ndarray, counts: np.ndarray, values: np.ndarray
+) -> np.ndarray:
+    # Values are sorted within their group, so each percentile is interpolated
+    # between two positions in every group at once, as np.percentile would.
+    ordered = values[np.lexsort((values, inverse))].astype(np.float64)
+    starts = np.cumsum(counts) - counts
+
+    positions = starts[:, None] + (counts[:, None] - 1) * (
+        np.array(STATS_PERCENTILES) / 100
+    )
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (positions - lower)
+
+
+def _to_json(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def _percentiles(values) -> dict[str, Optional[float]]:
+    return dict(zip(map(str, STATS_PERCENTILES), map(_to_json, values)))
+
+
+def _rate(numerator: float, denominator: float) -> Optional[float]:
+    return round(float(numerator / denominator), 4) if denominator else None
+
+
+def _summary(
+    sections: int, capacity: int, enrollment: int, wait_list: int, full: int
+) -> dict[str, Any]:
+    return {
+        "sections": int(sections),
+        "capacity": int(capacity),
+        "enrollment_total": int(enrollment),
+        "wait_list_total": int(wait_list),
+        "full_sections": int(full),
+        "fill_rate": _rate(enrollment, capacity),
+        "wait_list_ratio": _rate(wait_list, capacity),
+    }
+
+
+def _group_stats(keys: np.ndarray, columns: dict[str, np.ndarray]) -> dict[str, Any]:
+    labels, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+    def total(values: np.ndarray) -> np.ndarray:
+        return np.bincount(inverse, weights=values, minlength=len(labels))
+
+    capacity = total(columns["capacity"])
+    enrollment = total(columns["enrollment"])
+    wait_list = total(columns["wait_list"])
+    full = total(columns["full"])
+    percentiles = _grouped_percentiles(inverse, counts, columns["capacity"])
+
+    return {
+        str(label): {
+            **_summary(counts[i], capacity[i], enrollment[i], wait_list[i], full[i]),
+            "capacity_percentiles": _percentiles(percentiles[i]),
+        }
+        for i, label in enumerate(labels)
+    }
+
+
+def compute_term_stats(term_id: str) -> Optional[dict[str, Any]]:
+    columns = _load_columns(term_id)
+    if columns is None:
+        return None
+
+    capacity = columns["capacity"]
+    enrollment = columns["enrollment"]
+    columns["full"] = (capacity > 0) & (enrollment >= capacity)
+
+    fill_rates = _ratio(enrollment, capacity)
+    has_seats = ~np.isnan(fill_rates)
+
+    return {
+        "term": term_id,
+        "summary": {
+            **_summary(
+                len(capacity),
+                capacity.sum(),
+                enrollment.sum(),
+                columns["wait_list"].sum(),
+                columns["full"].sum(),
+            ),
+            "capacity_percentiles": _percentiles(
+                np.percentile(capacity, STATS_PERCENTILES)
+            ),
+            "fill_rate_percentiles": _percentiles(
+                np.percentile(fill_rates[has_seats], STATS_PERCENTILES)
+                if has_seats.any()
+                else [np.nan] * len(STATS_PERCENTILES)
+            ),
+        },
+        "subjects": _group_stats(columns["subject"], columns),
+        "courses": _group_stats(columns["course"], columns),
+    }
+
+
+def get_term_stats(term_id: str) -> Optional[dict[str, Any]]:
+    # Stats only change with a scrape, so they're computed once per data
+    # generation and shared between workers. Term ids have spaces, which
+    # memcached can't take in a key.
+    digest = md5(term_id.encode(), usedforsecurity=False).hexdigest()
+    key = f"{STATS_CACHE_PREFIX}.{get_data_generation()}.{digest}"
+
+    stats = cache.get(key, _MISSING)
+    if stats is _MISSING:
+        stats = compute_term_stats(term_id)
+        cache.set(key, stats, settings.CACHE_MIDDLEWARE_SECONDS)
+
+    return stats
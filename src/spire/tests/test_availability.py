@@ -0,0 +1,88 @@
+from spire.availability import AVAILABILITY_FIELD_NAMES
+from spire.models import SectionAvailability, SectionCombinedCapacity
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class AvailabilityTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        course = create_course()
+        fall = create_offering(course, create_term("Fall", 2023))
+        spring = create_offering(course, create_term("Spring", 2024))
+
+        cls.open = create_section(fall, "01-LEC(10001)")
+        cls.closed = create_section(fall, "02-LEC(10002)", "Closed", 0)
+        cls.spring = create_section(spring, "01-LEC(10001)")
+
+        capacity = SectionCombinedCapacity.objects.create(
+            capacity=80, wait_list_capacity=20
+        )
+        SectionAvailability.objects.filter(section=cls.closed).update(
+            combined_capacity=capacity
+        )
+        cls.capacity = capacity
+
+    def _get(self, **params) -> dict:
+        response = self.client.get("/availability/", params)
+        self.assertEqual(response.status_code, 200)
+
+        body = response.json()
+        self.assertEqual(body["fields"], AVAILABILITY_FIELD_NAMES)
+
+        return body
+
+    def _rows(self, **params) -> list[dict]:
+        body = self._get(**params)
+        return [dict(zip(body["fields"], row)) for row in body["rows"]]
+
+    def test_term(self):
+        self.assertEqual(
+            [row["section"] for row in self._rows(term="Fall 2023")],
+            [self.open.id, self.closed.id],
+        )
+
+    def test_sections(self):
+        self.assertEqual(
+            [
+                row["section"]
+                for row in self._rows(sections=f"{self.spring.id},{self.open.id}")
+            ],
+            [self.open.id, self.spring.id],
+        )
+        self.assertEqual(self._rows(term="Spring 2024", sections=str(self.open.id)), [])
+
+    def test_rows(self):
+        open, closed = self._rows(term="Fall 2023")
+
+        self.assertEqual(
+            open,
+            {
+                "section": self.open.id,
+                "status": "Open",
+                "capacity": 40,
+                "enrollment_total": 30,
+                "available_seats": 10,
+                "wait_list_capacity": 10,
+                "wait_list_total": 0,
+                "combined_capacity": None,
+                "combined_capacity_capacity": None,
+                "combined_capacity_wait_list_capacity": None,
+            },
+        )
+        self.assertEqual(closed["status"], "Closed")
+        self.assertEqual(closed["available_seats"], 0)
+        self.assertEqual(closed["combined_capacity"], self.capacity.id)
+        self.assertEqual(closed["combined_capacity_capacity"], 80)
+        self.assertEqual(closed["combined_capacity_wait_list_capacity"], 20)
+
+    def test_filter_is_required(self):
+        self.assertEqual(self.client.get("/availability/").status_code, 400)
+        self.assertEqual(
+            self.client.get("/availability/", {"sections": "x"}).status_code, 400
+        )
@@ -0,0 +1,114 @@
+from datetime import date, time
+
+from spire.models import SectionMeetingDates, TermEvent
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class CalendarTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Fall 2023 runs from Tuesday, September 5 to December 12
+        term = create_term()
+        for day, description in [
+            (date(2023, 10, 9), "Holiday - Indigenous Peoples' Day (no classes)"),
+            (date(2023, 10, 10), "Monday class schedule will be followed"),
+            (date(2023, 11, 21), "Thanksgiving recess begins after last class"),
+            (date(2023, 11, 27), "Classes resume"),
+        ]:
+            TermEvent.objects.create(term=term, date=day, description=description)
+
+        offering = create_offering(create_course(), term)
+
+        cls.lecture = create_section(offering, "01-LEC(10001)")
+        create_meeting(
+            cls.lecture,
+            ["Monday", "Wednesday"],
+            time(9),
+            time(9, 50),
+            room="Lederle Graduate Research Center A301",
+        )
+
+        # Meets for the first and last few weeks, but not in October
+        cls.split = create_section(offering, "02-LAB(10002)")
+        meeting = create_meeting(
+            cls.split,
+            ["Monday"],
+            time(14),
+            time(15, 15),
+            dates=(date(2023, 9, 5), date(2023, 9, 30)),
+        )
+        SectionMeetingDates.objects.create(
+            meeting_information=meeting, start=date(2023, 11, 1), end=date(2023, 12, 12)
+        )
+
+    def _calendar(self, url: str) -> list[str]:
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+
+        return response.content.decode().replace("\r\n ", "").split("\r\n")
+
+    def _events(self, lines: list[str]) -> list[list[str]]:
+        events = []
+        for line in lines:
+            if line == "BEGIN:VEVENT":
+                events.append([])
+            elif events and line != "END:VEVENT":
+                events[-1].append(line)
+
+        return events
+
+    def test_time_zone_is_described(self):
+        lines = self._calendar(f"/sections/{self.lecture.id}/calendar.ics")
+
+        zone = lines.index("BEGIN:VTIMEZONE")
+        self.assertLess(zone, lines.index("BEGIN:VEVENT"))
+        self.assertEqual(lines[zone + 1], "TZID:America/New_York")
+        self.assertIn("RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU", lines)
+        self.assertIn("RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU", lines)
+
+    def test_weekly_meetings(self):
+        lines = self._calendar(f"/sections/{self.lecture.id}/calendar.ics")
+        weekly, substituted = self._events(lines)
+
+        self.assertIn("DTSTART;TZID=America/New_York:20230906T090000", weekly)
+        self.assertIn("DTEND;TZID=America/New_York:20230906T095000", weekly)
+        self.assertIn("RRULE:FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20231213T045959Z", weekly)
+        self.assertIn("LOCATION:Lederle Graduate Research Center A301", weekly)
+
+        # The holiday, and the Wednesday of the recess
+        self.assertIn(
+            "EXDATE;TZID=America/New_York:20231009T090000,20231122T090000", weekly
+        )
+
+        # Tuesday follows Monday's schedule
+        self.assertIn("DTSTART;TZID=America/New_York:20231010T090000", substituted)
+        self.assertFalse(any(line.startswith("RRULE") for line in substituted))
+
+    def test_separate_date_ranges(self):
+        lines = self._calendar(f"/sections/{self.split.id}/calendar.ics")
+        september, rest = self._events(lines)
+
+        self.assertIn("DTSTART;TZID=America/New_York:20230911T140000", september)
+        self.assertIn("RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20231001T035959Z", september)
+
+        self.assertIn("DTSTART;TZID=America/New_York:20231106T140000", rest)
+        self.assertIn("RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20231213T045959Z", rest)
+
+        uids = [line for event in (september, rest) for line in event if "UID" in line]
+        self.assertEqual(len(set(uids)), 2)
+
+    def test_schedule_calendar(self):
+        lines = self._calendar(
+            f"/schedules/calendar.ics?sections={self.lecture.id},{self.split.id}"
+        )
+
+        self.assertEqual(lines.count("BEGIN:VTIMEZONE"), 1)
+        self.assertEqual(len(self._events(lines)), 4)
@@ -0,0 +1,117 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import override_settings
+from django.utils import timezone
+
+from spire.models import Course, CourseOffering, Section
+from spire.outbox import record_deletions
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+@override_settings(CHANGES_SETTLE_SECONDS=60, CHANGE_EVENT_RETENTION_DAYS=30)
+class ChangesTests(SpireTestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = timezone.now()
+
+        offering = create_offering(create_course(), create_term())
+        self.sections = [
+            create_section(offering, f"0{i}-LEC(1000{i})") for i in range(1, 4)
+        ]
+
+        # Everything so far was written well before the settle window
+        Course.objects.update(_updated_at=self.now - timedelta(minutes=10))
+        CourseOffering.objects.update(_updated_at=self.now - timedelta(minutes=10))
+        Section.objects.update(_updated_at=self.now - timedelta(minutes=10))
+
+    def _changes(self, **params):
+        response = self.client.get("/changes/", params)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        return response.json()
+
+    def _since(self, ago: timedelta) -> str:
+        return (self.now - ago).isoformat()
+
+    def _listed(self, body) -> list[tuple[str, bool]]:
+        return [(change["kind"], change["deleted"]) for change in body["results"]]
+
+    def test_lists_changes_since(self):
+        body = self._changes(since=self._since(timedelta(hours=1)))
+
+        self.assertEqual(
+            self._listed(body),
+            [("course", False), ("offering", False)] + [("section", False)] * 3,
+        )
+        self.assertIsNone(body["next"])
+
+    def test_nothing_before_since(self):
+        body = self._changes(since=self._since(timedelta(minutes=5)))
+        self.assertEqual(body["results"], [])
+
+    def test_window_stops_short_of_now(self):
+        # Written within the settle window, as by a scrape still in progress
+        Section.objects.filter(id=self.sections[0].id).update(_updated_at=self.now)
+
+        body = self._changes(since=self._since(timedelta(minutes=5)))
+
+        self.assertEqual(body["results"], [])
+        self.assertLessEqual(
+            timezone.datetime.fromisoformat(body["until"].replace("Z", "+00:00")),
+            timezone.now() - timedelta(seconds=60),
+        )
+
+    def test_old_since_is_rejected(self):
+        response = self.client.get(
+            "/changes/", {"since": self._since(timedelta(days=31))}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.json())
+
+    def test_since_is_required(self):
+        self.assertEqual(self.client.get("/changes/").status_code, 400)
+        self.assertEqual(
+            self.client.get("/changes/", {"token": "nonsense"}).status_code, 400
+        )
+
+    def test_deletions_are_listed_from_change_events(self):
+        deleted_id = self.sections[0].id
+        record_deletions([("section", deleted_id)])
+        self.sections[0].delete()
+
+        with mock.patch(
+            "spire.views.timezone.now", return_value=self.now + timedelta(minutes=2)
+        ):
+            body = self._changes(since=self._since(timedelta(minutes=5)))
+
+        self.assertEqual(
+            body["results"],
+            [{"kind": "section", "id": deleted_id, "deleted": True}],
+        )
+
+    def test_pages_keep_their_window(self):
+        since = self._since(timedelta(hours=1))
+
+        with mock.patch("spire.changes.CHANGES_PAGE_SIZE", 2):
+            first = self._changes(since=since)
+            # Written after the first page, so outside its window
+            create_section(self.sections[0].offering, "04-LEC(10004)")
+
+            listed = self._listed(first)
+            body = first
+            while body["next"]:
+                body = self.client.get(body["next"]).json()
+                self.assertEqual(body["until"], first["until"])
+                listed += self._listed(body)
+
+        self.assertEqual(
+            listed, [("course", False), ("offering", False)] + [("section", False)] * 3
+        )
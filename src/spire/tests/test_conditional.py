@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils.http import http_date
+
+from spire.models import Course
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class ConditionalTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        term = create_term()
+        for number in ["121", "187"]:
+            create_section(
+                create_offering(create_course(number=number), term), "01-LEC(10001)"
+            )
+
+    def _assert_not_modified(self, url: str, queries: int):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+
+        # Pages are cached until the data generation is bumped, so the cache is
+        # cleared to reach the view
+        cache.clear()
+        with self.assertNumQueries(queries):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+        cache.clear()
+        cached = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_course_list(self):
+        # A page of validators and its count, without the query plan
+        self._assert_not_modified("/courses/", 3)
+
+    def test_course(self):
+        self._assert_not_modified("/courses/COMPSCI 121/", 1)
+
+    def test_courses_by_id(self):
+        self._assert_not_modified("/courses/?ids=COMPSCI 121,COMPSCI 187", 1)
+
+    def test_sections(self):
+        self._assert_not_modified("/sections/", 3)
+
+    def test_changed_course(self):
+        response = self.client.get("/courses/")
+
+        course = Course.objects.get(id="COMPSCI 187")
+        course._updated_at += timedelta(seconds=1)
+        course.save()
+        cache.clear()
+
+        self.assertEqual(
+            self.client.get(
+                "/courses/", HTTP_IF_NONE_MATCH=response["ETag"]
+            ).status_code,
+            200,
+        )
+        cache.clear()
+        self.assertEqual(
+            self.client.get(
+                "/courses/",
+                HTTP_IF_MODIFIED_SINCE=http_date(
+                    (course._updated_at - timedelta(seconds=1)).timestamp()
+                ),
+            ).status_code,
+            200,
+        )
@@ -0,0 +1,65 @@
+from spire.documents import build_pushed_section_documents
+from spire.models import SectionAvailability, SectionCombinedCapacity, SectionDocument
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class PushedSectionDocumentTests(SpireTestCase):
+    def setUp(self):
+        super().setUp()
+        offering = create_offering(create_course(), create_term())
+
+        self.lecture = create_section(offering, "01-LEC(10001)")
+        self.combined = create_section(offering, "02-LEC(10002)")
+        self.other = create_section(offering, "03-LEC(10003)")
+
+        capacity = SectionCombinedCapacity.objects.create(
+            capacity=80, wait_list_capacity=20
+        )
+        SectionAvailability.objects.filter(
+            section__in=[self.lecture, self.combined]
+        ).update(combined_capacity=capacity)
+
+    def _documented(self) -> list[int]:
+        return list(SectionDocument.objects.values_list("section_id", flat=True))
+
+    def _enrollments(self, section) -> list[int]:
+        document = SectionDocument.objects.get(section=section).document
+        return [
+            availability["enrollment_total"]
+            for availability in document["availability"]["combined_capacity"][
+                "individual_availabilities"
+            ]
+        ]
+
+    def test_sections_with_a_combined_capacity_are_rebuilt_together(self):
+        self.assertEqual(build_pushed_section_documents(self.lecture), 2)
+        self.assertEqual(self._documented(), [self.lecture.id, self.combined.id])
+
+        SectionAvailability.objects.filter(section=self.lecture).update(
+            enrollment_total=35
+        )
+        build_pushed_section_documents(self.lecture)
+
+        self.assertEqual(self._enrollments(self.combined), [35, 30])
+
+    def test_other_sections_are_left_alone(self):
+        self.assertEqual(build_pushed_section_documents(self.other), 1)
+        self.assertEqual(self._documented(), [self.other.id])
+
+    def test_documents_are_served(self):
+        build_pushed_section_documents(self.other)
+
+        document = SectionDocument.objects.get(section=self.other)
+        document.document["description"] = "From the document"
+        document.save()
+
+        response = self.client.get(f"/sections/{self.other.id}/")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(response.json()["description"], "From the document")
@@ -0,0 +1,52 @@
+import json
+
+from spire.documents import build_section_documents
+from spire.models import Section
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class ExportTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        course = create_course()
+        fall = create_offering(course, create_term("Fall", 2023))
+        spring = create_offering(course, create_term("Spring", 2024))
+
+        create_section(fall, "01-LEC(10001)")
+        create_section(fall, "02-LEC(10002)")
+        create_section(spring, "01-LEC(10003)")
+
+        # One section is left without a document
+        build_section_documents(Section.objects.exclude(spire_id="02-LEC(10002)"))
+
+    def _export(self, term: str, **params) -> list[dict]:
+        response = self.client.get(f"/terms/{term}/export.ndjson", params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        content = b"".join(response.streaming_content).decode()
+        self.assertTrue(content.endswith("\n"))
+
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_one_line_per_section(self):
+        sections = self._export("Fall 2023")
+
+        self.assertEqual(
+            sorted(section["spire_id"] for section in sections),
+            ["01-LEC(10001)", "02-LEC(10002)"],
+        )
+        self.assertEqual(
+            self._export("Fall 2023", fields="spire_id")[0].keys(), {"spire_id"}
+        )
+
+    def test_missing_term(self):
+        self.assertEqual(
+            self.client.get("/terms/Fall 1999/export.ndjson").status_code, 404
+        )
@@ -0,0 +1,103 @@
+from datetime import time
+
+from spire.models import Instructor
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class SectionFilterTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        offering = create_offering(create_course(), create_term())
+
+        # Meets early on Mondays and late on Fridays, in different rooms with
+        # different instructors
+        cls.split = create_section(offering, "01-LEC(10001)")
+        create_meeting(
+            cls.split,
+            ["Monday"],
+            time(8),
+            time(8, 50),
+            room="Lederle Graduate Research Center A301",
+            instructor="Jane Doe",
+        )
+        create_meeting(
+            cls.split,
+            ["Friday"],
+            time(15),
+            time(16, 15),
+            room="Integrated Learning Center S131",
+            instructor="John Roe",
+        )
+
+        cls.late = create_section(
+            offering, "02-LEC(10002)", status="Closed", available_seats=0
+        )
+        create_meeting(
+            cls.late,
+            ["Monday", "Wednesday"],
+            time(16),
+            time(17, 15),
+            room="Integrated Learning Center S131",
+            instructor="Jane Doe",
+        )
+
+        create_section(offering, "03-LEC(10003)")
+
+    def _filter(self, **params) -> list[str]:
+        response = self.client.get("/sections/", params)
+        self.assertEqual(response.status_code, 200)
+
+        return sorted(section["spire_id"] for section in response.json()["results"])
+
+    def _id(self, name: str) -> int:
+        return Instructor.objects.get(name=name).id
+
+    def test_day(self):
+        self.assertEqual(
+            self._filter(day="Monday"), [self.split.spire_id, self.late.spire_id]
+        )
+        self.assertEqual(self._filter(day="Friday"), [self.split.spire_id])
+        self.assertEqual(self._filter(day="Sunday"), [])
+
+    def test_times(self):
+        self.assertEqual(
+            self._filter(starts_after="15:00"),
+            [self.split.spire_id, self.late.spire_id],
+        )
+        self.assertEqual(self._filter(ends_before="09:00"), [self.split.spire_id])
+
+    def test_meeting_filters_match_the_same_meeting(self):
+        # The split section meets on Monday and after 15:00, but not both at once
+        self.assertEqual(
+            self._filter(day="Monday", starts_after="15:00"), [self.late.spire_id]
+        )
+        self.assertEqual(self._filter(day="Friday", ends_before="09:00"), [])
+        self.assertEqual(
+            self._filter(day="Friday", instructor=self._id("John Roe")),
+            [self.split.spire_id],
+        )
+        self.assertEqual(
+            self._filter(day="Friday", instructor=self._id("Jane Doe")), []
+        )
+
+    def test_sections_with_several_matches_are_listed_once(self):
+        self.assertEqual(
+            self._filter(instructor=self._id("Jane Doe")),
+            [self.split.spire_id, self.late.spire_id],
+        )
+
+    def test_status_and_open(self):
+        self.assertEqual(self._filter(status="Closed"), [self.late.spire_id])
+        self.assertNotIn(self.late.spire_id, self._filter(open="true"))
+        self.assertEqual(self._filter(open="false"), [self.late.spire_id])
+
+    def test_invalid_day(self):
+        response = self.client.get("/sections/", {"day": "Someday"})
+        self.assertEqual(response.status_code, 400)
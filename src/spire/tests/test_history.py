@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import SimpleTestCase
+
+from spire.history import downsample, record_availability_history
+from spire.models import SectionAvailability, SectionAvailabilityHistory
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+START = datetime(2023, 9, 1, tzinfo=timezone.utc)
+
+
+def _rows(*offsets: int) -> list[tuple]:
+    return [(START + timedelta(hours=h), i) for i, h in enumerate(offsets)]
+
+
+class DownsampleTests(SimpleTestCase):
+    def test_few_rows_are_kept(self):
+        rows = _rows(0, 1, 2)
+        self.assertEqual(downsample(rows, 3), rows)
+
+    def test_buckets_keep_their_last_row(self):
+        rows = _rows(0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
+        self.assertEqual(
+            [value for _, value in downsample(rows, 3)],
+            # The first row, then the ends of the two halves
+            [0, 4, 10],
+        )
+
+    def test_first_and_last_rows_are_kept(self):
+        rows = _rows(0, 1, 2, 50, 98, 99, 100)
+        sampled = downsample(rows, 4)
+
+        self.assertEqual(sampled[0], rows[0])
+        self.assertEqual(sampled[-1], rows[-1])
+        self.assertLessEqual(len(sampled), 4)
+
+    def test_rows_at_the_same_time(self):
+        rows = _rows(0, 0, 0, 0)
+        self.assertEqual(downsample(rows, 2), rows[-1:])
+
+
+class AvailabilityHistoryTests(SpireTestCase):
+    def setUp(self):
+        super().setUp()
+
+        offering = create_offering(create_course(), create_term())
+        self.section = create_section(offering, "01-LEC(10001)")
+        self.availability = SectionAvailability.objects.get(section=self.section)
+
+    def _record(self, **values):
+        for name, value in values.items():
+            setattr(self.availability, name, value)
+
+        record_availability_history(self.section, self.availability)
+
+    def test_only_changes_are_recorded(self):
+        self._record()
+        self._record()
+        self._record(enrollment_total=31, available_seats=9)
+        self._record(enrollment_total=31, available_seats=9)
+
+        self.assertEqual(
+            list(
+                SectionAvailabilityHistory.objects.values_list(
+                    "enrollment_total", flat=True
+                )
+            ),
+            [30, 31],
+        )
+
+    def test_history(self):
+        for hour, enrollment in enumerate([30, 32, 35, 40]):
+            SectionAvailabilityHistory.objects.create(
+                section=self.section,
+                term_id=self.section.offering.term_id,
+                recorded_at=START + timedelta(hours=hour),
+                capacity=40,
+                enrollment_total=enrollment,
+                available_seats=40 - enrollment,
+                wait_list_total=0,
+            )
+
+        url = f"/sections/{self.section.id}/availability-history/"
+        body = self.client.get(url, {"points": 2}).json()
+
+        self.assertEqual(
+            body["fields"],
+            [
+                "recorded_at",
+                "capacity",
+                "enrollment_total",
+                "available_seats",
+                "wait_list_total",
+            ],
+        )
+        self.assertEqual([row[2] for row in body["rows"]], [30, 40])
+
+        self.assertEqual(len(self.client.get(url).json()["rows"]), 4)
+        self.assertEqual(self.client.get(url, {"points": 1}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"points": "x"}).status_code, 400)
+        self.assertEqual(
+            self.client.get("/sections/0/availability-history/").status_code, 404
+        )
@@ -0,0 +1,68 @@
+from django.test import override_settings
+
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class MultiGetTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        term = create_term()
+        for number in ["121", "186", "187"]:
+            offering = create_offering(create_course(number=number), term)
+            create_section(offering, f"01-LEC({number})")
+
+        cls.sections = {
+            section.spire_id: section.id
+            for section in offering.course.offerings.get().sections.all()
+        }
+
+    def _get(self, url: str, ids: str):
+        return self.client.get(url, {"ids": ids})
+
+    def test_requested_order(self):
+        response = self._get("/courses/", "COMPSCI 187,COMPSCI 121")
+        self.assertEqual(response.status_code, 200)
+
+        # Unpaginated, in the order asked for
+        self.assertEqual(
+            [course["id"] for course in response.json()],
+            ["COMPSCI 187", "COMPSCI 121"],
+        )
+
+    def test_missing_and_repeated_ids_are_skipped(self):
+        response = self._get(
+            "/courses/", "COMPSCI 186, COMPSCI 999,COMPSCI 186,,COMPSCI 121"
+        )
+
+        self.assertEqual(
+            [course["id"] for course in response.json()],
+            ["COMPSCI 186", "COMPSCI 121"],
+        )
+
+    def test_sections(self):
+        ids = list(self.sections.values())
+        response = self._get("/sections/", f"{ids[0]},0")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [section["spire_id"] for section in response.json()], ["01-LEC(187)"]
+        )
+
+    @override_settings(MULTI_GET_MAX_IDS=2)
+    def test_too_many_ids(self):
+        response = self._get("/courses/", "COMPSCI 121,COMPSCI 186,COMPSCI 187")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"ids": "At most 2 ids may be requested at once."}
+        )
+
+    def test_invalid_ids(self):
+        self.assertEqual(self._get("/courses/", " , ").status_code, 400)
+        self.assertEqual(self._get("/sections/", "1,x").status_code, 400)
@@ -0,0 +1,117 @@
+from datetime import time
+
+from spire.models import Building, BuildingRoom, Section
+from spire.occupancy import _occupancy, rebuild_term_occupancy
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class OccupancyTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        offering = create_offering(create_course(), create_term())
+
+        create_meeting(
+            create_section(offering, "01-LEC(10001)"),
+            ["Monday", "Wednesday"],
+            time(9),
+            time(9, 50),
+            room="Lederle Graduate Research Center A301",
+        )
+        create_meeting(
+            create_section(offering, "02-LEC(10002)"),
+            ["Tuesday"],
+            time(13),
+            time(14, 15),
+            room="Lederle Graduate Research Center A201",
+        )
+
+        cls.building = Building.objects.get()
+        cls.a301 = BuildingRoom.objects.get(number="A301")
+        cls.a201 = BuildingRoom.objects.get(number="A201")
+        cls.empty = BuildingRoom.objects.create(building=cls.building, number="A101")
+
+        rebuild_term_occupancy("Fall 2023")
+
+    def setUp(self):
+        super().setUp()
+        _occupancy.clear()
+
+    def _free_rooms(self, **params) -> list[str]:
+        response = self.client.get(
+            f"/buildings/{self.building.id}/free-rooms/",
+            {"term": "Fall 2023", **params},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        return sorted(room["number"] for room in response.json())
+
+    def test_occupancy(self):
+        response = self.client.get(
+            f"/building-rooms/{self.a301.id}/occupancy/", {"term": "Fall 2023"}
+        )
+
+        self.assertEqual(
+            response.json(),
+            {
+                "term": "Fall 2023",
+                "occupied": [
+                    {"day": day, "start_time": "09:00:00", "end_time": "09:50:00"}
+                    for day in ["Monday", "Wednesday"]
+                ],
+            },
+        )
+
+        response = self.client.get(
+            f"/building-rooms/{self.empty.id}/occupancy/", {"term": "Fall 2023"}
+        )
+        self.assertEqual(response.json()["occupied"], [])
+
+    def test_free_rooms(self):
+        self.assertEqual(
+            self._free_rooms(days="Monday", start_time="09:30", end_time="11:00"),
+            ["A101", "A201"],
+        )
+        self.assertEqual(
+            self._free_rooms(
+                days="Monday,Tuesday", start_time="9:00", end_time="14:00"
+            ),
+            ["A101"],
+        )
+        self.assertEqual(
+            self._free_rooms(days="Friday", start_time="09:00", end_time="17:00"),
+            ["A101", "A201", "A301"],
+        )
+
+    def test_rebuilt_after_changes(self):
+        Section.objects.filter(spire_id="01-LEC(10001)").delete()
+        rebuild_term_occupancy("Fall 2023")
+
+        self.assertEqual(
+            self._free_rooms(days="Monday", start_time="09:00", end_time="10:00"),
+            ["A101", "A201", "A301"],
+        )
+
+    def test_invalid_requests(self):
+        url = f"/buildings/{self.building.id}/free-rooms/"
+
+        for params in [
+            {"days": "Monday", "start_time": "09:00", "end_time": "10:00"},
+            {"term": "Fall 1999", "days": "Monday"},
+            {"term": "Fall 2023", "days": "Someday"},
+            {"term": "Fall 2023", "days": "Monday", "start_time": "10:00"},
+            {
+                "term": "Fall 2023",
+                "days": "Monday",
+                "start_time": "10:00",
+                "end_time": "09:00",
+            },
+        ]:
+            with self.subTest(**params):
+                self.assertEqual(self.client.get(url, params).status_code, 400)
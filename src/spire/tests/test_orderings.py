@@ -0,0 +1,96 @@
+import json
+from datetime import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from spire.models import AcademicGroup, SectionCoverage
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+LIST_ENDPOINTS = [
+    "/buildings/",
+    "/building-rooms/",
+    "/terms/",
+    "/academic-groups/",
+    "/subjects/",
+    "/courses/",
+    "/course-offerings/",
+    "/instructors/",
+    "/sections/",
+    "/coverage/",
+]
+
+SORT_NODES = {"Sort", "Incremental Sort"}
+JOIN_NODES = {"Nested Loop", "Hash Join", "Merge Join"}
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _sorts_across_joins(plan) -> bool:
+    return any(
+        node["Node Type"] in SORT_NODES
+        and any(n["Node Type"] in JOIN_NODES for n in _plan_nodes(node))
+        for node in _plan_nodes(plan)
+    )
+
+
+class ListOrderingTests(SpireTestCase):
+    # Default orderings are meant to be on local columns, read off an index.
+    # With sorting discouraged, the planner only sorts rows it has joined when
+    # the order is taken from a joined table.
+    @classmethod
+    def setUpTestData(cls):
+        AcademicGroup.objects.create(title="College of Information")
+        courses = [create_course(number="121"), create_course(number="187")]
+
+        for term in [create_term("Fall", 2023), create_term("Spring", 2024)]:
+            SectionCoverage.objects.create(term=term, completed=True)
+
+            for course in courses:
+                section = create_section(create_offering(course, term), "01-LEC(12345)")
+                create_meeting(
+                    section,
+                    ["Monday", "Wednesday"],
+                    time(9),
+                    time(9, 50),
+                    room="Lederle Graduate Research Center A301",
+                    instructor="Jane Doe",
+                )
+
+    def _get_page_query(self, url: str) -> str:
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200, url)
+
+        pages = [q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"]]
+        self.assertTrue(pages, url)
+
+        return pages[0]
+
+    def test_list_endpoints_do_not_sort_across_joins(self):
+        for url in LIST_ENDPOINTS:
+            with self.subTest(url=url):
+                sql = self._get_page_query(url)
+
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_sort = off")
+                    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+                    (plan,) = cursor.fetchone()[0]
+                    cursor.execute("RESET enable_sort")
+
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+
+                self.assertFalse(_sorts_across_joins(plan["Plan"]), sql)
@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.core.paginator import EmptyPage
+from django.db.models import Count
+
+from spire.models import Course
+from spire.pagination import EstimatedCountPaginator, _estimate_count
+from spire.tests.utils import SpireTestCase, create_course
+
+
+class EstimatedCountPaginatorTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for number in range(100, 105):
+            create_course(number=str(number))
+
+    def setUp(self):
+        super().setUp()
+
+        # An estimate well under the five courses there are
+        patcher = mock.patch("spire.pagination._estimate_count", return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.paginator = EstimatedCountPaginator(Course.objects.order_by("id"), 2)
+
+    def _ids(self, page) -> list[str]:
+        return [course.id for course in page]
+
+    def test_count_is_the_estimate(self):
+        self.assertEqual(self.paginator.count, 2)
+
+    def test_pages_past_the_estimate_are_served(self):
+        page = self.paginator.page(3)
+
+        self.assertEqual(self._ids(page), ["COMPSCI 104"])
+        self.assertFalse(page.has_next())
+
+    def test_next_page_is_found_by_its_rows(self):
+        self.assertTrue(self.paginator.page(1).has_next())
+        self.assertTrue(self.paginator.page(2).has_next())
+
+    def test_page_past_the_rows(self):
+        with self.assertRaises(EmptyPage):
+            self.paginator.page(4)
+
+    def test_empty_first_page(self):
+        paginator = EstimatedCountPaginator(Course.objects.none(), 2)
+        self.assertEqual(list(paginator.page(1)), [])
+
+    def test_list_links_past_the_estimate(self):
+        with mock.patch("rest_framework.pagination.PageNumberPagination.page_size", 2):
+            body = self.client.get("/courses/", {"page": 2}).json()
+
+        self.assertEqual(body["count"], 2)
+        self.assertIsNotNone(body["next"])
+        self.assertEqual(
+            [course["id"] for course in body["results"]],
+            ["COMPSCI 102", "COMPSCI 103"],
+        )
+
+
+class EstimateCountTests(SpireTestCase):
+    def test_grouped_queries_are_counted(self):
+        grouped = Course.objects.values("subject").annotate(count=Count("id"))
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(_estimate_count(grouped))
@@ -0,0 +1,85 @@
+from datetime import time
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from spire.documents import build_section_documents
+from spire.generation import get_data_generation
+from spire.models import Section
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+# Queries per page of each list endpoint, which shouldn't grow with the page
+LIST_QUERY_COUNTS = {
+    "/buildings/": 4,
+    "/building-rooms/": 3,
+    "/terms/": 4,
+    "/academic-groups/": 3,
+    "/subjects/": 5,
+    "/courses/": 5,
+    "/course-offerings/": 4,
+    "/instructors/": 3,
+    "/sections/": 4,
+    "/sections/?cursor=": 2,
+    "/courses/COMPSCI 100/sections/": 5,
+    "/instructors/{instructor}/sections/": 4,
+    "/coverage/": 3,
+}
+
+
+# The data generation is read at most once per poll, which would otherwise
+# land on whichever request comes first
+@override_settings(DATA_GENERATION_POLL_SECONDS=60 * 60)
+class ListQueryCountTests(SpireTestCase):
+    def setUp(self):
+        super().setUp()
+        get_data_generation()
+
+        self.term = create_term()
+        self.courses = 0
+
+    def _add_courses(self, count: int):
+        for _ in range(count):
+            course = create_course(number=str(100 + self.courses))
+            offering = create_offering(course, self.term)
+
+            for i, component in enumerate(["LEC", "DIS"]):
+                section = create_section(offering, f"0{i + 1}-{component}(1234{i})")
+                create_meeting(
+                    section,
+                    ["Monday", "Wednesday"],
+                    time(9 + i),
+                    time(9 + i, 50),
+                    room=f"Lederle Graduate Research Center A{self.courses}{i}",
+                    instructor="Jane Doe",
+                )
+
+            self.courses += 1
+
+        build_section_documents(Section.objects.all())
+        cache.clear()
+
+    def _assert_query_counts(self):
+        instructor = Section.objects.values_list(
+            "meeting_information__instructors", flat=True
+        ).first()
+
+        for url, count in LIST_QUERY_COUNTS.items():
+            with self.subTest(url=url, courses=self.courses):
+                with self.assertNumQueries(count):
+                    response = self.client.get(url.format(instructor=instructor))
+
+                self.assertEqual(response.status_code, 200)
+
+    def test_list_query_counts_do_not_grow_with_the_page(self):
+        self._add_courses(1)
+        self._assert_query_counts()
+
+        self._add_courses(5)
+        self._assert_query_counts()
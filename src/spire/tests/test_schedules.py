@@ -0,0 +1,158 @@
+from datetime import date, time
+from time import monotonic
+
+from django.test import SimpleTestCase
+
+from spire.models import SectionMeetingInformation
+from spire.schedules import generate_schedules, get_schedule_slots
+from spire.scraper.classes.sections.raw_section_meeting_information import (
+    RawSectionMeetingSchedule,
+)
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class GenerateSchedulesTests(SimpleTestCase):
+    def _generate(self, groups, limit=10, seconds=10):
+        return generate_schedules(groups, limit, monotonic() + seconds)
+
+    def test_one_section_of_each_group(self):
+        self.assertEqual(self._generate([[(1, 0b01)], [(2, 0b10)]]), ([[1, 2]], True))
+
+    def test_overlapping_sections_are_not_combined(self):
+        groups = [[(1, 0b01), (2, 0b10)], [(3, 0b01)]]
+        self.assertEqual(self._generate(groups), ([[2, 3]], True))
+
+    def test_sections_keep_the_order_of_the_groups(self):
+        # The smaller group is searched first
+        groups = [[(1, 0b001), (2, 0b010)], [(3, 0b100)]]
+        self.assertEqual(self._generate(groups), ([[1, 3], [2, 3]], True))
+
+    def test_no_groups(self):
+        self.assertEqual(self._generate([]), ([], True))
+
+    def test_empty_group(self):
+        self.assertEqual(self._generate([[(1, 0b01)], []]), ([], True))
+
+    def test_no_fit(self):
+        self.assertEqual(self._generate([[(1, 0b01)], [(2, 0b01)]]), ([], True))
+
+    def test_exactly_the_limit_is_complete(self):
+        groups = [[(1, 0b01), (2, 0b10)]]
+        self.assertEqual(self._generate(groups, limit=2), ([[1], [2]], True))
+
+    def test_past_the_limit_is_incomplete(self):
+        groups = [[(1, 0b001), (2, 0b010), (3, 0b100)]]
+        self.assertEqual(self._generate(groups, limit=2), ([[1], [2]], False))
+
+    def test_past_the_deadline_is_incomplete(self):
+        groups = [[(1, 0b01)], [(2, 0b10)]]
+        self.assertEqual(self._generate(groups, seconds=-1), ([], False))
+
+
+class ScheduleViewTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        term = create_term()
+        cs121 = create_offering(create_course(number="121"), term)
+        cs187 = create_offering(create_course(number="187"), term)
+        create_offering(create_course(number="220"), term)
+
+        cls.lecture = create_section(cs121, "01-LEC(10001)")
+        create_meeting(cls.lecture, ["Monday"], time(8), time(9, 10))
+
+        # Overlaps the end of the lecture, for the first half of the term
+        cls.early = create_section(cs187, "01-LEC(10002)")
+        create_meeting(
+            cls.early,
+            ["Monday"],
+            time(9),
+            time(9, 50),
+            dates=(date(2023, 9, 5), date(2023, 10, 20)),
+        )
+
+        # Overlaps the first half, but only meets in the second
+        cls.late = create_section(cs187, "02-LEC(10003)")
+        create_meeting(
+            cls.late,
+            ["Monday"],
+            time(9, 30),
+            time(10, 20),
+            dates=(date(2023, 10, 23), date(2023, 12, 12)),
+        )
+
+    def _conflicts(self, *sections) -> list[list[int]]:
+        response = self.client.get(
+            "/schedules/conflicts/",
+            {"sections": ",".join(str(section.id) for section in sections)},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        return [conflict["sections"] for conflict in response.json()["conflicts"]]
+
+    def test_conflicts(self):
+        self.assertEqual(
+            self._conflicts(self.lecture, self.early),
+            [[self.lecture.id, self.early.id]],
+        )
+
+    def test_conflicts_on_different_dates(self):
+        self.assertEqual(self._conflicts(self.early, self.late), [])
+
+    def test_generate(self):
+        response = self.client.get(
+            "/schedules/generate/",
+            {"term": "Fall 2023", "courses": "COMPSCI 121,COMPSCI 187"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        body = response.json()
+        self.assertEqual(
+            body["groups"],
+            [
+                {"course": "COMPSCI 121", "component": "LEC"},
+                {"course": "COMPSCI 187", "component": "LEC"},
+            ],
+        )
+        self.assertEqual(
+            body["schedules"],
+            [[self.lecture.id, self.late.id]],
+        )
+        self.assertTrue(body["complete"])
+
+    def test_generate_with_a_course_without_sections(self):
+        response = self.client.get(
+            "/schedules/generate/",
+            {"term": "Fall 2023", "courses": "COMPSCI 121,COMPSCI 220"},
+        )
+
+        body = response.json()
+        self.assertEqual(body["schedules"], [])
+        self.assertTrue(body["complete"])
+        self.assertEqual(body["unavailable"], ["COMPSCI 220"])
+
+
+class RawScheduleTests(SpireTestCase):
+    def test_slots_are_pushed(self):
+        offering = create_offering(create_course(), create_term())
+        section = create_section(offering, "01-LEC(10001)")
+        meeting = SectionMeetingInformation.objects.create(
+            section=section, room_raw="TBA"
+        )
+
+        raw = RawSectionMeetingSchedule("MoWe 9:00AM - 9:50AM")
+        self.assertNotIn("slots", str(raw))
+
+        schedule, _ = raw.push(meeting_information=meeting)
+        schedule.refresh_from_db()
+
+        self.assertEqual(
+            bytes(schedule.slots),
+            get_schedule_slots(["Monday", "Wednesday"], time(9), time(9, 50)),
+        )
@@ -0,0 +1,34 @@
+from spire.tests.utils import SpireTestCase, create_course
+
+
+class CourseSearchTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_course("COMPSCI", "121", "Introduction to Problem Solving")
+        create_course("COMPSCI", "187", "Programming with Data Structures")
+        create_course("HISTORY", "101", "Ancient Mediterranean Civilizations")
+
+    def _search(self, text: str) -> list[str]:
+        response = self.client.get("/search/", {"q": text})
+        self.assertEqual(response.status_code, 200)
+
+        return [course["id"] for course in response.json()["courses"]]
+
+    def test_course_id(self):
+        self.assertEqual(self._search("COMPSCI 187"), ["COMPSCI 187"])
+
+    def test_course_id_stemmed_differently(self):
+        self.assertEqual(self._search("history 101"), ["HISTORY 101"])
+
+    def test_subject_id(self):
+        self.assertEqual(self._search("compsci"), ["COMPSCI 121", "COMPSCI 187"])
+
+    def test_stemmed_title(self):
+        self.assertEqual(self._search("civilization"), ["HISTORY 101"])
+
+    def test_course_list_search(self):
+        response = self.client.get("/courses/", {"search": "HISTORY 101"})
+
+        self.assertEqual(
+            [course["id"] for course in response.json()["results"]], ["HISTORY 101"]
+        )
@@ -0,0 +1,137 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import brotli
+from django.test import override_settings
+from django.utils import timezone
+
+from spire.generation import bump_data_generation
+from spire.models import Section
+from spire.snapshots import _write_dataset, is_snapshot_stale, write_snapshots
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+@override_settings(DATA_GENERATION_POLL_SECONDS=0)
+class SnapshotTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        course = create_course()
+        cls.fall = create_term("Fall", 2023)
+        cls.spring = create_term("Spring", 2024)
+
+        cls.section = create_section(create_offering(course, cls.fall), "01-LEC(10001)")
+        create_section(create_offering(course, cls.spring), "01-LEC(10001)")
+
+    def setUp(self):
+        super().setUp()
+
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+        settings = override_settings(SNAPSHOT_ROOT=self.root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _write(self) -> tuple[dict, list[str]]:
+        # The terms whose datasets were written
+        with mock.patch(
+            "spire.snapshots._write_dataset", wraps=_write_dataset
+        ) as write:
+            manifest = write_snapshots()
+
+        written = sorted({os.path.basename(c.args[0]) for c in write.call_args_list})
+        return manifest, written
+
+    def _read(self, path: str) -> list[dict]:
+        with open(os.path.join(self.root, path), "rb") as f:
+            content = f.read()
+
+        if path.endswith(".gz"):
+            content = gzip.decompress(content)
+        else:
+            content = brotli.decompress(content)
+
+        return [json.loads(line) for line in content.decode().splitlines()]
+
+    def test_manifest(self):
+        manifest, written = self._write()
+
+        self.assertEqual(written, ["fall-2023", "spring-2024"])
+        self.assertEqual(set(manifest["terms"]), {"Fall 2023", "Spring 2024"})
+        self.assertEqual(set(manifest["markers"]), {"Fall 2023", "Spring 2024"})
+
+        with open(os.path.join(self.root, "manifest.json")) as f:
+            self.assertEqual(json.load(f), manifest)
+
+        sections = manifest["terms"]["Fall 2023"]["sections"]
+        self.assertEqual(sections["rows"], 1)
+        for file in sections["files"].values():
+            self.assertEqual(
+                [row["spire_id"] for row in self._read(file["path"])],
+                ["01-LEC(10001)"],
+            )
+
+    def test_stale_after_changes(self):
+        self.assertTrue(is_snapshot_stale())
+        self._write()
+        self.assertFalse(is_snapshot_stale())
+
+        # A bump without changes to the rows leaves every term as it was
+        bump_data_generation()
+        self.assertFalse(is_snapshot_stale())
+
+        Section.objects.filter(id=self.section.id).update(_updated_at=timezone.now())
+        bump_data_generation()
+        self.assertTrue(is_snapshot_stale())
+
+    def test_only_changed_terms_are_written(self):
+        previous, _ = self._write()
+
+        Section.objects.filter(id=self.section.id).update(_updated_at=timezone.now())
+        bump_data_generation()
+        manifest, written = self._write()
+
+        self.assertEqual(written, ["fall-2023"])
+        self.assertEqual(
+            manifest["terms"]["Spring 2024"], previous["terms"]["Spring 2024"]
+        )
+        self.assertNotEqual(
+            manifest["markers"]["Fall 2023"], previous["markers"]["Fall 2023"]
+        )
+
+        # Both terms' files are still there
+        for datasets in manifest["terms"].values():
+            for dataset in datasets.values():
+                for file in dataset["files"].values():
+                    self.assertTrue(
+                        os.path.exists(os.path.join(self.root, file["path"]))
+                    )
+
+    def test_deleted_sections_are_changes(self):
+        self._write()
+
+        Section.objects.filter(id=self.section.id).delete()
+        _, written = self._write()
+
+        self.assertEqual(written, ["fall-2023"])
+
+    def test_given_terms_are_always_written(self):
+        self._write()
+
+        with mock.patch(
+            "spire.snapshots._write_dataset", wraps=_write_dataset
+        ) as write:
+            manifest = write_snapshots([self.spring])
+
+        self.assertEqual(write.call_count, 4)
+        self.assertEqual(set(manifest["terms"]), {"Fall 2023", "Spring 2024"})
@@ -0,0 +1,156 @@
+from datetime import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from spire.documents import build_section_documents
+from spire.models import Section, SectionAvailability, SectionCombinedCapacity
+from spire.query_plans import SECTION_QUERY_PLAN
+from spire.serializers.section import SectionSerializer
+from spire.serializers.sparse import SparseFieldset
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_meeting,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class SparseFieldsetTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        course = create_course(description="Problem solving with computers.")
+        term = create_term()
+        offering = create_offering(course, term)
+
+        cls.section = create_section(offering, "01-LEC(10001)")
+        create_meeting(
+            cls.section,
+            ["Monday"],
+            time(9),
+            time(9, 50),
+            room="Lederle Graduate Research Center A301",
+            instructor="Jane Doe",
+        )
+        combined = create_section(offering, "02-LEC(10002)")
+
+        capacity = SectionCombinedCapacity.objects.create(
+            capacity=80, wait_list_capacity=20
+        )
+        SectionAvailability.objects.filter(section__in=[cls.section, combined]).update(
+            combined_capacity=capacity
+        )
+
+        build_section_documents(Section.objects.all())
+
+    def _get(self, url: str, **params) -> dict:
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+
+        return response.json()
+
+    def _course(self, **params) -> dict:
+        return self._get("/courses/COMPSCI 121/", **params)
+
+    def _section(self, **params) -> dict:
+        return self._get(f"/sections/{self.section.id}/", **params)
+
+    def test_fields(self):
+        self.assertEqual(
+            self._course(fields="id,title"),
+            {"id": "COMPSCI 121", "title": self.section.offering.course.title},
+        )
+        self.assertEqual(
+            self._course(fields="id,subject.title"),
+            {"id": "COMPSCI 121", "subject": {"title": "Compsci"}},
+        )
+
+    def test_omit(self):
+        course = self._course(omit="description,offerings,subject.url")
+
+        self.assertNotIn("description", course)
+        self.assertNotIn("offerings", course)
+        self.assertEqual(set(course["subject"]), {"id", "title"})
+
+    def test_expand_references_other_objects(self):
+        course = self._course(expand="subject")
+
+        self.assertEqual(set(course["subject"]), {"id", "url", "title"})
+        self.assertEqual(
+            [set(offering) for offering in course["offerings"]], [{"id", "url"}]
+        )
+
+    def test_expand_keeps_objects_without_references(self):
+        course = self._course(expand="subject")
+        self.assertEqual(course["details"], self._course()["details"])
+
+        section = self._section(expand="meeting_information")
+        full = self._section()
+
+        self.assertEqual(set(section["offering"]), {"url"})
+        self.assertEqual(section["meeting_information"], full["meeting_information"])
+        self.assertEqual(section["availability"], full["availability"])
+
+    def test_expand_nested(self):
+        section = self._section(expand="offering.term")
+
+        self.assertEqual(set(section["offering"]), {"url", "term", "course"})
+        self.assertEqual(
+            set(section["offering"]["term"]),
+            {"id", "url", "season", "year", "ordinal"},
+        )
+        self.assertEqual(set(section["offering"]["course"]), {"id", "url"})
+
+    def test_section_documents_match_the_serializer(self):
+        section = SECTION_QUERY_PLAN.apply(Section.objects.all()).get(
+            id=self.section.id
+        )
+
+        for params in [
+            {"fields": "spire_id,availability.capacity"},
+            {"omit": "meeting_information,availability.combined_capacity"},
+            {"expand": "offering"},
+            {"expand": "offering.course", "omit": "offering.course.title"},
+        ]:
+            with self.subTest(**params):
+                request = Request(APIRequestFactory().get("/", params))
+
+                self.assertEqual(
+                    self._section(**params),
+                    SectionSerializer(section, context={"request": request}).data,
+                )
+
+    def _count_queries(self, sparse) -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            list(SECTION_QUERY_PLAN.apply(Section.objects.all(), sparse))
+
+        return len(ctx.captured_queries)
+
+    def test_query_plan_skips_omitted_relations(self):
+        full = self._count_queries(None)
+
+        self.assertEqual(
+            self._count_queries(SparseFieldset(omit={"meeting_information"})),
+            full - 2,
+        )
+        self.assertEqual(
+            self._count_queries(
+                SparseFieldset(omit={"availability.combined_capacity"})
+            ),
+            full - 1,
+        )
+        self.assertEqual(self._count_queries(SparseFieldset(fields={"spire_id"})), 1)
+
+    def test_list_query_counts(self):
+        # Omitted relations aren't loaded, but references are
+        with self.assertNumQueries(4):
+            self._get("/courses/", omit="offerings")
+
+        cache.clear()
+        with self.assertNumQueries(5):
+            self._get("/courses/", expand="subject")
@@ -0,0 +1,50 @@
+import warnings
+from unittest import mock
+
+from django.core.cache import CacheKeyWarning
+
+from spire.stats import compute_term_stats, get_term_stats
+from spire.tests.utils import (
+    SpireTestCase,
+    create_course,
+    create_offering,
+    create_section,
+    create_term,
+)
+
+
+class TermStatsTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.term = create_term("Fall", 2023)
+        cls.empty = create_term("Spring", 2024)
+
+        offering = create_offering(create_course(), cls.term)
+        create_section(offering, "01-LEC(10001)")
+
+    def _get_computed(self, term_id: str) -> int:
+        with mock.patch(
+            "spire.stats.compute_term_stats", wraps=compute_term_stats
+        ) as compute:
+            get_term_stats(term_id)
+            get_term_stats(term_id)
+
+        return compute.call_count
+
+    def test_stats_are_cached(self):
+        self.assertEqual(self._get_computed(self.term.id), 1)
+
+    def test_cache_keys_are_valid(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CacheKeyWarning)
+            get_term_stats(self.term.id)
+
+    def test_terms_without_sections_are_cached(self):
+        self.assertIsNone(get_term_stats(self.empty.id))
+        self.assertEqual(self._get_computed(self.empty.id), 0)
+
+    def test_stats(self):
+        response = self.client.get(f"/terms/{self.term.id}/stats/")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(response.json()["summary"]["sections"], 1)
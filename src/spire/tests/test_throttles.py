@@ -0,0 +1,39 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from spire.throttles import LOCAL_PRUNE_MS, _local_gcra, _local_tats
+
+
+class LocalGcraTests(SimpleTestCase):
+    def setUp(self):
+        _local_tats.clear()
+        self.addCleanup(_local_tats.clear)
+
+        patcher = mock.patch("spire.throttles.monotonic", return_value=1000.0)
+        self.monotonic = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("spire.throttles._local_pruned_at", 0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request(self, key: str = "client") -> float:
+        # Two requests a second
+        return _local_gcra(key, 500, 1000)
+
+    def test_throttles_past_the_rate(self):
+        self.assertEqual(self._request(), 0)
+        self.assertEqual(self._request(), 0)
+        self.assertEqual(self._request(), 500)
+
+        self.monotonic.return_value += 0.5
+        self.assertEqual(self._request(), 0)
+
+    def test_past_times_are_pruned(self):
+        self._request("gone")
+
+        self.monotonic.return_value += LOCAL_PRUNE_MS / 1000
+        self._request("still")
+
+        self.assertEqual(list(_local_tats), ["still"])
@@ -0,0 +1,61 @@
+from django.db import connection
+
+from spire.models import Building, BuildingRoom, Instructor
+from spire.tests.utils import SpireTestCase
+
+
+def _has_trigram_extension() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+class TrigramSearchTests(SpireTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name in ["Jaime Dávila", "Marius Minea", "Mark Corner", "Joe Chiu"]:
+            Instructor.objects.create(name=name)
+
+        building = Building.objects.create(name="Lederle Graduate Research Center")
+        for number in ["A301", "A311", "S131"]:
+            BuildingRoom.objects.create(
+                building=building, number=number, alt=f"LGRC {number}"
+            )
+
+    def _search(self, url: str, **params) -> list[str]:
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+
+        return [
+            result.get("name", result.get("alt"))
+            for result in response.json()["results"]
+        ]
+
+    def test_substring(self):
+        self.assertEqual(
+            sorted(self._search("/instructors/", search="mar")),
+            ["Marius Minea", "Mark Corner"],
+        )
+        self.assertEqual(
+            sorted(self._search("/building-rooms/", search="a3")),
+            ["LGRC A301", "LGRC A311"],
+        )
+        self.assertEqual(len(self._search("/instructors/", search="  ")), 4)
+
+    def test_fuzzy(self):
+        if not _has_trigram_extension():
+            self.skipTest("The pg_trgm extension is not installed.")
+
+        # Misspelled, and ranked by similarity
+        self.assertEqual(
+            self._search("/instructors/", search="mark corne", fuzzy="true")[0],
+            "Mark Corner",
+        )
+        self.assertEqual(
+            self._search("/instructors/", search="marius mina", fuzzy="1"),
+            ["Marius Minea"],
+        )
+        self.assertEqual(
+            self._search("/building-rooms/", search="lgrc a30", fuzzy="true")[0],
+            "LGRC A301",
+        )
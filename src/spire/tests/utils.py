@@ -0,0 +1,151 @@
+from datetime import date, time
+from typing import Optional
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from spire.models import (
+    Building,
+    BuildingRoom,
+    Course,
+    CourseOffering,
+    Instructor,
+    Section,
+    SectionAvailability,
+    SectionDetail,
+    SectionMeetingDates,
+    SectionMeetingInformation,
+    SectionMeetingSchedule,
+    SectionRestriction,
+    Subject,
+    Term,
+)
+from spire.schedules import get_schedule_slots
+from spire.search import update_course_search_vector, update_section_search_vector
+from spire.throttles import _local_tats
+
+SEASON_ORDINALS = {"Spring": 1, "Summer": 2, "Fall": 3, "Winter": 4}
+
+
+class SpireTestCase(APITestCase):
+    # Responses are cached by data generation, which tests don't bump, and
+    # requests are throttled per process, so both are reset between tests
+    def setUp(self):
+        cache.clear()
+        _local_tats.clear()
+
+
+def create_term(season: str = "Fall", year: int = 2023) -> Term:
+    return Term.objects.create(
+        id=f"{season} {year}",
+        season=season,
+        year=year,
+        ordinal=year * 10 + SEASON_ORDINALS[season],
+        start_date=date(year, 9, 5),
+        end_date=date(year, 12, 12),
+    )
+
+
+def create_course(
+    subject_id: str = "COMPSCI",
+    number: str = "121",
+    title: str = "Introduction to Problem Solving with Computers",
+    description: Optional[str] = None,
+) -> Course:
+    subject, _ = Subject.objects.get_or_create(
+        id=subject_id, defaults={"title": subject_id.title()}
+    )
+
+    course = Course.objects.create(
+        id=f"{subject_id} {number}",
+        subject=subject,
+        number=number,
+        title=title,
+        description=description,
+        _updated_at=timezone.now(),
+    )
+    update_course_search_vector(course)
+
+    return course
+
+
+def create_offering(course: Course, term: Term) -> CourseOffering:
+    return CourseOffering.objects.create(
+        course=course,
+        subject=course.subject,
+        term=term,
+        term_ordinal=term.ordinal,
+        _updated_at=timezone.now(),
+    )
+
+
+def create_section(
+    offering: CourseOffering,
+    spire_id: str,
+    status: str = "Open",
+    available_seats: int = 10,
+) -> Section:
+    section = Section.objects.create(
+        spire_id=spire_id,
+        offering=offering,
+        term_ordinal=offering.term_ordinal,
+        _updated_at=timezone.now(),
+    )
+
+    SectionDetail.objects.create(
+        section=section,
+        status=status,
+        class_number=section.id,
+        class_components=["Lecture"],
+    )
+    SectionAvailability.objects.create(
+        section=section,
+        capacity=40,
+        enrollment_total=40 - available_seats,
+        available_seats=available_seats,
+        wait_list_capacity=10,
+        wait_list_total=0,
+    )
+    SectionRestriction.objects.create(section=section)
+    update_section_search_vector(section)
+
+    return section
+
+
+def create_meeting(
+    section: Section,
+    days: list[str],
+    start_time: time,
+    end_time: time,
+    room: Optional[str] = None,
+    instructor: Optional[str] = None,
+    dates: Optional[tuple[date, date]] = None,
+) -> SectionMeetingInformation:
+    building_room = None
+    if room is not None:
+        building_name, number = room.rsplit(" ", 1)
+        building, _ = Building.objects.get_or_create(name=building_name)
+        building_room, _ = BuildingRoom.objects.get_or_create(
+            alt=room, defaults={"building": building, "number": number}
+        )
+
+    meeting = SectionMeetingInformation.objects.create(
+        section=section, room=building_room, room_raw=room or "TBA"
+    )
+    if instructor is not None:
+        meeting.instructors.add(Instructor.objects.get_or_create(name=instructor)[0])
+
+    SectionMeetingSchedule.objects.create(
+        meeting_information=meeting,
+        days=days,
+        start_time=start_time,
+        end_time=end_time,
+        slots=get_schedule_slots(days, start_time, end_time),
+    )
+    if dates is not None:
+        SectionMeetingDates.objects.create(
+            meeting_information=meeting, start=dates[0], end=dates[1]
+        )
+
+    return meeting
@@ -1,11 +1,124 @@
-from rest_framework.throttling import SimpleRateThrottle
+import logging
+from functools import cache
+from threading import Lock
+from time import monotonic
+from typing import Optional
 
+from django.conf import settings
+from redis import Redis, RedisError
+from redis.commands.core import Script
+from rest_framework.throttling import BaseThrottle
 
-class BlindRateThrottle(SimpleRateThrottle):
+log = logging.getLogger(__name__)
+
+THROTTLE_KEY_PREFIX = "spireapi.throttle"
+
+# The generic cell rate algorithm keeps one timestamp per client, the
+# theoretical arrival time of its next request, and admits a request if that
+# is no more than a period ahead. Reading the clock, checking and updating
+# happen in one script, so workers can't race each other, in one round trip.
+GCRA_SCRIPT = """
+local now = redis.call("TIME")
+now = tonumber(now[1]) * 1000 + tonumber(now[2]) / 1000
+
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+
+local next_tat = tat + interval
+if next_tat - now > period then
+    return {0, string.format("%.3f", next_tat - period - now)}
+end
+
+redis.call("SET", KEYS[1], string.format("%.3f", next_tat), "PX", math.ceil(next_tat - now))
+return {1, "0"}
+"""
+
+DURATIONS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    num, period = rate.split("/")
+    return int(num), DURATIONS[period[0]]
+
+
+@cache
+def _gcra_script() -> Script:
+    return Redis.from_url(settings.THROTTLE_REDIS_URL).register_script(GCRA_SCRIPT)
+
+
+# Without Redis, as in development, each process limits on its own. A time
+# that has passed counts the same as none, so those are swept out now and then,
+# much like Redis expires its keys.
+LOCAL_PRUNE_MS = 60 * 1000
+
+_local_tats: dict[str, float] = {}
+_local_lock = Lock()
+_local_pruned_at = 0.0
+
+
+def _prune_local_tats(now: float) -> None:
+    global _local_pruned_at
+
+    if now - _local_pruned_at < LOCAL_PRUNE_MS:
+        return
+
+    for key in [key for key, tat in _local_tats.items() if tat < now]:
+        del _local_tats[key]
+
+    _local_pruned_at = now
+
+
+def _local_gcra(key: str, interval: float, period: float) -> float:
+    now = monotonic() * 1000
+
+    with _local_lock:
+        _prune_local_tats(now)
+
+        next_tat = max(_local_tats.get(key, now), now) + interval
+        if next_tat - now > period:
+            return next_tat - period - now
+
+        _local_tats[key] = next_tat
+
+    return 0
+
+
+class BlindRateThrottle(BaseThrottle):
     rate = "60/min"
 
-    def get_cache_key(self, request, view):
-        return self.cache_format % {
-            "scope": self.scope,
-            "ident": self.get_ident(request),
-        }
+    def __init__(self) -> None:
+        self.num_requests, self.duration = parse_rate(self.rate)
+        self.wait_seconds: Optional[float] = None
+
+    def allow_request(self, request, view) -> bool:
+        key = f"{THROTTLE_KEY_PREFIX}.{self.get_ident(request)}"
+
+        # In milliseconds, as that's what Redis expires keys by
+        period = self.duration * 1000
+        interval = period / self.num_requests
+
+        if settings.THROTTLE_REDIS_URL is None:
+            wait = _local_gcra(key, interval, period)
+        else:
+            try:
+                allowed, wait = _gcra_script()(keys=[key], args=[interval, period])
+            except RedisError:
+                # Letting a request through is better than failing it
+                log.exception("Failed to throttle %s.", key)
+                return True
+
+            wait = 0 if allowed else float(wait)
+
+        if wait > 0:
+            self.wait_seconds = wait / 1000
+            return False
+
+        return True
+
+    def wait(self) -> Optional[float]:
+        return self.wait_seconds
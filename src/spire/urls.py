@@ -4,13 +4,21 @@ from rest_framework.routers import DefaultRouter
 
 from spire.views import (
     AcademicGroupViewSet,
+    AvailabilityEventsView,
+    AvailabilityView,
     BuildingRoomViewSet,
     BuildingViewSet,
+    ChangesView,
     CourseOfferingViewSet,
     CourseViewSet,
     CoverageViewSet,
     CurrentTermsView,
     InstructorViewSet,
+    ScheduleCalendarView,
+    ScheduleConflictsView,
+    ScheduleGenerateView,
+    SearchView,
+    SectionCalendarView,
     SectionViewSet,
     SubjectViewSet,
     TermViewSet,
@@ -40,4 +48,17 @@ router.register("coverage", CoverageViewSet, basename="coverage")
 urlpatterns = [
     path("", include(router.urls)),
     path("current-terms/", CurrentTermsView.as_view()),
+    path("search/", SearchView.as_view()),
+    path("availability/", AvailabilityView.as_view()),
+    path("availability/events/", AvailabilityEventsView.as_view()),
+    path("changes/", ChangesView.as_view()),
+    path("schedules/conflicts/", ScheduleConflictsView.as_view()),
+    path("schedules/generate/", ScheduleGenerateView.as_view()),
+    path("schedules/calendar.ics", ScheduleCalendarView.as_view()),
+    path(
+        "terms/<str:pk>/export.ndjson",
+        TermViewSet.as_view({"get": "export"}),
+        name="term-export",
+    ),
+    path("sections/<str:pk>/calendar.ics", SectionCalendarView.as_view()),
 ]
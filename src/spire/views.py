@@ -1,13 +1,48 @@
+import json
+import re
+from datetime import timedelta
+from time import monotonic
+from typing import Optional
+
+from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.db.models import F, OuterRef, Subquery
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime, parse_time
+from django.views import View
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import SearchFilter
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from spire.availability import (
+    AVAILABILITY_FIELD_NAMES,
+    AvailabilityStream,
+    get_availability_rows,
+)
+from spire.calendars import get_section_events, render_calendar
+from spire.changes import decode_token, get_changes
+from spire.conditional import ConditionalMixin, conditional_response
+from spire.documents import get_section_documents, iter_section_documents
+from spire.filters import (
+    FullTextSearchFilter,
+    SectionFilterSet,
+    TrigramSearchFilter,
+)
+from spire.history import (
+    HISTORY_DEFAULT_POINTS,
+    HISTORY_FIELDS,
+    HISTORY_MAX_POINTS,
+    downsample,
+)
 from spire.models import (
     AcademicGroup,
     Building,
@@ -16,60 +51,181 @@ from spire.models import (
     CourseOffering,
     Instructor,
     Section,
+    SectionAvailability,
     SectionCoverage,
     SectionMeetingInformation,
     Subject,
     Term,
 )
+from spire.multiget import MultiGetMixin, get_requested_ids
+from spire.occupancy import get_term_occupancy
+from spire.pagination import EstimatedPageNumberPagination, HybridPagination
+from spire.query_plans import (
+    ACADEMIC_GROUP_QUERY_PLAN,
+    BUILDING_QUERY_PLAN,
+    BUILDING_ROOM_QUERY_PLAN,
+    COURSE_OFFERING_QUERY_PLAN,
+    COURSE_QUERY_PLAN,
+    SECTION_COVERAGE_QUERY_PLAN,
+    SECTION_QUERY_PLAN,
+    SUBJECT_QUERY_PLAN,
+    TERM_QUERY_PLAN,
+    QueryPlanMixin,
+)
+from spire.schedules import (
+    DAYS,
+    find_conflicts,
+    generate_schedules,
+    get_schedule_groups,
+    get_schedule_slots,
+    get_section_meetings,
+    get_slot_ranges,
+)
+from spire.search import search
 from spire.serializers.academic_group import AcademicGroupSerializer
-from spire.serializers.building import BuildingRoomSerializer, BuildingSerializer
+from spire.serializers.building import (
+    BRFSNoBuilding,
+    BuildingRoomSerializer,
+    BuildingSerializer,
+)
 from spire.serializers.course import (
     CourseInstructorsSerializer,
     CourseOfferingSerializer,
     CourseSerializer,
 )
 from spire.serializers.instructor import InstructorSerializer
+from spire.serializers.search import (
+    CourseSearchResultSerializer,
+    SectionSearchResultSerializer,
+)
 from spire.serializers.section import SectionCoverageSerializer, SectionSerializer
+from spire.serializers.sparse import SparseFieldset
 from spire.serializers.subject import SubjectSerializer
 from spire.serializers.term import TermSerializer
+from spire.stats import get_term_stats
+
 
+def _get_occupancy_term(request) -> str:
+    term = request.GET.get("term")
+    if term is None or not Term.objects.filter(id=term).exists():
+        raise ValidationError({"term": "A valid term is required."})
 
-class BuildingViewSet(ReadOnlyModelViewSet):
+    return term
+
+
+class BuildingViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = Building.objects.all()
     serializer_class = BuildingSerializer
-    filter_backends = [SearchFilter]
-    search_fields = ["name"]
+    query_plan = BUILDING_QUERY_PLAN
+    filter_backends = [TrigramSearchFilter]
+    trigram_search_field = "name"
+
+    # Rooms with no meetings during the given days and times of a term
+    @action(detail=True, url_path="free-rooms")
+    def free_rooms(self, request, pk=None):
+        building = self.get_object()
+        term = _get_occupancy_term(request)
+
+        days = [d.strip() for d in request.GET.get("days", "").split(",") if d.strip()]
+        if not days or not set(days) <= set(DAYS):
+            raise ValidationError({"days": "A list of days is required."})
+
+        start_time = parse_time(request.GET.get("start_time", ""))
+        end_time = parse_time(request.GET.get("end_time", ""))
+        if start_time is None or end_time is None or start_time >= end_time:
+            raise ValidationError(
+                {"start_time": "A start time before the end time is required."}
+            )
+
+        slots = int.from_bytes(get_schedule_slots(days, start_time, end_time), "little")
+        occupancy = get_term_occupancy(term)
+
+        rooms = [
+            room
+            for room in building.rooms.all()
+            if not occupancy.get(room.id, 0) & slots
+        ]
+
+        return Response(
+            BRFSNoBuilding(rooms, many=True, context={"request": request}).data
+        )
 
 
-class BuildingRoomViewSet(ReadOnlyModelViewSet):
+class BuildingRoomViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = BuildingRoom.objects.all()
     serializer_class = BuildingRoomSerializer
+    query_plan = BUILDING_ROOM_QUERY_PLAN
+    filter_backends = [TrigramSearchFilter]
+    trigram_search_field = "alt"
+
+    @action(detail=True)
+    def occupancy(self, request, pk=None):
+        room = self.get_object()
+        term = _get_occupancy_term(request)
+
+        return Response(
+            {
+                "term": term,
+                "occupied": get_slot_ranges(get_term_occupancy(term).get(room.id, 0)),
+            }
+        )
 
 
-class TermViewSet(ReadOnlyModelViewSet):
+class TermViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = Term.objects.all()
     serializer_class = TermSerializer
+    query_plan = TERM_QUERY_PLAN
+
+    # Routed in urls.py, as the export is addressed like a file, without a
+    # trailing slash.
+    def export(self, request, pk=None):
+        term = self.get_object()
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+        documents = iter_section_documents(
+            Section.objects.filter(offering__term=term), request
+        )
+
+        return StreamingHttpResponse(
+            (encoder.encode(document) + "\n" for document in documents),
+            content_type="application/x-ndjson",
+        )
+
+    @action(detail=True)
+    def stats(self, request, pk=None):
+        term = self.get_object()
+        stats = get_term_stats(term.id)
+
+        if stats is None:
+            raise Http404
 
+        return Response(stats)
 
-class AcademicGroupViewSet(ReadOnlyModelViewSet):
+
+class AcademicGroupViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = AcademicGroup.objects.all()
     serializer_class = AcademicGroupSerializer
+    query_plan = ACADEMIC_GROUP_QUERY_PLAN
     filter_backends = [SearchFilter]
     search_fields = ["title"]
 
 
-class SubjectViewSet(ReadOnlyModelViewSet):
+class SubjectViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = Subject.objects.all()
     serializer_class = SubjectSerializer
+    query_plan = SUBJECT_QUERY_PLAN
     filter_backends = [SearchFilter]
     search_fields = ["id", "title"]
 
 
-class CourseViewSet(ReadOnlyModelViewSet):
+class CourseViewSet(
+    MultiGetMixin, ConditionalMixin, QueryPlanMixin, ReadOnlyModelViewSet
+):
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
-    filter_backends = [SearchFilter]
-    search_fields = ["id", "title"]
+    query_plan = COURSE_QUERY_PLAN
+    pagination_class = HybridPagination
+    filter_backends = [FullTextSearchFilter]
 
     @action(
         detail=True,
@@ -77,16 +233,18 @@ class CourseViewSet(ReadOnlyModelViewSet):
     )
     def sections(self, request, pk=None):
         course = self.get_object()
-        section_list = Section.objects.filter(offering__course__id=course.id)
+        section_list = Section.objects.filter(offering__course__id=course.id).only("id")
         page = self.paginate_queryset(section_list)
         assert page
-        serializer = self.get_serializer(page, many=True)
-        return self.get_paginated_response(serializer.data)
+        return self.get_paginated_response(
+            get_section_documents([s.id for s in page], request)
+        )
 
     # TODO Paginate?
     @action(
         detail=True,
         serializer_class=CourseInstructorsSerializer,
+        pagination_class=EstimatedPageNumberPagination,
     )
     def instructors(self, request, pk=None):
         course = self.get_object()
@@ -103,7 +261,7 @@ class CourseViewSet(ReadOnlyModelViewSet):
                 ),
             )
             .values("section__offering_id")
-            .order_by("section__offering")
+            .order_by("section__offering_id")
             .annotate(
                 offering=F("section__offering_id"),
                 instructors=ArrayAgg("instructor", distinct=True),
@@ -117,16 +275,18 @@ class CourseViewSet(ReadOnlyModelViewSet):
         return self.get_paginated_response(serializer.data)
 
 
-class CourseOfferingViewSet(ReadOnlyModelViewSet):
+class CourseOfferingViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = CourseOffering.objects.all()
     serializer_class = CourseOfferingSerializer
+    query_plan = COURSE_OFFERING_QUERY_PLAN
+    pagination_class = HybridPagination
 
 
 class InstructorViewSet(ReadOnlyModelViewSet):
     queryset = Instructor.objects.all()
     serializer_class = InstructorSerializer
-    filter_backends = [SearchFilter]
-    search_fields = ["name"]
+    filter_backends = [TrigramSearchFilter]
+    trigram_search_field = "name"
 
     @action(
         detail=True,
@@ -136,25 +296,110 @@ class InstructorViewSet(ReadOnlyModelViewSet):
         instructor = self.get_object()
         section_list = Section.objects.filter(
             meeting_information__instructors__id=instructor.id
-        )
+        ).only("id")
 
         page = self.paginate_queryset(section_list)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(
+                get_section_documents([s.id for s in page], request)
+            )
 
-        serializer = self.get_serializer(section_list, many=True)
-        return Response(serializer.data)
+        return Response(get_section_documents([s.id for s in section_list], request))
 
 
-class SectionViewSet(ReadOnlyModelViewSet):
+class SectionViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = Section.objects.all()
     serializer_class = SectionSerializer
+    query_plan = SECTION_QUERY_PLAN
+    pagination_class = HybridPagination
+    filter_backends = [FullTextSearchFilter, DjangoFilterBackend]
+    filterset_class = SectionFilterSet
+
+    # Sections are served from their pre-rendered documents, falling back to the
+    # serializer for any section that does not have one yet.
+
+    def list(self, request, *args, **kwargs):
+        ids = get_requested_ids(request, int)
+        if ids is not None:
+            found = Section.objects.only("id", "_updated_at").in_bulk(ids)
+            sections = [found[id] for id in ids if id in found]
+
+            return conditional_response(
+                request,
+                sections,
+                lambda: Response(
+                    get_section_documents([s.id for s in sections], request)
+                ),
+            )
+
+        queryset = self.filter_queryset(Section.objects.only("id", "_updated_at"))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return conditional_response(
+                request,
+                page,
+                lambda: self.get_paginated_response(
+                    get_section_documents([s.id for s in page], request)
+                ),
+            )
+
+        queryset = list(queryset)
+        return conditional_response(
+            request,
+            queryset,
+            lambda: Response(get_section_documents([s.id for s in queryset], request)),
+        )
+
+    @action(detail=True, url_path="availability-history")
+    def availability_history(self, request, pk=None):
+        try:
+            points = int(request.query_params.get("points", HISTORY_DEFAULT_POINTS))
+        except ValueError:
+            raise ValidationError({"points": "A number of points is required."})
+
+        if not 2 <= points <= HISTORY_MAX_POINTS:
+            raise ValidationError(
+                {
+                    "points": f"Between 2 and {HISTORY_MAX_POINTS} points may be requested."
+                }
+            )
+
+        try:
+            section = Section.objects.only("id").get(id=pk)
+        except (ValueError, Section.DoesNotExist):
+            raise Http404
+
+        rows = list(
+            section.availability_history.order_by("recorded_at").values_list(
+                "recorded_at", *HISTORY_FIELDS
+            )
+        )
+
+        return Response(
+            {
+                "fields": ["recorded_at", *HISTORY_FIELDS],
+                "rows": downsample(rows, points),
+            }
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            section = Section.objects.only("id", "_updated_at").get(id=kwargs["pk"])
+        except (ValueError, Section.DoesNotExist):
+            raise Http404
+
+        return conditional_response(
+            request,
+            [section],
+            lambda: Response(get_section_documents([section.id], request)[0]),
+        )
 
 
-class CoverageViewSet(ReadOnlyModelViewSet):
+class CoverageViewSet(QueryPlanMixin, ReadOnlyModelViewSet):
     queryset = SectionCoverage.objects.all()
     serializer_class = SectionCoverageSerializer
+    query_plan = SECTION_COVERAGE_QUERY_PLAN
 
 
 class CurrentTermsView(GenericAPIView):
@@ -162,8 +407,286 @@ class CurrentTermsView(GenericAPIView):
     serializer_class = TermSerializer
 
     def get(self, request):
-        queryset = self.get_queryset().filter(
-            start_date__lte=timezone.now(), end_date__gte=timezone.now()
-        )
+        queryset = TERM_QUERY_PLAN.apply(
+            self.get_queryset(), SparseFieldset.from_request(request)
+        ).filter(start_date__lte=timezone.now(), end_date__gte=timezone.now())
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+
+class SearchView(APIView):
+    def get(self, request):
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "A search query is required."})
+
+        limit = api_settings.PAGE_SIZE
+        context = {"request": request}
+
+        courses = search(Course.objects.only("id", "title"), text)[:limit]
+        sections = search(
+            Section.objects.select_related("offering__course", "offering__term").defer(
+                "description", "overview"
+            ),
+            text,
+        )[:limit]
+
+        return Response(
+            {
+                "courses": CourseSearchResultSerializer(
+                    courses, many=True, context=context
+                ).data,
+                "sections": SectionSearchResultSerializer(
+                    sections, many=True, context=context
+                ).data,
+            }
+        )
+
+
+class ChangesView(APIView):
+    # Lists what changed after ?since=, up to shortly before the first request,
+    # so paging through with the continuation token sees a fixed window that
+    # scrapes still in progress can't write into. Mirrors pass the returned
+    # until as their next since.
+    def get(self, request):
+        token = request.query_params.get("token")
+
+        if token is not None:
+            window = decode_token(token)
+            if window is None:
+                raise ValidationError({"token": "Invalid continuation token."})
+        else:
+            since = parse_datetime(request.query_params.get("since", ""))
+            if since is None:
+                raise ValidationError({"since": "An ISO 8601 timestamp is required."})
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+            now = timezone.now()
+            if since < now - timedelta(days=settings.CHANGE_EVENT_RETENTION_DAYS):
+                raise ValidationError(
+                    {
+                        "since": f"Changes are only kept for {settings.CHANGE_EVENT_RETENTION_DAYS} days, start over from a full listing."
+                    }
+                )
+
+            until = max(now - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS), since)
+            window = (since, until, 0, None)
+
+        since, until, phase, after = window
+        results, next_token = get_changes(request, since, until, phase, after)
+
+        return Response(
+            {
+                "since": since,
+                "until": until,
+                "next": (
+                    replace_query_param(
+                        remove_query_param(request.build_absolute_uri(), "since"),
+                        "token",
+                        next_token,
+                    )
+                    if next_token
+                    else None
+                ),
+                "results": results,
+            }
+        )
+
+
+class AvailabilityView(APIView):
+    # Rows are arrays in the order of the listed fields, which keeps the payload
+    # small enough to be polled often.
+    def get(self, request):
+        term, section_ids = _get_availability_filters(request)
+
+        queryset = SectionAvailability.objects.order_by("section_id")
+        if term is not None:
+            queryset = queryset.filter(section__offering__term_id=term)
+        if section_ids is not None:
+            queryset = queryset.filter(section_id__in=section_ids)
+
+        return Response(
+            {
+                "fields": AVAILABILITY_FIELD_NAMES,
+                "rows": get_availability_rows(queryset),
+            }
+        )
+
+
+def _get_availability_filters(request) -> tuple[Optional[str], Optional[list[int]]]:
+    term = request.GET.get("term")
+    section_ids = get_requested_ids(request, int, "sections")
+
+    if term is None and section_ids is None:
+        raise ValidationError({"term": "A term or a list of sections is required."})
+
+    return term, section_ids
+
+
+class ScheduleConflictsView(APIView):
+    def get(self, request):
+        section_ids = get_requested_ids(
+            request, int, "sections", settings.SCHEDULE_MAX_SECTIONS
+        )
+        if section_ids is None:
+            raise ValidationError({"sections": "A list of sections is required."})
+
+        sections = get_section_meetings(section_ids)
+
+        return Response(
+            {
+                "conflicts": [
+                    {"sections": [a, b], "overlap": get_slot_ranges(slots)}
+                    for a, b, slots in find_conflicts(section_ids, sections)
+                ],
+                "unscheduled": [id for id in section_ids if id not in sections],
+            }
+        )
+
+
+def _calendar_response(events, name: str) -> HttpResponse:
+    return HttpResponse(
+        render_calendar(events, name), content_type="text/calendar; charset=utf-8"
+    )
+
+
+# Calendars are plain views, as calendar clients may only accept text/calendar,
+# which content negotiation would turn away.
+class SectionCalendarView(View):
+    def get(self, request, pk):
+        try:
+            section = Section.objects.select_related("offering").get(id=pk)
+        except (ValueError, Section.DoesNotExist):
+            raise Http404
+
+        return _calendar_response(
+            get_section_events([section.id]).values(),
+            f"{section.offering.course_id} {section.spire_id}",
+        )
+
+
+class ScheduleCalendarView(View):
+    def get(self, request):
+        try:
+            section_ids = get_requested_ids(request, int, "sections")
+        except ValidationError as e:
+            return JsonResponse(e.detail, status=400)
+
+        if section_ids is None:
+            return JsonResponse(
+                {"sections": "A list of sections is required."}, status=400
+            )
+
+        events = get_section_events(section_ids)
+        return _calendar_response(
+            (events[id] for id in section_ids if id in events), "Schedule"
+        )
+
+
+class ScheduleGenerateView(APIView):
+    # Schedules are rows of section ids, one for each of the listed groups
+    default_limit = 20
+
+    def get(self, request):
+        deadline = monotonic() + settings.SCHEDULE_GENERATE_SECONDS
+
+        term = request.GET.get("term")
+        if term is None:
+            raise ValidationError({"term": "A term is required."})
+
+        course_ids = get_requested_ids(
+            request, str, "courses", settings.SCHEDULE_GENERATE_MAX_COURSES
+        )
+        if course_ids is None:
+            raise ValidationError({"courses": "A list of courses is required."})
+
+        try:
+            limit = int(request.GET.get("limit", self.default_limit))
+        except ValueError:
+            raise ValidationError({"limit": "A number of schedules is required."})
+
+        if not 1 <= limit <= settings.SCHEDULE_GENERATE_MAX_RESULTS:
+            raise ValidationError(
+                {
+                    "limit": f"Between 1 and {settings.SCHEDULE_GENERATE_MAX_RESULTS} schedules may be requested."
+                }
+            )
+
+        groups = get_schedule_groups(
+            term, course_ids, request.GET.get("open", "").lower() in ("1", "true")
+        )
+        unavailable = sorted(
+            set(course_ids) - {course for course, _, _ in groups},
+            key=course_ids.index,
+        )
+
+        # No schedule can take every course if one of them has no sections
+        schedules, complete = (
+            generate_schedules([sections for _, _, sections in groups], limit, deadline)
+            if not unavailable
+            else ([], True)
+        )
+
+        return Response(
+            {
+                "groups": [
+                    {"course": course, "component": component}
+                    for course, component, _ in groups
+                ],
+                "schedules": schedules,
+                "complete": complete,
+                "unavailable": unavailable,
+            }
+        )
+
+
+class AvailabilityEventsView(View):
+    # Server-sent events for every availability change the scraper commits. It
+    # is meant to be run under an ASGI worker, where an open stream doesn't hold
+    # up a thread. Clients resume from the Last-Event-ID header, or the
+    # last_event_id parameter, since EventSource can't set headers on its own.
+    heartbeat_seconds = 15
+
+    async def get(self, request):
+        if settings.AVAILABILITY_STREAM_URL is None:
+            return JsonResponse(
+                {"detail": "Availability events are not enabled."}, status=503
+            )
+
+        try:
+            term, section_ids = _get_availability_filters(request)
+        except ValidationError as e:
+            return JsonResponse(e.detail, status=400)
+
+        last_id = request.headers.get("Last-Event-ID") or request.GET.get(
+            "last_event_id"
+        )
+        if last_id is not None and not re.fullmatch(r"\d+-\d+", last_id):
+            return JsonResponse({"last_event_id": "Invalid event id."}, status=400)
+
+        stream = AvailabilityStream()
+        # Without a last id, only events published from now on are sent
+        stream.last_id = last_id or await stream.latest_id()
+        section_ids = set(section_ids or [])
+
+        async def events():
+            try:
+                while True:
+                    batch = await stream.read(self.heartbeat_seconds)
+                    if not batch:
+                        yield ": heartbeat\n\n"
+
+                    for id, event in batch:
+                        if (term is None or event["term"] == term) and (
+                            not section_ids or event["section"] in section_ids
+                        ):
+                            yield f"id: {id}\nevent: availability\ndata: {json.dumps(event)}\n\n"
+            finally:
+                await stream.close()
+
+        response = StreamingHttpResponse(events(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+
+        return response